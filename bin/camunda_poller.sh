@@ -0,0 +1,13 @@
+#!/bin/bash
+
+set -e
+
+WORKER_ID=${1:-${CAMUNDA_POLLER_WORKER_ID:-bptl-$(hostname)}}
+TIMEOUT=${CAMUNDA_POLLER_TIMEOUT:-30}
+TOPICS=${CAMUNDA_POLLER_TOPICS:+--topics $CAMUNDA_POLLER_TOPICS}
+
+echo "Starting Camunda poller $WORKER_ID"
+exec python src/manage.py run_poller \
+    --worker-id $WORKER_ID \
+    --timeout $TIMEOUT \
+    $TOPICS
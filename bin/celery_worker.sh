@@ -8,6 +8,16 @@ CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-1}
 QUEUE=${1:-${CELERY_WORKER_QUEUE:=celery}}
 WORKER_NAME=${2:-${CELERY_WORKER_NAME:="${QUEUE}"@%n}}
 
+# the default queue also consumes the priority queues, highest priority first
+if [ "$QUEUE" = "celery" ] && [ -n "$CAMUNDA_PRIORITY_QUEUES" ]; then
+    QUEUE=$( (echo "$CAMUNDA_PRIORITY_QUEUES" | tr ',' '\n'; echo "0:celery") \
+        | sort -s -t: -k1,1 -rn \
+        | cut -d: -f2 \
+        | tr -d ' ' \
+        | awk 'NF && !seen[$0]++' \
+        | paste -sd, -)
+fi
+
 echo "Starting celery worker $WORKER_NAME with queue $QUEUE"
 exec celery --workdir src \
     --app bptl \
@@ -2,7 +2,7 @@ from django.contrib import admin
 
 from polymorphic.admin import PolymorphicChildModelAdmin
 
-from .models import ExternalTask
+from .models import ExternalTask, PollerReplica
 
 
 @admin.register(ExternalTask)
@@ -15,3 +15,9 @@ class ExternalTaskAdmin(PolymorphicChildModelAdmin):
         return obj.expired
 
     is_expired.boolean = True
+
+
+@admin.register(PollerReplica)
+class PollerReplicaAdmin(admin.ModelAdmin):
+    list_display = ("worker_id", "topics", "last_seen")
+    readonly_fields = ("last_seen",)
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class CamundaAppConfig(AppConfig):
+    name = "bptl.camunda"
+
+    def ready(self):
+        from . import checks  # noqa
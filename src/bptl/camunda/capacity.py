@@ -0,0 +1,209 @@
+"""
+Derive the number of external tasks to fetch from the available execution capacity.
+
+A fixed ``MAX_TASKS`` either fetches too little per round trip when the workers are
+idle, or locks tasks that sit in the queue until their lock expires during bursts.
+With ``ADAPTIVE_MAX_TASKS`` enabled, ``maxTasks`` is derived from the depth of the
+execution queues, the free celery worker slots and the recent execution time per topic.
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from kombu.exceptions import ChannelError
+
+from ..celery import app
+from .routing import get_execution_queues
+from .utils import LOCK_DURATION
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_TIME_KEY = "camunda:execution-time:{topic}"
+# the topics with an execution time, by the timestamp they last ran at
+EXECUTION_TIME_TOPICS_KEY = "camunda:execution-time-seen"
+EXECUTION_TIME_TIMEOUT = 60 * 60  # forget topics that did not run in the last hour
+# the timestamp of a topic is refreshed at most once per interval, to limit the writes
+EXECUTION_TIME_TOPICS_REFRESH = 60
+# weight of the latest measurement in the moving average
+EXECUTION_TIME_SMOOTHING = 0.2
+
+WORKER_SLOTS_KEY = "camunda:worker-slots"
+WORKER_SLOTS_TIMEOUT = 15  # broadcasting to the workers is relatively expensive
+INSPECT_TIMEOUT = 1.0
+
+
+def get_cache():
+    # the execution times are recorded by the workers and read by the poller
+    return caches[settings.CAMUNDA_CAPACITY_CACHE_ALIAS]
+
+
+@dataclass
+class Capacity:
+    queue_depth: int
+    total_slots: int
+    busy_slots: int
+    execution_times: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def free_slots(self) -> int:
+        return max(self.total_slots - self.busy_slots - self.queue_depth, 0)
+
+    @property
+    def execution_time(self) -> float:
+        """
+        Expected execution time of a fetched task, in seconds.
+
+        The topic mix of the next fetch is unknown, so the mean of the recent
+        execution time per topic is used.
+        """
+        if not self.execution_times:
+            return 0.0
+        return sum(self.execution_times.values()) / len(self.execution_times)
+
+    @property
+    def max_tasks(self) -> int:
+        """
+        The number of tasks that can be started before their lock expires.
+
+        Without execution times this falls back to the free worker slots.
+        """
+        if not self.total_slots:
+            # no (responding) workers - keep fetching a minimal amount so tasks are
+            # picked up as soon as the workers are back
+            return 1
+
+        if not self.execution_time:
+            max_tasks = self.free_slots
+        else:
+            startable = self.total_slots * LOCK_DURATION / self.execution_time
+            max_tasks = int(startable) - self.busy_slots - self.queue_depth
+
+        return min(max(max_tasks, 1), settings.ADAPTIVE_MAX_TASKS_LIMIT)
+
+    def as_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "free_slots": self.free_slots,
+            "execution_time": self.execution_time,
+            "max_tasks": self.max_tasks,
+        }
+
+
+def get_queue_depth(queue: str = "") -> int:
+    """
+    Return the number of messages waiting in the (default) execution queue.
+    """
+    queue = queue or app.conf.task_default_queue
+    with app.connection_for_read() as connection:
+        try:
+            declared = connection.default_channel.queue_declare(
+                queue=queue, passive=True
+            )
+        except ChannelError:  # the queue does not exist (yet) - nothing waiting
+            return 0
+    return declared.message_count
+
+
+def get_worker_slots(queues: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Return the total and busy process slots of the workers consuming ``queues``.
+    """
+    queues = queues or [app.conf.task_default_queue]
+    cache = get_cache()
+    cache_key = f"{WORKER_SLOTS_KEY}:{','.join(queues)}"
+    slots = cache.get(cache_key)
+    if slots is not None:
+        return slots
+
+    inspect = app.control.inspect(timeout=INSPECT_TIMEOUT)
+    active_queues = inspect.active_queues() or {}
+    workers = [
+        worker
+        for worker, worker_queues in active_queues.items()
+        if any(declared["name"] in queues for declared in worker_queues)
+    ]
+
+    slots = {"total": 0, "busy": 0}
+    if workers:
+        inspect = app.control.inspect(destination=workers, timeout=INSPECT_TIMEOUT)
+        stats = inspect.stats() or {}
+        active = inspect.active() or {}
+        slots["total"] = sum(
+            worker_stats["pool"].get("max-concurrency", 0)
+            for worker_stats in stats.values()
+        )
+        slots["busy"] = sum(len(tasks) for tasks in active.values())
+
+    cache.set(cache_key, slots, timeout=WORKER_SLOTS_TIMEOUT)
+    return slots
+
+
+def record_execution_time(topic_name: str, duration: float) -> None:
+    """
+    Update the moving average of the execution time of a topic, in seconds.
+
+    The workers update the values without locking. Concurrent measurements of a topic
+    may overwrite each other, which the moving average absorbs, and a topic that is
+    lost from the topics is added again by its next measurement.
+    """
+    cache = get_cache()
+    key = EXECUTION_TIME_KEY.format(topic=topic_name)
+    average = cache.get(key)
+    if average is not None:
+        duration = (
+            EXECUTION_TIME_SMOOTHING * duration
+            + (1 - EXECUTION_TIME_SMOOTHING) * average
+        )
+    cache.set(key, duration, timeout=EXECUTION_TIME_TIMEOUT)
+
+    now = time.time()
+    topics = cache.get(EXECUTION_TIME_TOPICS_KEY) or {}
+    if now - topics.get(topic_name, 0) < EXECUTION_TIME_TOPICS_REFRESH:
+        return
+    topics = {
+        topic: seen
+        for topic, seen in topics.items()
+        if now - seen < EXECUTION_TIME_TIMEOUT
+    }
+    topics[topic_name] = now
+    cache.set(EXECUTION_TIME_TOPICS_KEY, topics, timeout=EXECUTION_TIME_TIMEOUT)
+
+
+def get_execution_times() -> Dict[str, float]:
+    cache = get_cache()
+    topics = cache.get(EXECUTION_TIME_TOPICS_KEY) or {}
+    keys = {EXECUTION_TIME_KEY.format(topic=topic): topic for topic in topics}
+    return {keys[key]: average for key, average in cache.get_many(keys).items()}
+
+
+def get_capacity() -> Capacity:
+    queues = get_execution_queues()
+    slots = get_worker_slots(queues)
+    return Capacity(
+        queue_depth=sum(get_queue_depth(queue) for queue in queues),
+        total_slots=slots["total"],
+        busy_slots=slots["busy"],
+        execution_times=get_execution_times(),
+    )
+
+
+def get_max_tasks() -> int:
+    """
+    Return the ``maxTasks`` to use for the next fetch-and-lock.
+    """
+    if not settings.ADAPTIVE_MAX_TASKS:
+        return settings.MAX_TASKS
+
+    try:
+        capacity = get_capacity()
+    except Exception:
+        logger.exception("Could not determine the capacity, using MAX_TASKS")
+        return settings.MAX_TASKS
+
+    logger.info("Execution capacity: %r", capacity.as_dict())
+    return capacity.max_tasks
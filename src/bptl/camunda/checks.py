@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from bptl.utils.checks import is_process_local_cache
+
+
+@register()
+def check_capacity_cache(app_configs, **kwargs):
+    """
+    Check that the execution capacity is shared between the workers and the poller.
+    """
+    alias = settings.CAMUNDA_CAPACITY_CACHE_ALIAS
+    if not settings.ADAPTIVE_MAX_TASKS or not is_process_local_cache(alias):
+        return []
+    return [
+        Warning(
+            f"The cache {alias!r} of the execution capacity is local to each process.",
+            hint=(
+                "The execution times recorded by the workers don't reach the poller. "
+                "Configure a shared cache backend like Redis or set "
+                "CAMUNDA_CAPACITY_CACHE_ALIAS to a shared cache."
+            ),
+            id="camunda.W001",
+        )
+    ]
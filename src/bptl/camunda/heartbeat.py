@@ -0,0 +1,161 @@
+"""
+Keep the Camunda locks of running external tasks alive.
+
+Without a heartbeat, a work unit that takes longer than the lock duration loses its
+lock and only finds out afterwards. With ``CAMUNDA_LOCK_HEARTBEAT`` enabled, a
+background thread per worker process extends the locks of all in-flight tasks before
+they expire.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+import requests
+from django_camunda.client import get_client
+
+from .models import ExternalTask
+from .utils import LOCK_DURATION
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 30  # seconds
+# extend the lock once less than this remains
+EXTEND_MARGIN = timedelta(seconds=LOCK_DURATION / 2)
+
+
+class LockHeartbeat:
+    """
+    Periodically extend the locks of the tracked external tasks.
+
+    All tasks that are due are extended in a single sweep, re-using one HTTP session,
+    and their new lock expiry is saved with a single query.
+    """
+
+    def __init__(self, interval: int = HEARTBEAT_INTERVAL):
+        self.interval = interval
+        self._tasks: Dict[int, ExternalTask] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="camunda-lock-heartbeat", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def add(self, task: ExternalTask) -> None:
+        with self._lock:
+            self._tasks[task.pk] = task
+
+    def discard(self, task: ExternalTask) -> None:
+        with self._lock:
+            self._tasks.pop(task.pk, None)
+
+    @contextmanager
+    def track(self, task: ExternalTask):
+        self.add(task)
+        self.start()
+        try:
+            yield
+        finally:
+            self.discard(task)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.beat()
+            except Exception:
+                logger.exception("Extending the locks of running tasks failed")
+            finally:
+                # the thread has its own database connection
+                close_old_connections()
+        connection.close()
+
+    def beat(self) -> List[ExternalTask]:
+        """
+        Extend the locks of all tracked tasks that are about to expire.
+        """
+        threshold = timezone.now() + EXTEND_MARGIN
+        with self._lock:
+            due = [
+                task
+                for task in self._tasks.values()
+                if task.lock_expires_at is not None
+                and task.lock_expires_at <= threshold
+            ]
+        if not due:
+            return []
+
+        extended = []
+        with get_client() as camunda:
+            for task in due:
+                # determined before the call, so the stored expiry is never too late
+                lock_expires_at = timezone.now() + timedelta(seconds=LOCK_DURATION)
+                body = {
+                    "newDuration": LOCK_DURATION * 1000,  # milliseconds
+                    "workerId": task.worker_id,
+                }
+                try:
+                    camunda.post(f"external-task/{task.task_id}/extendLock", json=body)
+                except requests.HTTPError:
+                    # the task was cancelled or locked by another worker - extending
+                    # it again won't help
+                    logger.warning(
+                        "Could not extend the lock of task %s", task, exc_info=True
+                    )
+                    self.discard(task)
+                    continue
+                task.lock_expires_at = lock_expires_at
+                extended.append(task)
+
+        if extended:
+            ExternalTask.objects.filter(pk__in=[task.pk for task in extended]).update(
+                lock_expires_at=min(task.lock_expires_at for task in extended)
+            )
+            logger.info("Extended the locks of %d task(s)", len(extended))
+        return extended
+
+
+_heartbeat: Optional[LockHeartbeat] = None
+_heartbeat_pid: Optional[int] = None
+
+
+def get_heartbeat() -> LockHeartbeat:
+    """
+    Return the heartbeat of the current process.
+
+    Threads don't survive a fork, so every (prefork) worker process gets its own.
+    """
+    global _heartbeat, _heartbeat_pid
+    pid = os.getpid()
+    if _heartbeat is None or _heartbeat_pid != pid:
+        _heartbeat = LockHeartbeat()
+        _heartbeat_pid = pid
+    return _heartbeat
+
+
+def track_lock(task: ExternalTask):
+    """
+    Keep the lock of ``task`` alive for the duration of the ``with`` block.
+    """
+    if not settings.CAMUNDA_LOCK_HEARTBEAT:
+        return nullcontext()
+    return get_heartbeat().track(task)
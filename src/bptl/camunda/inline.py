@@ -0,0 +1,92 @@
+"""
+Execute short external tasks directly in the poller process.
+
+For trivial topics, the broker hop, worker pick-up and extra database round trips
+of the celery execution take most of the latency. The tasks of topics marked as
+``inline`` are executed by a small thread pool in the poller instead. The pool is
+bounded: when all threads are busy, the tasks are handed over to celery, so the
+poller never blocks on or queues up inline work.
+
+A thread can't be interrupted safely, so inline executions are not time limited.
+Topics with a soft time limit are always executed by celery, which can enforce it. An
+inline task that hangs keeps its thread until the HTTP timeouts of its clients kick
+in, and the sweeper fails it once its Camunda lock has expired.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from django.db import close_old_connections
+
+from bptl.tasks.models import TaskMapping
+from bptl.utils.constants import Statuses
+
+from .models import ExternalTask
+from .routing import get_execution_options
+from .sweeper import mark_dispatched
+from .tasks import execute_and_complete, task_execute_and_complete
+from .throttling import THROTTLE_COUNTDOWN, start_task
+
+logger = logging.getLogger(__name__)
+
+
+def execute_inline(
+    task: ExternalTask, task_mapping: Optional[TaskMapping] = None
+) -> None:
+    """
+    Start, execute and complete ``task`` in the current thread.
+    """
+    if not start_task(task):
+        if task.status == Statuses.initial:
+            # the topic has reached its limit, let celery retry it
+            mark_dispatched([task.pk])
+            task_execute_and_complete.apply_async(
+                (task.id,),
+                countdown=THROTTLE_COUNTDOWN,
+                **get_execution_options(task, task_mapping),
+            )
+        return
+
+    execute_and_complete(task)
+
+
+class InlineExecutor:
+    """
+    Bounded thread pool to execute external tasks with.
+
+    :param max_workers: the number of tasks that can be executed at the same time.
+    """
+
+    def __init__(self, max_workers: int):
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="camunda-inline"
+        )
+        self._slots = threading.BoundedSemaphore(max_workers)
+
+    def submit(
+        self, task: ExternalTask, task_mapping: Optional[TaskMapping] = None
+    ) -> bool:
+        """
+        Execute ``task`` in the background, if a thread is available.
+
+        :return: whether the task was accepted.
+        """
+        if not self._slots.acquire(blocking=False):
+            return False
+        self._pool.submit(self._run, task, task_mapping)
+        return True
+
+    def _run(self, task: ExternalTask, task_mapping: Optional[TaskMapping]) -> None:
+        try:
+            execute_inline(task, task_mapping)
+        except Exception:
+            logger.exception("Inline execution of task %s failed", task)
+        finally:
+            self._slots.release()
+            # the threads have their own database connections
+            close_old_connections()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from ...poller import Poller
+
+
+class Command(BaseCommand):
+    help = (
+        "Continuously fetch and lock external tasks and dispatch them to the "
+        "execution queue. Stops gracefully on SIGINT/SIGTERM."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--worker-id",
+            help="Worker ID to lock tasks with. Must be unique for each replica, "
+            "a random one is generated if not provided.",
+        )
+        parser.add_argument(
+            "--max-tasks",
+            type=int,
+            help="Maximum number of tasks to fetch per poll. Determined from the "
+            "execution capacity if not provided.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            default=30,
+            help="Long-poll timeout in seconds. Defaults to 30. With sharding "
+            "enabled, it must be shorter than CAMUNDA_POLLER_REPLICA_TIMEOUT.",
+        )
+        parser.add_argument(
+            "--topics",
+            help="Comma separated list of topics to poll. If not provided, all "
+            "topics are polled or, with sharding enabled, a share of them.",
+        )
+        parser.add_argument(
+            "--inline-workers",
+            type=int,
+            default=settings.CAMUNDA_POLLER_INLINE_WORKERS,
+            help="Number of threads to execute the tasks of inline topics with. "
+            "Use 0 to execute all tasks with the celery workers.",
+        )
+
+    def handle(self, **options):
+        # the replica registers itself on each poll, so a long poll must end before
+        # the other replicas consider it gone
+        if (
+            settings.CAMUNDA_POLLER_SHARDING
+            and options["timeout"] >= settings.CAMUNDA_POLLER_REPLICA_TIMEOUT
+        ):
+            raise CommandError(
+                "The timeout must be shorter than CAMUNDA_POLLER_REPLICA_TIMEOUT "
+                f"({settings.CAMUNDA_POLLER_REPLICA_TIMEOUT} seconds)."
+            )
+
+        topics = options["topics"]
+        poller = Poller(
+            worker_id=options["worker_id"],
+            max_tasks=options["max_tasks"],
+            long_polling_timeout=options["timeout"],
+            topics=[topic.strip() for topic in topics.split(",")] if topics else None,
+            inline_workers=options["inline_workers"],
+        )
+        poller.install_signal_handlers()
+        self.stdout.write(f"Polling with worker ID {poller.worker_id}")
+        poller.run()
@@ -0,0 +1,25 @@
+from django.core.management import BaseCommand
+
+from ...sweeper import BATCH_SIZE, sweep
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-dispatch external tasks that were never started and reconcile the tasks "
+        "orphaned by crashed workers with Camunda."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Number of tasks to handle per batch. Defaults to {BATCH_SIZE}.",
+        )
+
+    def handle(self, **options):
+        result = sweep(batch_size=options["batch_size"])
+        self.stdout.write(
+            f"Re-dispatched {result.redispatched} task(s), superseded "
+            f"{result.superseded} task(s) and failed {result.failed} gone task(s)."
+        )
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("camunda", "0016_alter_externaltask_camunda_error"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PollerReplica",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "worker_id",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="worker id"
+                    ),
+                ),
+                (
+                    "topics",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Topics configured for this replica. If empty, the replica polls its share of the topics that are not configured for any replica.",
+                        verbose_name="topics",
+                    ),
+                ),
+                (
+                    "last_seen",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="last seen"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "poller replica",
+                "verbose_name_plural": "poller replicas",
+            },
+        ),
+    ]
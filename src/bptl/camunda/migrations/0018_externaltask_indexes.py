@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # the index is built without blocking writes to the table
+    atomic = False
+
+    dependencies = [
+        ("camunda", "0017_pollerreplica"),
+        ("tasks", "0018_basetask_unfinished_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="externaltask",
+            index=models.Index(
+                fields=["lock_expires_at"], name="camunda_ext_lock_ex_ba8623_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="externaltask",
+            index=models.Index(
+                fields=["task_id"], name="camunda_ext_task_id_3b67df_idx"
+            ),
+        ),
+    ]
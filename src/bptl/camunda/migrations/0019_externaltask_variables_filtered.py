@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("camunda", "0018_externaltask_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="externaltask",
+            name="variables_filtered",
+            field=models.BooleanField(
+                default=False,
+                help_text="Only the variables declared by the work unit were fetched with the task.",
+                verbose_name="variables filtered",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-17 02:06
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # the index is built without blocking writes to the table
+    atomic = False
+
+    dependencies = [
+        ("camunda", "0019_externaltask_variables_filtered"),
+        ("tasks", "0022_statuscount"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="externaltask",
+            index=models.Index(
+                fields=["instance_id"],
+                name="externaltask_instance_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
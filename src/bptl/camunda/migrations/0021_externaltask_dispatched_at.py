@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-17 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("camunda", "0020_externaltask_instance_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="externaltask",
+            name="dispatched_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the execution of the task was last scheduled again, after it was throttled or swept.",
+                null=True,
+                verbose_name="dispatched at",
+            ),
+        ),
+    ]
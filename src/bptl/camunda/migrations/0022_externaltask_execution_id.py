@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-17 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("camunda", "0021_externaltask_dispatched_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="externaltask",
+            name="execution_id",
+            field=models.CharField(
+                blank=True, max_length=50, verbose_name="execution id"
+            ),
+        ),
+    ]
@@ -15,6 +15,8 @@ from django_camunda.utils import deserialize_variable
 from bptl.tasks.models import BaseTask
 from bptl.tasks.utils import get_worker_id
 
+from .variables import OnDemandVariables, get_execution_variables
+
 
 class ExternalTask(BaseTask):
     """
@@ -36,7 +38,24 @@ class ExternalTask(BaseTask):
     priority = models.PositiveIntegerField(_("priority"), null=True, blank=True)
     task_id = models.CharField(_("task id"), max_length=50)
     instance_id = models.CharField(_("process instance id"), max_length=50)
+    execution_id = models.CharField(_("execution id"), max_length=50, blank=True)
     lock_expires_at = models.DateTimeField(_("lock expires at"), null=True, blank=True)
+    dispatched_at = models.DateTimeField(
+        _("dispatched at"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "When the execution of the task was last scheduled again, after it was "
+            "throttled or swept."
+        ),
+    )
+    variables_filtered = models.BooleanField(
+        _("variables filtered"),
+        default=False,
+        help_text=_(
+            "Only the variables declared by the work unit were fetched with the task."
+        ),
+    )
     camunda_error = models.JSONField(
         _("camunda error"),
         blank=True,
@@ -47,6 +66,16 @@ class ExternalTask(BaseTask):
     class Meta:
         verbose_name = _("external task")
         verbose_name_plural = _("external tasks")
+        indexes = [
+            models.Index(fields=["lock_expires_at"]),
+            models.Index(fields=["task_id"]),
+            # the prefix search of the task list
+            models.Index(
+                fields=["instance_id"],
+                name="externaltask_instance_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
 
     def __str__(self):
         return f"{self.topic_name} / {self.task_id}"
@@ -58,9 +87,45 @@ class ExternalTask(BaseTask):
         return self.lock_expires_at <= timezone.now()
 
     def get_variables(self) -> dict:
-        return {k: deserialize_variable(v) for k, v in self.variables.items()}
+        variables = {k: deserialize_variable(v) for k, v in self.variables.items()}
+        if self.variables_filtered:
+            return OnDemandVariables(
+                variables,
+                fetch=lambda: get_execution_variables(
+                    self.instance_id, self.execution_id
+                ),
+            )
+        return variables
 
     def get_process_instance_id(self) -> str:
         camunda = get_client()
         task = camunda.get(f"external-task/{self.task_id}")
         return task["process_instance_id"]
+
+
+class PollerReplica(models.Model):
+    """
+    A running poller process.
+
+    Replicas register themselves on every poll, so the topics can be divided among
+    the replicas that are alive, see :mod:`bptl.camunda.sharding`.
+    """
+
+    worker_id = models.CharField(_("worker id"), max_length=255, unique=True)
+    topics = models.JSONField(
+        _("topics"),
+        default=list,
+        blank=True,
+        help_text=_(
+            "Topics configured for this replica. If empty, the replica polls its "
+            "share of the topics that are not configured for any replica."
+        ),
+    )
+    last_seen = models.DateTimeField(_("last seen"), default=timezone.now)
+
+    class Meta:
+        verbose_name = _("poller replica")
+        verbose_name_plural = _("poller replicas")
+
+    def __str__(self):
+        return self.worker_id
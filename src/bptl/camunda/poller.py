@@ -0,0 +1,159 @@
+"""
+Continuous fetch-and-lock loop against the Camunda external task API.
+
+This is an alternative to the self-rescheduling ``task_fetch_and_lock`` celery chain.
+The loop runs in a dedicated process (see the ``run_poller`` management command),
+keeps its HTTP session to Camunda open and dispatches the fetched tasks straight to
+the execution queue. Multiple replicas can run side by side, each with its own worker
+ID. With ``CAMUNDA_POLLER_SHARDING`` enabled or a fixed set of topics, every replica
+only polls its share of the topics, see :mod:`bptl.camunda.sharding`. The tasks of
+inline topics are executed by the poller itself, see :mod:`bptl.camunda.inline`.
+"""
+
+import logging
+import signal
+import threading
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from django_camunda.client import Camunda, get_client
+
+from bptl.tasks.constants import EngineTypes
+from bptl.tasks.models import TaskMapping
+from bptl.tasks.utils import get_worker_id
+
+from .capacity import get_max_tasks
+from .inline import InlineExecutor
+from .sharding import get_assigned_topics, unregister_replica
+from .tasks import dispatch
+from .utils import fetch_and_lock
+
+logger = logging.getLogger(__name__)
+
+
+class Poller:
+    """
+    Long-poll Camunda for external tasks until stopped.
+
+    :param worker_id: the worker ID to lock tasks with, must be unique per replica.
+    :param max_tasks: the maximum number of tasks to fetch per poll. If not provided,
+      it is determined for every poll, see :func:`bptl.camunda.capacity.get_max_tasks`.
+    :param long_polling_timeout: the long-poll timeout, in seconds. This also bounds
+      the time a graceful shutdown takes.
+    :param max_backoff: the maximum time to wait after a failed poll, in seconds.
+    :param topics: the topics to poll. If not provided, all topics are polled or,
+      with ``CAMUNDA_POLLER_SHARDING``, a share of the topics not configured for
+      other replicas.
+    :param inline_workers: the number of threads to execute the tasks of inline topics
+      with. If 0, all tasks are executed by the celery workers.
+    """
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        max_tasks: Optional[int] = None,
+        long_polling_timeout: int = 30,
+        max_backoff: int = 60,
+        topics: Optional[List[str]] = None,
+        inline_workers: int = 0,
+    ):
+        self.worker_id = worker_id or get_worker_id()
+        self.max_tasks = max_tasks
+        self.long_polling_timeout = long_polling_timeout
+        self.max_backoff = max_backoff
+        self.topics = topics
+        self.executor = InlineExecutor(inline_workers) if inline_workers else None
+        self._stop_event = threading.Event()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def stop(self) -> None:
+        """
+        Request the loop to stop after the current poll has been handled.
+        """
+        self._stop_event.set()
+
+    def install_signal_handlers(self) -> None:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, self._handle_signal)
+
+    def _handle_signal(self, signum, frame):
+        # a second signal aborts the running long-poll - tasks locked by it are picked
+        # up again by Camunda once their lock expires
+        if self.stopped:
+            raise SystemExit(1)
+        logger.info(
+            "Received signal %d, stopping poller %s after the current poll",
+            signum,
+            self.worker_id,
+        )
+        self.stop()
+
+    def run(self) -> None:
+        logger.info("Starting poller %s", self.worker_id)
+        failures = 0
+        while not self.stopped:
+            # (re-)open the session, which also picks up configuration changes after
+            # a failure
+            with get_client() as camunda:
+                while not self.stopped:
+                    try:
+                        self.poll(camunda)
+                    except Exception:
+                        failures += 1
+                        backoff = min(2**failures, self.max_backoff)
+                        logger.exception(
+                            "Poller %s failed, retrying in %ds", self.worker_id, backoff
+                        )
+                        self._stop_event.wait(backoff)
+                        break
+                    failures = 0
+        if self.executor is not None:
+            # let the running inline tasks finish
+            self.executor.shutdown()
+        if self.sharded:
+            # hand over the topics to the other replicas right away
+            unregister_replica(self.worker_id)
+        logger.info("Stopped poller %s", self.worker_id)
+
+    @property
+    def sharded(self) -> bool:
+        return bool(self.topics) or settings.CAMUNDA_POLLER_SHARDING
+
+    def get_topics(self) -> Optional[List[str]]:
+        """
+        Return the topics to poll, or ``None`` to poll all topics.
+        """
+        if not self.sharded:
+            return None
+        topics = TaskMapping.objects.filter(
+            active=True, engine_type=EngineTypes.camunda
+        ).values_list("topic_name", flat=True)
+        return get_assigned_topics(self.worker_id, list(topics), self.topics)
+
+    def poll(self, camunda: Camunda) -> int:
+        # the long-poll may exceed the lifetime of the database connection
+        close_old_connections()
+        topics = self.get_topics()
+        if topics == []:
+            logger.debug("No topics assigned to poller %s", self.worker_id)
+            # wait as long as a poll would, the assignment may change meanwhile
+            self._stop_event.wait(self.long_polling_timeout)
+            return 0
+
+        worker_id, num_tasks, tasks = fetch_and_lock(
+            self.max_tasks or get_max_tasks(),
+            # convert to milliseconds
+            long_polling_timeout=self.long_polling_timeout * 1000,
+            bulk=settings.CAMUNDA_BULK_INGESTION,
+            worker_id=self.worker_id,
+            client=camunda,
+            topics=topics,
+        )
+        logger.info("Fetched %r tasks with %r", num_tasks, worker_id)
+        dispatch(tasks, executor=self.executor)
+        return num_tasks
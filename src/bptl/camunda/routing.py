@@ -0,0 +1,86 @@
+"""
+Route the execution of external tasks to celery queues.
+
+A task mapping can route the tasks of its topic to a dedicated queue and limit their
+execution time, so the workers can be sized per workload class. Otherwise, Camunda
+task priorities are mapped onto tiered queues with the
+``CAMUNDA_PRIORITY_QUEUES`` setting, e.g. ``100:celery-high,0:celery,-100:celery-low``.
+A task is routed to the queue of the first tier its priority reaches, tasks below the
+lowest tier (or without priority) go to the default queue. Workers should consume the
+queues in order of priority, e.g. ``-Q celery-high,celery,celery-low``.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+
+from bptl.tasks.models import TaskMapping
+
+from ..celery import app
+from .models import ExternalTask
+
+
+@dataclass
+class PriorityQueue:
+    priority: int
+    queue: str
+
+
+def get_priority_queues() -> List[PriorityQueue]:
+    """
+    Return the configured priority tiers, highest priority first.
+    """
+    tiers = [
+        PriorityQueue(priority=priority, queue=queue)
+        for priority, queue in settings.CAMUNDA_PRIORITY_QUEUES
+    ]
+    return sorted(tiers, key=lambda tier: tier.priority, reverse=True)
+
+
+def get_queue(priority: Optional[int]) -> Optional[str]:
+    if priority is None:
+        return None
+    for tier in get_priority_queues():
+        if priority >= tier.priority:
+            return tier.queue
+    return None
+
+
+def get_execution_queues() -> List[str]:
+    """
+    Return all queues external tasks may be executed from.
+    """
+    queues = [app.conf.task_default_queue]
+    queues += [tier.queue for tier in get_priority_queues()]
+    queues += (
+        TaskMapping.objects.exclude(queue="")
+        .order_by("queue")
+        .values_list("queue", flat=True)
+    )
+    return list(dict.fromkeys(queues))
+
+
+def get_task_mappings(tasks: Iterable[ExternalTask]) -> Dict[str, TaskMapping]:
+    topics = {task.topic_name for task in tasks}
+    return {
+        task_mapping.topic_name: task_mapping
+        for task_mapping in TaskMapping.objects.filter(topic_name__in=topics)
+    }
+
+
+def get_execution_options(
+    task: ExternalTask, task_mapping: Optional[TaskMapping] = None
+) -> dict:
+    """
+    Return the ``apply_async`` options to schedule the execution of ``task`` with.
+
+    The queue of the task mapping takes precedence over the priority queues.
+    """
+    options = {}
+    queue = (task_mapping and task_mapping.queue) or get_queue(task.priority)
+    if queue:
+        options["queue"] = queue
+    if task_mapping and task_mapping.soft_time_limit:
+        options["soft_time_limit"] = task_mapping.soft_time_limit
+    return options
@@ -0,0 +1,115 @@
+"""
+Divide the Camunda topics among multiple poller replicas.
+
+Every replica registers itself in the database on each poll. A replica can be
+configured with a fixed set of topics, the remaining topics are divided among the
+other replicas by consistent hashing of the topic names - or among all replicas, if
+every replica is configured with topics and sharding is enabled. Replicas that haven't
+been seen for ``CAMUNDA_POLLER_REPLICA_TIMEOUT`` seconds are considered gone, so the
+assignment rebalances as replicas join or leave, while only the topics of the
+joining/leaving replica move.
+
+During a rebalance a topic may briefly be polled by two replicas or none - Camunda's
+locking ensures every task is still handed out only once.
+"""
+
+import bisect
+import hashlib
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import PollerReplica
+
+# number of points per replica on the hash ring, to spread the topics evenly
+VIRTUAL_NODES = 64
+
+
+def _hash(key: str) -> int:
+    # the builtin hash is randomized per process, which would assign the topics
+    # differently in every replica
+    return int(hashlib.md5(key.encode("utf-8")).hexdigest()[:16], 16)
+
+
+class HashRing:
+    """
+    Consistent hash ring mapping keys onto nodes.
+    """
+
+    def __init__(self, nodes: Iterable[str], virtual_nodes: int = VIRTUAL_NODES):
+        ring = sorted(
+            (_hash(f"{node}:{index}"), node)
+            for node in nodes
+            for index in range(virtual_nodes)
+        )
+        self._hashes = [point for point, _ in ring]
+        self._nodes = [node for _, node in ring]
+
+    def get_node(self, key: str) -> Optional[str]:
+        if not self._nodes:
+            return None
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._nodes[index]
+
+
+def register_replica(worker_id: str, topics: Optional[List[str]] = None) -> None:
+    PollerReplica.objects.update_or_create(
+        worker_id=worker_id,
+        defaults={"topics": topics or [], "last_seen": timezone.now()},
+    )
+
+
+def unregister_replica(worker_id: str) -> None:
+    PollerReplica.objects.filter(worker_id=worker_id).delete()
+
+
+def get_active_replicas() -> List[PollerReplica]:
+    threshold = timezone.now() - timedelta(
+        seconds=settings.CAMUNDA_POLLER_REPLICA_TIMEOUT
+    )
+    return list(PollerReplica.objects.filter(last_seen__gte=threshold))
+
+
+def assign_topics(
+    topics: List[str], replicas: List[PollerReplica]
+) -> Dict[str, List[str]]:
+    """
+    Determine the topics to poll per replica (worker ID).
+    """
+    assignment = {replica.worker_id: [] for replica in replicas}
+    configured = set()
+    for replica in replicas:
+        assignment[replica.worker_id] = [
+            topic for topic in topics if topic in replica.topics
+        ]
+        configured.update(replica.topics)
+
+    unconfigured = [replica for replica in replicas if not replica.topics]
+    if not unconfigured and settings.CAMUNDA_POLLER_SHARDING:
+        # the remaining topics would not be polled at all. Without sharding, they are
+        # polled by the (unregistered) replicas without topics.
+        unconfigured = replicas
+    ring = HashRing(replica.worker_id for replica in unconfigured)
+    for topic in topics:
+        if topic in configured:
+            continue
+        worker_id = ring.get_node(topic)
+        if worker_id is not None:
+            assignment[worker_id].append(topic)
+    return assignment
+
+
+def get_assigned_topics(
+    worker_id: str, topics: List[str], configured: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Register the replica and return the topics it should poll.
+
+    :param worker_id: the worker ID of the replica.
+    :param topics: all active topics.
+    :param configured: the topics configured for this replica, if any.
+    """
+    register_replica(worker_id, configured)
+    return assign_topics(topics, get_active_replicas()).get(worker_id, [])
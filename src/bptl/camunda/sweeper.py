@@ -0,0 +1,180 @@
+"""
+Recover external tasks that were orphaned by a crashed worker.
+
+If a worker dies between fetching and completing a task, its row is stuck in the
+initial, in progress or performed status. The sweeper picks these rows up in batches:
+
+* tasks that were never started, while their Camunda lock is still valid, are
+  scheduled for execution again. Tasks that were scheduled again recently, e.g. the
+  throttled tasks waiting for their retry, are left alone;
+* tasks whose lock expired long enough ago that no execution can still be running are
+  reconciled with Camunda. If the task still exists there, it has been (or will be)
+  fetched again as a new row, and the stale row is marked as superseded rather than
+  failed, as the task itself is not lost. Tasks that no longer exist are marked as
+  failed. The stale rows are kept with their logs, as their execution may have called
+  other services already.
+
+The unfinished statuses and lock expiry are indexed, so the sweeps stay cheap
+regardless of the number of finished tasks.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import List
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from django_camunda.client import get_client
+
+from bptl.tasks.models import BaseTask, TaskMapping
+from bptl.tasks.status_counts import bulk_log_status
+from bptl.utils.constants import Statuses
+
+from .models import ExternalTask
+from .routing import get_execution_options, get_task_mappings
+from .utils import LOCK_DURATION
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+# the lock must still be valid for at least this long to execute a task again
+REDISPATCH_MARGIN = timedelta(minutes=1)
+
+UNFINISHED_STATUSES = [Statuses.initial, Statuses.in_progress, Statuses.performed]
+
+
+@dataclass
+class SweepResult:
+    redispatched: int = 0
+    superseded: int = 0
+    failed: int = 0
+
+
+def mark_dispatched(task_ids: List[int]) -> None:
+    """
+    Record that the execution of the tasks was scheduled again.
+    """
+    ExternalTask.objects.filter(pk__in=task_ids).update(dispatched_at=timezone.now())
+
+
+def get_pending_tasks():
+    """
+    Return the tasks that should have been started, but were not.
+    """
+    now = timezone.now()
+    fetched_before = now - timedelta(seconds=settings.CAMUNDA_SWEEPER_GRACE)
+    return ExternalTask.objects.filter(
+        models.Q(dispatched_at__isnull=True)
+        | models.Q(dispatched_at__lte=fetched_before),
+        status=Statuses.initial,
+        lock_expires_at__gt=now + REDISPATCH_MARGIN,
+        # the lock is set for LOCK_DURATION when the task is fetched
+        lock_expires_at__lte=fetched_before + timedelta(seconds=LOCK_DURATION),
+    )
+
+
+def get_orphaned_tasks():
+    """
+    Return the unfinished tasks of which no execution can still be running.
+    """
+    # executions are aborted after the soft time limit, which topics can raise
+    time_limit = max(
+        settings.CELERY_TASK_SOFT_TIME_LIMIT,
+        TaskMapping.objects.aggregate(limit=models.Max("soft_time_limit"))["limit"]
+        or 0,
+    )
+    expired_before = timezone.now() - timedelta(seconds=time_limit)
+    return ExternalTask.objects.filter(
+        status__in=UNFINISHED_STATUSES, lock_expires_at__lt=expired_before
+    )
+
+
+def redispatch(tasks: List[ExternalTask]) -> None:
+    # imported here to avoid a circular import, the tasks schedule the sweeps
+    from .tasks import task_execute_and_complete
+
+    mark_dispatched([task.pk for task in tasks])
+    task_mappings = get_task_mappings(tasks)
+    for task in tasks:
+        options = get_execution_options(task, task_mappings.get(task.topic_name))
+        task_execute_and_complete.apply_async((task.id,), **options)
+
+
+def close_tasks(tasks: List[ExternalTask], status: str, error: str) -> None:
+    if not tasks:
+        return
+    with transaction.atomic():
+        # an execution may have finished a task after it was selected
+        unfinished = BaseTask.objects.select_for_update().filter(
+            pk__in=[task.pk for task in tasks], status__in=UNFINISHED_STATUSES
+        )
+        pks = set(unfinished.values_list("pk", flat=True))
+        BaseTask.objects.filter(pk__in=pks).update(status=status, execution_error=error)
+        tasks = [task for task in tasks if task.pk in pks]
+        for task in tasks:
+            task.status = status
+            task.execution_error = error
+        bulk_log_status(tasks)
+
+
+def reconcile(tasks: List[ExternalTask]) -> SweepResult:
+    """
+    Close the orphaned tasks, with the outcome depending on their state in Camunda.
+    """
+    with get_client() as camunda:
+        existing = camunda.post(
+            "external-task",
+            json={"externalTaskIdIn": [task.task_id for task in tasks]},
+        )
+    existing_ids = {external_task["id"] for external_task in existing}
+
+    superseded = [task for task in tasks if task.task_id in existing_ids]
+    close_tasks(
+        superseded,
+        Statuses.superseded,
+        "The task was orphaned and is fetched again from Camunda.",
+    )
+    gone = [task for task in tasks if task.task_id not in existing_ids]
+    close_tasks(
+        gone, Statuses.failed, "The task was orphaned and no longer exists in Camunda."
+    )
+
+    return SweepResult(superseded=len(superseded), failed=len(gone))
+
+
+def sweep(batch_size: int = BATCH_SIZE) -> SweepResult:
+    """
+    Re-dispatch or reconcile all stale external tasks.
+    """
+    result = SweepResult()
+
+    last_pk = 0
+    while True:
+        batch = list(
+            get_pending_tasks().filter(pk__gt=last_pk).order_by("pk")[:batch_size]
+        )
+        if not batch:
+            break
+        redispatch(batch)
+        result.redispatched += len(batch)
+        last_pk = batch[-1].pk
+
+    # reconciled tasks drop out of the queryset, so always take the first batch
+    while True:
+        batch = list(get_orphaned_tasks().order_by("pk")[:batch_size])
+        if not batch:
+            break
+        reconciled = reconcile(batch)
+        result.superseded += reconciled.superseded
+        result.failed += reconciled.failed
+
+    logger.info(
+        "Swept stale tasks: %d re-dispatched, %d superseded, %d failed",
+        result.redispatched,
+        result.superseded,
+        result.failed,
+    )
+    return result
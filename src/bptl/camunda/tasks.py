@@ -1,26 +1,45 @@
 """celery tasks to process camunda external tasks"""
 
+import time
+from contextlib import ExitStack
+from dataclasses import asdict
+from typing import List, Optional
+
 from django.conf import settings
 
 import requests
+from celery import group
 from celery.utils.log import get_task_logger
 from celery_once import QueueOnce
-from timeline_logger.models import TimelineLog
 
 from bptl.camunda.api import complete
 from bptl.camunda.models import ExternalTask
 from bptl.camunda.utils import fetch_and_lock
-from bptl.tasks.api import TaskExpired, execute
+from bptl.tasks.api import TaskExpired, execute, execute_many
+from bptl.tasks.models import TaskMapping
 from bptl.tasks.registry import register
+from bptl.tasks.status_counts import bulk_log_status, log_status
 from bptl.utils.constants import Statuses
 from bptl.utils.decorators import retry
 
 from ..celery import app
+from .capacity import get_max_tasks, record_execution_time
+from .heartbeat import track_lock
+from .routing import get_execution_options, get_task_mappings
+from .sweeper import mark_dispatched, sweep
+from .throttling import THROTTLE_COUNTDOWN, THROTTLE_MAX_RETRIES, give_up, start_task
 from .utils import extend_task, fail_task
 
 logger = get_task_logger(__name__)
 
-__all__ = ("task_fetch_and_lock", "task_execute_and_complete")
+__all__ = (
+    "execute_and_complete",
+    "execute_and_complete_many",
+    "task_fetch_and_lock",
+    "task_execute_and_complete",
+    "task_execute_and_complete_many",
+    "task_sweep_stale_tasks",
+)
 
 
 @app.task(
@@ -37,20 +56,15 @@ __all__ = ("task_fetch_and_lock", "task_execute_and_complete")
 def task_fetch_and_lock():
     logger.debug("Fetching and locking tasks (long poll)")
     worker_id, num_tasks, tasks = fetch_and_lock(
-        settings.MAX_TASKS,
+        get_max_tasks(),
         # convert to milliseconds
         long_polling_timeout=settings.LONG_POLLING_TIMEOUT_MINUTES * 60 * 1000,
+        bulk=settings.CAMUNDA_BULK_INGESTION,
     )
 
     logger.info("Fetched %r tasks with %r", num_tasks, worker_id)
 
-    for task in tasks:
-        # initial logging
-        TimelineLog.objects.create(
-            content_object=task, extra_data={"status": task.status}
-        )
-
-        task_execute_and_complete.delay(task.id)
+    dispatch(tasks)
 
     # once we're completed, which may be way within the timeout, we need to-reschedule
     # a new long-poll! this needs to run _after_ the current task has exited, otherwise
@@ -61,6 +75,87 @@ def task_fetch_and_lock():
     return num_tasks
 
 
+def dispatch(tasks: List[ExternalTask], executor=None) -> None:
+    """
+    Log the initial status of fetched tasks and schedule their execution.
+
+    :param executor: a :class:`bptl.camunda.inline.InlineExecutor` to run the tasks of
+      inline topics with. These tasks are scheduled with celery as well if no executor
+      is given, if it is fully occupied or if the topic has a soft time limit.
+    """
+    task_mappings = get_task_mappings(tasks)
+
+    # initial logging
+    if settings.CAMUNDA_BULK_INGESTION:
+        bulk_log_status(tasks, new=True)
+    else:
+        for task in tasks:
+            log_status(task, new=True)
+
+    scheduled, batches = [], {}
+    for task in tasks:
+        task_mapping = task_mappings.get(task.topic_name)
+        if (
+            executor
+            and task_mapping
+            and task_mapping.inline
+            # only celery can enforce the time limit
+            and not task_mapping.soft_time_limit
+            and executor.submit(task, task_mapping)
+        ):
+            continue
+        options = get_execution_options(task, task_mapping)
+        if supports_batch(task_mapping):
+            key = (task.topic_name, tuple(sorted(options.items())))
+            batches.setdefault(key, []).append(task)
+            continue
+        scheduled.append((task, options))
+
+    # batches of a single task are executed like any other task
+    for key, batch in list(batches.items()):
+        if len(batch) == 1:
+            scheduled.append((batch[0], dict(key[1])))
+            del batches[key]
+
+    if settings.CAMUNDA_BULK_INGESTION:
+        # dispatch in one go rather than per task
+        signatures = [
+            task_execute_and_complete.s(task.id).set(**options)
+            for task, options in scheduled
+        ] + [
+            task_execute_and_complete_many.s([task.id for task in batch]).set(
+                **dict(options)
+            )
+            for (_, options), batch in batches.items()
+        ]
+        if signatures:
+            group(signatures).delay()
+        return
+
+    for task, options in scheduled:
+        if options:
+            task_execute_and_complete.apply_async((task.id,), **options)
+        else:
+            task_execute_and_complete.delay(task.id)
+
+    for (_, options), batch in batches.items():
+        task_execute_and_complete_many.apply_async(
+            ([task.id for task in batch],), **dict(options)
+        )
+
+
+def supports_batch(task_mapping: Optional[TaskMapping]) -> bool:
+    """
+    Determine whether the callback of ``task_mapping`` has a batch entry point.
+    """
+    if task_mapping is None:
+        return False
+    try:
+        return register[task_mapping.callback].perform_many is not None
+    except KeyError:
+        return False
+
+
 @app.task()
 def task_schedule_new_fetch_and_lock():
     """
@@ -73,8 +168,8 @@ def task_schedule_new_fetch_and_lock():
     task_fetch_and_lock.delay()
 
 
-@app.task()
-def task_execute_and_complete(fetched_task_id):
+@app.task(bind=True)
+def task_execute_and_complete(self, fetched_task_id):
     logger.info("Received task execution request (ID %d)", fetched_task_id)
     fetched_task = ExternalTask.objects.get(id=fetched_task_id)
 
@@ -86,8 +181,34 @@ def task_execute_and_complete(fetched_task_id):
     instance_id = fetched_task.instance_id
     logger.info("Task is part of process instance %s", instance_id)
 
-    fetched_task.status = Statuses.in_progress
-    fetched_task.save(update_fields=["status"])
+    if not start_task(fetched_task):
+        if fetched_task.status != Statuses.initial:
+            logger.warning("Task %r has been already run", fetched_task_id)
+            return
+        if fetched_task.expired or self.request.retries >= THROTTLE_MAX_RETRIES:
+            logger.warning(
+                "Lock of task %r expired while topic %r had reached its limit",
+                fetched_task_id,
+                fetched_task.topic_name,
+            )
+            give_up(fetched_task)
+            return
+        logger.info(
+            "Topic %r has reached its limit, postponing task %r",
+            fetched_task.topic_name,
+            fetched_task_id,
+        )
+        # the sweeper leaves the task alone while it is retried
+        mark_dispatched([fetched_task.pk])
+        raise self.retry(countdown=THROTTLE_COUNTDOWN, max_retries=THROTTLE_MAX_RETRIES)
+
+    execute_and_complete(fetched_task)
+
+
+def execute_and_complete(fetched_task: ExternalTask) -> None:
+    """
+    Execute a started task and send its result to Camunda.
+    """
 
     # Catch and retry on http errors other than 500
     @retry(
@@ -105,19 +226,22 @@ def task_execute_and_complete(fetched_task_id):
                 raise TaskExpired("Task lock expired and could not be extended.")
             return _execute(extended_task)
 
+    start = time.monotonic()
     try:
-        _execute(fetched_task)
+        with track_lock(fetched_task):
+            _execute(fetched_task)
     except Exception as exc:
         logger.warning(
             "Task %r has failed during execution with error: %r",
-            fetched_task_id,
+            fetched_task.id,
             exc,
             exc_info=True,
         )
         fail_task(fetched_task)
         return
 
-    logger.info("Task %r is executed", fetched_task_id)
+    logger.info("Task %r is executed", fetched_task.id)
+    record_execution_time(fetched_task.topic_name, time.monotonic() - start)
 
     # complete
     try:
@@ -125,10 +249,110 @@ def task_execute_and_complete(fetched_task_id):
     except Exception as exc:
         logger.warning(
             "Task %r has failed during sending process with error: %r",
-            fetched_task_id,
+            fetched_task.id,
             exc,
             exc_info=True,
         )
         return
 
-    logger.info("Task %r is completed", fetched_task_id)
+    logger.info("Task %r is completed", fetched_task.id)
+
+
+@app.task()
+def task_execute_and_complete_many(fetched_task_ids: List[int]):
+    """
+    Execute and complete the fetched tasks of a topic with a batch entry point.
+    """
+    logger.info("Received batch execution request (IDs %r)", fetched_task_ids)
+    fetched_tasks = list(
+        ExternalTask.objects.filter(
+            id__in=fetched_task_ids, status=Statuses.initial
+        ).order_by("id")
+    )
+    task_mappings = get_task_mappings(fetched_tasks)
+
+    started = []
+    for fetched_task in fetched_tasks:
+        if start_task(fetched_task):
+            started.append(fetched_task)
+        elif fetched_task.status == Statuses.initial:
+            # the topic has reached its limit, retry the task on its own
+            mark_dispatched([fetched_task.pk])
+            task_execute_and_complete.apply_async(
+                (fetched_task.id,),
+                countdown=THROTTLE_COUNTDOWN,
+                **get_execution_options(
+                    fetched_task, task_mappings.get(fetched_task.topic_name)
+                ),
+            )
+
+    if started:
+        execute_and_complete_many(started)
+
+
+def execute_and_complete_many(fetched_tasks: List[ExternalTask]) -> None:
+    """
+    Execute started tasks of the same topic together and send their results to Camunda.
+
+    Contrary to :func:`execute_and_complete`, the work unit is not retried on HTTP
+    errors, as the batch would be performed again for all tasks.
+    """
+    for fetched_task in fetched_tasks:
+        if not fetched_task.expired:
+            continue
+        try:
+            extend_task(fetched_task)
+        except Exception as exc:
+            # the task is failed by execute_many if the lock expired
+            logger.warning(
+                "Lock of task %r could not be extended: %r", fetched_task.id, exc
+            )
+
+    start = time.monotonic()
+    with ExitStack() as stack:
+        for fetched_task in fetched_tasks:
+            stack.enter_context(track_lock(fetched_task))
+        results = execute_many(fetched_tasks, registry=register)
+    duration = (time.monotonic() - start) / len(fetched_tasks)
+
+    for fetched_task, result in zip(fetched_tasks, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                "Task %r has failed during execution with error: %r",
+                fetched_task.id,
+                result,
+            )
+            try:
+                fail_task(fetched_task)
+            except Exception as exc:
+                logger.warning(
+                    "Task %r could not be marked as failed: %r", fetched_task.id, exc
+                )
+            continue
+
+        logger.info("Task %r is executed", fetched_task.id)
+        record_execution_time(fetched_task.topic_name, duration)
+
+        try:
+            complete(fetched_task)
+        except Exception as exc:
+            logger.warning(
+                "Task %r has failed during sending process with error: %r",
+                fetched_task.id,
+                exc,
+                exc_info=True,
+            )
+            continue
+
+        logger.info("Task %r is completed", fetched_task.id)
+
+
+@app.task(base=QueueOnce, once={"graceful": True})
+def task_sweep_stale_tasks():
+    """
+    Re-dispatch or reconcile external tasks orphaned by crashed workers.
+
+    Intended to be scheduled periodically with celery beat.
+    """
+    result = sweep()
+    return asdict(result)
@@ -0,0 +1,113 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from bptl.tasks.registry import WorkUnitRegistry
+from bptl.tasks.tests.factories import TaskMappingFactory
+from bptl.utils.constants import Statuses
+
+from ..tasks import dispatch, task_execute_and_complete_many
+from .factories import ExternalTaskFactory
+
+# isolated registry for tests
+register = WorkUnitRegistry()
+
+
+def perform_many(tasks):
+    return [
+        ValueError("failed") if task.priority else {"size": len(tasks)}
+        for task in tasks
+    ]
+
+
+@register
+@register.batch(perform_many)
+def batched(task):
+    pass
+
+
+BATCHED = f"{batched.__module__}.{batched.__qualname__}"
+
+
+@patch("bptl.camunda.tasks.register", new=register)
+class BatchDispatchTests(TestCase):
+    @patch("bptl.camunda.tasks.task_execute_and_complete_many.apply_async")
+    @patch("bptl.camunda.tasks.task_execute_and_complete.delay")
+    def test_dispatch(self, m_delay, m_apply_async):
+        TaskMappingFactory.create(topic_name="batched", callback=BATCHED)
+        task1, task2 = ExternalTaskFactory.create_batch(2, topic_name="batched")
+        other_task = ExternalTaskFactory.create(topic_name="other")
+
+        dispatch([task1, other_task, task2])
+
+        m_apply_async.assert_called_once_with(([task1.id, task2.id],))
+        m_delay.assert_called_once_with(other_task.id)
+
+    @patch("bptl.camunda.tasks.task_execute_and_complete_many.apply_async")
+    @patch("bptl.camunda.tasks.task_execute_and_complete.apply_async")
+    def test_dispatch_single_task(self, m_apply_async, m_apply_async_many):
+        TaskMappingFactory.create(
+            topic_name="batched", callback=BATCHED, queue="batches"
+        )
+        task = ExternalTaskFactory.create(topic_name="batched")
+
+        dispatch([task])
+
+        m_apply_async.assert_called_once_with((task.id,), queue="batches")
+        m_apply_async_many.assert_not_called()
+
+    @override_settings(CAMUNDA_BULK_INGESTION=True)
+    @patch("bptl.camunda.tasks.group")
+    def test_dispatch_bulk(self, m_group):
+        TaskMappingFactory.create(topic_name="batched", callback=BATCHED)
+        task1, task2 = ExternalTaskFactory.create_batch(2, topic_name="batched")
+
+        dispatch([task1, task2])
+
+        signatures = list(m_group.call_args.args[0])
+        self.assertEqual([sig.args for sig in signatures], [([task1.id, task2.id],)])
+
+
+@patch("bptl.camunda.tasks.register", new=register)
+class BatchExecutionTests(TestCase):
+    @patch("bptl.camunda.tasks.fail_task")
+    @patch("bptl.camunda.tasks.complete")
+    def test_execute_and_complete_many(self, m_complete, m_fail_task):
+        TaskMappingFactory.create(topic_name="batched", callback=BATCHED)
+        task1 = ExternalTaskFactory.create(topic_name="batched")
+        task2 = ExternalTaskFactory.create(topic_name="batched", priority=1)
+        completed = ExternalTaskFactory.create(
+            topic_name="batched", status=Statuses.completed
+        )
+
+        task_execute_and_complete_many([task1.id, task2.id, completed.id])
+
+        m_complete.assert_called_once_with(task1)
+        m_fail_task.assert_called_once_with(task2)
+        task1.refresh_from_db()
+        self.assertEqual(task1.status, Statuses.performed)
+        self.assertEqual(task1.result_variables, {"size": 2})
+        task2.refresh_from_db()
+        self.assertEqual(task2.status, Statuses.failed)
+        self.assertIn("ValueError: failed", task2.execution_error)
+
+    @patch("bptl.camunda.tasks.task_execute_and_complete.apply_async")
+    @patch("bptl.camunda.tasks.complete")
+    def test_throttled(self, m_complete, m_apply_async):
+        TaskMappingFactory.create(
+            topic_name="batched", callback=BATCHED, max_in_flight=1
+        )
+        task1, task2 = ExternalTaskFactory.create_batch(
+            2,
+            topic_name="batched",
+            lock_expires_at=timezone.now() + timedelta(minutes=5),
+        )
+
+        task_execute_and_complete_many([task1.id, task2.id])
+
+        m_complete.assert_called_once_with(task1)
+        m_apply_async.assert_called_once_with((task2.id,), countdown=5)
+        task2.refresh_from_db()
+        self.assertEqual(task2.status, Statuses.initial)
@@ -0,0 +1,220 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.checks import Warning
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from freezegun import freeze_time
+
+from bptl.accounts.tests.factories import SuperUserFactory, UserFactory
+
+from ..capacity import (
+    EXECUTION_TIME_TOPICS_KEY,
+    Capacity,
+    get_execution_times,
+    get_max_tasks,
+    get_worker_slots,
+    record_execution_time,
+)
+from ..checks import check_capacity_cache
+
+
+@override_settings(ADAPTIVE_MAX_TASKS_LIMIT=100)
+class CapacityTests(TestCase):
+    def test_max_tasks_free_slots(self):
+        capacity = Capacity(queue_depth=2, total_slots=8, busy_slots=3)
+
+        self.assertEqual(capacity.free_slots, 3)
+        self.assertEqual(capacity.max_tasks, 3)
+
+    def test_max_tasks_saturated(self):
+        capacity = Capacity(queue_depth=20, total_slots=8, busy_slots=8)
+
+        self.assertEqual(capacity.free_slots, 0)
+        self.assertEqual(capacity.max_tasks, 1)
+
+    def test_max_tasks_no_workers(self):
+        capacity = Capacity(queue_depth=0, total_slots=0, busy_slots=0)
+
+        self.assertEqual(capacity.max_tasks, 1)
+
+    def test_max_tasks_execution_time(self):
+        # 2 slots * 600s lock / 20s per task = 60 tasks can be started in time
+        capacity = Capacity(
+            queue_depth=10,
+            total_slots=2,
+            busy_slots=2,
+            execution_times={"fast": 10.0, "slow": 30.0},
+        )
+
+        self.assertEqual(capacity.execution_time, 20.0)
+        self.assertEqual(capacity.max_tasks, 48)
+
+    def test_max_tasks_limit(self):
+        capacity = Capacity(
+            queue_depth=0,
+            total_slots=10,
+            busy_slots=0,
+            execution_times={"fast": 0.1},
+        )
+
+        self.assertEqual(capacity.max_tasks, 100)
+
+
+class ExecutionTimeTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_record_execution_time(self):
+        record_execution_time("fast", 1.0)
+        record_execution_time("slow", 10.0)
+        record_execution_time("slow", 20.0)
+
+        self.assertEqual(get_execution_times(), {"fast": 1.0, "slow": 12.0})
+
+    def test_forget_topics(self):
+        with freeze_time("2020-01-01 12:00"):
+            record_execution_time("gone", 1.0)
+        with freeze_time("2020-01-01 12:30"):
+            record_execution_time("recent", 1.0)
+
+        with freeze_time("2020-01-01 13:10"):
+            record_execution_time("new", 1.0)
+
+            topics = cache.get(EXECUTION_TIME_TOPICS_KEY)
+
+        self.assertEqual(set(topics), {"recent", "new"})
+
+    def test_topic_lost_concurrently(self):
+        record_execution_time("fast", 1.0)
+        # overwritten by a worker that recorded another topic at the same time
+        cache.set(EXECUTION_TIME_TOPICS_KEY, {})
+
+        record_execution_time("fast", 1.0)
+
+        self.assertEqual(get_execution_times(), {"fast": 1.0})
+
+
+class WorkerSlotsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    @patch("bptl.camunda.capacity.app.control.inspect")
+    def test_get_worker_slots(self, m_inspect):
+        m_inspect.return_value.active_queues.return_value = {
+            "celery@worker1": [{"name": "celery"}],
+            "celery@worker2": [{"name": "celery"}],
+            "long-polling@worker3": [{"name": "long-polling"}],
+        }
+        m_inspect.return_value.stats.return_value = {
+            "celery@worker1": {"pool": {"max-concurrency": 4}},
+            "celery@worker2": {"pool": {"max-concurrency": 2}},
+        }
+        m_inspect.return_value.active.return_value = {
+            "celery@worker1": [{"id": "1"}, {"id": "2"}],
+            "celery@worker2": [],
+        }
+
+        slots = get_worker_slots()
+
+        self.assertEqual(slots, {"total": 6, "busy": 2})
+        m_inspect.assert_called_with(
+            destination=["celery@worker1", "celery@worker2"], timeout=1.0
+        )
+        # cached between polls
+        m_inspect.reset_mock()
+        self.assertEqual(get_worker_slots(), slots)
+        m_inspect.assert_not_called()
+
+    @override_settings(ADAPTIVE_MAX_TASKS=False, MAX_TASKS=7)
+    @patch("bptl.camunda.capacity.get_capacity")
+    def test_get_max_tasks_disabled(self, m_get_capacity):
+        self.assertEqual(get_max_tasks(), 7)
+
+        m_get_capacity.assert_not_called()
+
+    @override_settings(ADAPTIVE_MAX_TASKS=True, MAX_TASKS=7)
+    @patch(
+        "bptl.camunda.capacity.get_capacity",
+        return_value=Capacity(queue_depth=0, total_slots=4, busy_slots=1),
+    )
+    def test_get_max_tasks_enabled(self, m_get_capacity):
+        self.assertEqual(get_max_tasks(), 3)
+
+    @override_settings(ADAPTIVE_MAX_TASKS=True, MAX_TASKS=7)
+    @patch("bptl.camunda.capacity.get_capacity", side_effect=ConnectionError)
+    def test_get_max_tasks_fallback(self, m_get_capacity):
+        self.assertEqual(get_max_tasks(), 7)
+
+    @patch(
+        "bptl.dashboard.api.views.get_capacity",
+        return_value=Capacity(
+            queue_depth=1, total_slots=4, busy_slots=1, execution_times={"fast": 2.0}
+        ),
+    )
+    def test_capacity_api(self, m_get_capacity):
+        url = reverse("dashboard:dashboard-api:capacity")
+        self.client.force_login(SuperUserFactory.create())
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "queue_depth": 1,
+                "total_slots": 4,
+                "busy_slots": 1,
+                "free_slots": 2,
+                "execution_times": {"fast": 2.0},
+                "execution_time": 2.0,
+                "max_tasks": 100,
+            },
+        )
+
+    def test_capacity_api_staff_only(self):
+        url = reverse("dashboard:dashboard-api:capacity")
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 403)
+
+        self.client.force_login(UserFactory.create())
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 403)
+
+    @patch("bptl.dashboard.api.views.get_capacity", side_effect=ConnectionError)
+    def test_capacity_api_broker_down(self, m_get_capacity):
+        url = reverse("dashboard:dashboard-api:capacity")
+        self.client.force_login(SuperUserFactory.create())
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 503)
+
+
+class CapacityCacheCheckTests(TestCase):
+    @override_settings(ADAPTIVE_MAX_TASKS=True)
+    def test_process_local_cache(self):
+        errors = check_capacity_cache(None)
+
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], Warning)
+        self.assertEqual(errors[0].id, "camunda.W001")
+
+    @override_settings(
+        ADAPTIVE_MAX_TASKS=True,
+        CACHES={
+            "default": {"BACKEND": "django_redis.cache.RedisCache"},
+        },
+    )
+    def test_shared_cache(self):
+        self.assertEqual(check_capacity_cache(None), [])
+
+    @override_settings(ADAPTIVE_MAX_TASKS=False)
+    def test_adaptive_max_tasks_disabled(self):
+        self.assertEqual(check_capacity_cache(None), [])
@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 import requests_mock
@@ -37,6 +37,30 @@ class RouteTaskTests(TestCase):
         m_test_execute.assert_any_call(task1.id)
         m_test_execute.assert_any_call(task2.id)
 
+    @override_settings(CAMUNDA_BULK_INGESTION=True)
+    @patch("bptl.camunda.tasks.group")
+    @patch("bptl.camunda.tasks.task_execute_and_complete.delay")
+    def test_task_fetch_and_lock_bulk(self, m_test_execute, m_group):
+        task1, task2 = ExternalTaskFactory.create_batch(2, worker_id="aWorkerId")
+
+        with patch(
+            "bptl.camunda.tasks.fetch_and_lock",
+            return_value=("aWorkerId", 2, [task1, task2]),
+        ) as m_fetch_and_lock:
+            result = task_fetch_and_lock()
+
+        self.assertEqual(result, 2)
+        self.assertTrue(m_fetch_and_lock.call_args.kwargs["bulk"])
+        m_test_execute.assert_not_called()
+        m_group.return_value.delay.assert_called_once()
+        signatures = list(m_group.call_args.args[0])
+        self.assertEqual([sig.args for sig in signatures], [(task1.id,), (task2.id,)])
+        for task in (task1, task2):
+            self.assertEqual(
+                list(task.status_logs().values_list("extra_data", flat=True)),
+                [{"status": Statuses.initial}],
+            )
+
     @patch("bptl.camunda.tasks.complete")
     @patch("bptl.camunda.tasks.execute")
     def test_task_execute_and_complete_success(self, m_execute, m_complete):
@@ -7,11 +7,15 @@ https://docs.camunda.org/manual/7.12/reference/rest/external-task/fetch/#example
 
 from unittest.mock import patch
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 import requests_mock
 from django_camunda.models import CamundaConfig
 
+from bptl.tasks.models import BaseTask
+
 from ..models import ExternalTask
 from ..utils import fetch_and_lock
 from .utils import get_fetch_and_lock_response
@@ -56,3 +60,38 @@ class FetchAndLockTests(TestCase):
             fetched_task.variables,
             {"orderId": {"type": "String", "value": "1234", "valueInfo": {}}},
         )
+
+    def test_fetch_bulk(self, m):
+        response = get_fetch_and_lock_response() + get_fetch_and_lock_response(
+            topic="createInvoice"
+        )
+        response[1]["id"] = "anotherExternalTaskId"
+        m.post(
+            "https://some.camunda.com/engine-rest/external-task/fetchAndLock",
+            json=response,
+        )
+
+        with patch("bptl.camunda.utils.get_worker_id", return_value="aWorkerId"):
+            with CaptureQueriesContext(connection) as context:
+                worker_id, amount, tasks = fetch_and_lock(max_tasks=2, bulk=True)
+
+        self.assertEqual(amount, 2)
+        # one insert for the parent rows, one for the child rows
+        inserts = [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith("INSERT")
+        ]
+        self.assertEqual(len(inserts), 2)
+        self.assertTrue(all(task.pk is not None for task in tasks))
+        # the parent rows must resolve to the polymorphic child
+        base_tasks = BaseTask.objects.order_by("pk")
+        self.assertEqual(
+            [task.task_id for task in base_tasks],
+            ["anExternalTaskId", "anotherExternalTaskId"],
+        )
+        self.assertIsInstance(base_tasks[0], ExternalTask)
+        fetched_task = ExternalTask.objects.get(task_id="anotherExternalTaskId")
+        self.assertEqual(fetched_task.worker_id, "aWorkerId")
+        self.assertEqual(fetched_task.topic_name, "createInvoice")
+        self.assertEqual(fetched_task.priority, 4)
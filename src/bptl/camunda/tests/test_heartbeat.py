@@ -0,0 +1,107 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests_mock
+from django_camunda.models import CamundaConfig
+from freezegun import freeze_time
+
+from ..heartbeat import LockHeartbeat, get_heartbeat, track_lock
+from .factories import ExternalTaskFactory
+
+NOW = timezone.make_aware(timezone.datetime(2020, 1, 1, 12))
+
+
+@freeze_time(NOW)
+@requests_mock.Mocker()
+class LockHeartbeatTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        config = CamundaConfig.get_solo()
+        config.root_url = "https://some.camunda.com"
+        config.rest_api_path = "engine-rest/"
+        config.save()
+
+    def test_extend_due_tasks(self, m):
+        due1, due2 = ExternalTaskFactory.create_batch(
+            2, lock_expires_at=NOW + timedelta(minutes=1)
+        )
+        not_due = ExternalTaskFactory.create(lock_expires_at=NOW + timedelta(minutes=9))
+        m.post(requests_mock.ANY, status_code=204)
+        heartbeat = LockHeartbeat()
+        for task in (due1, due2, not_due):
+            heartbeat.add(task)
+
+        extended = heartbeat.beat()
+
+        self.assertEqual(extended, [due1, due2])
+        self.assertEqual(
+            [request.url for request in m.request_history],
+            [
+                f"https://some.camunda.com/engine-rest/external-task/{due1.task_id}/extendLock",
+                f"https://some.camunda.com/engine-rest/external-task/{due2.task_id}/extendLock",
+            ],
+        )
+        self.assertEqual(
+            m.last_request.json(), {"newDuration": 600000, "workerId": due2.worker_id}
+        )
+        for task in (due1, due2):
+            self.assertEqual(task.lock_expires_at, NOW + timedelta(minutes=10))
+            task.refresh_from_db()
+            self.assertEqual(task.lock_expires_at, NOW + timedelta(minutes=10))
+        not_due.refresh_from_db()
+        self.assertEqual(not_due.lock_expires_at, NOW + timedelta(minutes=9))
+
+    def test_stop_tracking_on_error(self, m):
+        task = ExternalTaskFactory.create(lock_expires_at=NOW + timedelta(minutes=1))
+        m.post(requests_mock.ANY, status_code=404)
+        heartbeat = LockHeartbeat()
+        heartbeat.add(task)
+
+        self.assertEqual(heartbeat.beat(), [])
+        self.assertEqual(heartbeat.beat(), [])
+
+        self.assertEqual(m.call_count, 1)
+        task.refresh_from_db()
+        self.assertEqual(task.lock_expires_at, NOW + timedelta(minutes=1))
+
+    def test_track(self, m):
+        task = ExternalTaskFactory.create()
+        heartbeat = LockHeartbeat()
+
+        with patch.object(heartbeat, "start") as m_start:
+            with heartbeat.track(task):
+                self.assertIn(task.pk, heartbeat._tasks)
+
+        m_start.assert_called_once()
+        self.assertNotIn(task.pk, heartbeat._tasks)
+
+
+class TrackLockTests(TestCase):
+    @override_settings(CAMUNDA_LOCK_HEARTBEAT=False)
+    @patch("bptl.camunda.heartbeat.get_heartbeat")
+    def test_disabled(self, m_get_heartbeat):
+        with track_lock(ExternalTaskFactory.build()):
+            pass
+
+        m_get_heartbeat.assert_not_called()
+
+    @override_settings(CAMUNDA_LOCK_HEARTBEAT=True)
+    @patch("bptl.camunda.heartbeat.get_heartbeat")
+    def test_enabled(self, m_get_heartbeat):
+        task = ExternalTaskFactory.build()
+
+        with track_lock(task):
+            pass
+
+        m_get_heartbeat.return_value.track.assert_called_once_with(task)
+
+    def test_heartbeat_per_process(self):
+        heartbeat = get_heartbeat()
+
+        self.assertIs(get_heartbeat(), heartbeat)
+        with patch("bptl.camunda.heartbeat.os.getpid", return_value=-1):
+            self.assertIsNot(get_heartbeat(), heartbeat)
@@ -0,0 +1,129 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from bptl.tasks.tests.factories import TaskMappingFactory
+from bptl.utils.constants import Statuses
+
+from ..inline import InlineExecutor, execute_inline
+from ..tasks import dispatch
+from .factories import ExternalTaskFactory
+
+
+class InlineExecutionTests(TestCase):
+    @patch("bptl.camunda.inline.execute_and_complete")
+    def test_execute_inline(self, m_execute_and_complete):
+        task = ExternalTaskFactory.create()
+
+        execute_inline(task)
+
+        m_execute_and_complete.assert_called_once_with(task)
+        task.refresh_from_db()
+        self.assertEqual(task.status, Statuses.in_progress)
+
+    @patch("bptl.camunda.inline.task_execute_and_complete.apply_async")
+    @patch("bptl.camunda.inline.execute_and_complete")
+    def test_execute_inline_throttled(self, m_execute_and_complete, m_apply_async):
+        task_mapping = TaskMappingFactory.create(
+            topic_name="limited", max_in_flight=1, soft_time_limit=30
+        )
+        ExternalTaskFactory.create(
+            topic_name="limited",
+            status=Statuses.in_progress,
+            lock_expires_at=timezone.now() + timedelta(minutes=5),
+        )
+        task = ExternalTaskFactory.create(topic_name="limited")
+
+        execute_inline(task, task_mapping)
+
+        m_execute_and_complete.assert_not_called()
+        m_apply_async.assert_called_once()
+        self.assertEqual(m_apply_async.call_args.args, ((task.id,),))
+        self.assertEqual(m_apply_async.call_args.kwargs["soft_time_limit"], 30)
+        task.refresh_from_db()
+        self.assertIsNotNone(task.dispatched_at)
+
+    @patch("bptl.camunda.inline.task_execute_and_complete.apply_async")
+    @patch("bptl.camunda.inline.execute_and_complete")
+    def test_execute_inline_already_started(
+        self, m_execute_and_complete, m_apply_async
+    ):
+        task = ExternalTaskFactory.create(status=Statuses.completed)
+
+        execute_inline(task)
+
+        m_execute_and_complete.assert_not_called()
+        m_apply_async.assert_not_called()
+
+
+class InlineExecutorTests(TestCase):
+    def test_bounded(self):
+        executor = InlineExecutor(max_workers=2)
+        self.addCleanup(executor.shutdown)
+        task1, task2, task3 = ExternalTaskFactory.build_batch(3)
+
+        with patch.object(executor._pool, "submit") as m_submit:
+            self.assertTrue(executor.submit(task1))
+            self.assertTrue(executor.submit(task2))
+            self.assertFalse(executor.submit(task3))
+
+        self.assertEqual(m_submit.call_count, 2)
+
+    @patch("bptl.camunda.inline.close_old_connections")
+    @patch("bptl.camunda.inline.execute_inline", side_effect=Exception("boom"))
+    def test_slot_released(self, m_execute_inline, m_close_old_connections):
+        executor = InlineExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        task = ExternalTaskFactory.build()
+
+        with patch.object(executor._pool, "submit") as m_submit:
+            executor.submit(task)
+        # run the submitted work synchronously
+        m_submit.call_args.args[0](*m_submit.call_args.args[1:])
+
+        m_execute_inline.assert_called_once_with(task, None)
+        with patch.object(executor._pool, "submit"):
+            self.assertTrue(executor.submit(task))
+
+    @patch("bptl.camunda.tasks.task_execute_and_complete.delay")
+    def test_dispatch(self, m_delay):
+        task_mapping = TaskMappingFactory.create(topic_name="dummy", inline=True)
+        inline_task = ExternalTaskFactory.create(topic_name="dummy")
+        other_task = ExternalTaskFactory.create(topic_name="other")
+        executor = InlineExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+
+        with patch.object(executor, "submit", return_value=True) as m_submit:
+            dispatch([inline_task, other_task], executor=executor)
+
+        m_submit.assert_called_once_with(inline_task, task_mapping)
+        m_delay.assert_called_once_with(other_task.id)
+        self.assertEqual(inline_task.status_logs().count(), 1)
+
+    @patch("bptl.camunda.tasks.task_execute_and_complete.delay")
+    def test_dispatch_executor_busy(self, m_delay):
+        TaskMappingFactory.create(topic_name="dummy", inline=True)
+        task = ExternalTaskFactory.create(topic_name="dummy")
+        executor = InlineExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+
+        with patch.object(executor, "submit", return_value=False):
+            dispatch([task], executor=executor)
+
+        m_delay.assert_called_once_with(task.id)
+
+    @patch("bptl.camunda.tasks.task_execute_and_complete.apply_async")
+    def test_dispatch_time_limited(self, m_apply_async):
+        TaskMappingFactory.create(topic_name="dummy", inline=True, soft_time_limit=30)
+        task = ExternalTaskFactory.create(topic_name="dummy")
+        executor = InlineExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+
+        with patch.object(executor, "submit", return_value=True) as m_submit:
+            dispatch([task], executor=executor)
+
+        m_submit.assert_not_called()
+        m_apply_async.assert_called_once()
+        self.assertEqual(m_apply_async.call_args.kwargs["soft_time_limit"], 30)
@@ -0,0 +1,153 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+import requests_mock
+from django_camunda.client import get_client
+from django_camunda.models import CamundaConfig
+
+from bptl.tasks.tests.factories import TaskMappingFactory
+
+from ..models import ExternalTask, PollerReplica
+from ..poller import Poller
+from .utils import get_fetch_and_lock_response
+
+
+@requests_mock.Mocker()
+class PollerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        config = CamundaConfig.get_solo()
+        config.root_url = "https://some.camunda.com"
+        config.rest_api_path = "engine-rest/"
+        config.save()
+
+    @patch("bptl.camunda.poller.close_old_connections")
+    @patch("bptl.camunda.poller.dispatch")
+    def test_poll(self, m, m_dispatch, m_close_old_connections):
+        m.post(
+            "https://some.camunda.com/engine-rest/external-task/fetchAndLock",
+            json=get_fetch_and_lock_response(),
+        )
+        poller = Poller(worker_id="aWorkerId", max_tasks=5, long_polling_timeout=10)
+
+        with get_client() as camunda:
+            num_tasks = poller.poll(camunda)
+
+        self.assertEqual(num_tasks, 1)
+        self.assertEqual(
+            m.last_request.json(),
+            {
+                "workerId": "aWorkerId",
+                "maxTasks": 5,
+                "usePriority": True,
+                "topics": [],
+                "asyncResponseTimeout": 10000,
+            },
+        )
+        task = ExternalTask.objects.get()
+        self.assertEqual(task.worker_id, "aWorkerId")
+        m_dispatch.assert_called_once_with([task], executor=None)
+
+    def test_run_until_stopped(self, m):
+        poller = Poller(worker_id="aWorkerId")
+
+        def poll(camunda):
+            if m_poll.call_count == 3:
+                poller.stop()
+            return 0
+
+        with patch.object(poller, "poll", side_effect=poll) as m_poll:
+            poller.run()
+
+        self.assertEqual(m_poll.call_count, 3)
+        # the same session is re-used between polls
+        sessions = {call.args[0].session for call in m_poll.call_args_list}
+        self.assertEqual(len(sessions), 1)
+
+    def test_run_backoff_on_failure(self, m):
+        poller = Poller(worker_id="aWorkerId", max_backoff=5)
+
+        def poll(camunda):
+            if m_poll.call_count == 4:
+                poller.stop()
+                return 0
+            raise Exception("Camunda is down")
+
+        with patch.object(poller, "poll", side_effect=poll) as m_poll:
+            with patch.object(poller._stop_event, "wait") as m_wait:
+                poller.run()
+
+        self.assertEqual(m_poll.call_count, 4)
+        self.assertEqual([call.args[0] for call in m_wait.call_args_list], [2, 4, 5])
+
+    @patch("bptl.camunda.poller.close_old_connections")
+    @patch("bptl.camunda.poller.dispatch")
+    def test_poll_configured_topics(self, m, m_dispatch, m_close_old_connections):
+        TaskMappingFactory.create(topic_name="zaak-initialize")
+        TaskMappingFactory.create(topic_name="set-zaak-status")
+        m.post(
+            "https://some.camunda.com/engine-rest/external-task/fetchAndLock",
+            json=[],
+        )
+        poller = Poller(worker_id="aWorkerId", topics=["zaak-initialize"])
+
+        with get_client() as camunda:
+            poller.poll(camunda)
+
+        self.assertEqual(
+            [topic["topicName"] for topic in m.last_request.json()["topics"]],
+            ["zaak-initialize"],
+        )
+        replica = PollerReplica.objects.get()
+        self.assertEqual(replica.worker_id, "aWorkerId")
+        self.assertEqual(replica.topics, ["zaak-initialize"])
+
+    @override_settings(CAMUNDA_POLLER_SHARDING=True)
+    @patch("bptl.camunda.poller.close_old_connections")
+    def test_poll_no_topics_assigned(self, m, m_close_old_connections):
+        TaskMappingFactory.create(topic_name="zaak-initialize")
+        PollerReplica.objects.create(worker_id="other", topics=["zaak-initialize"])
+        poller = Poller(worker_id="aWorkerId", long_polling_timeout=10)
+
+        with patch.object(poller._stop_event, "wait") as m_wait:
+            with get_client() as camunda:
+                num_tasks = poller.poll(camunda)
+
+        self.assertEqual(num_tasks, 0)
+        self.assertFalse(m.called)
+        m_wait.assert_called_once_with(10)
+
+    @override_settings(CAMUNDA_POLLER_SHARDING=True)
+    def test_run_unregisters(self, m):
+        poller = Poller(worker_id="aWorkerId")
+        PollerReplica.objects.create(worker_id="aWorkerId")
+
+        def poll(camunda):
+            poller.stop()
+            return 0
+
+        with patch.object(poller, "poll", side_effect=poll):
+            poller.run()
+
+        self.assertFalse(PollerReplica.objects.exists())
+
+
+@override_settings(CAMUNDA_POLLER_SHARDING=True, CAMUNDA_POLLER_REPLICA_TIMEOUT=90)
+class RunPollerCommandTests(TestCase):
+    @patch("bptl.camunda.management.commands.run_poller.Poller")
+    def test_timeout_exceeds_replica_timeout(self, m_poller):
+        with self.assertRaises(CommandError):
+            call_command("run_poller", timeout=90)
+
+        m_poller.assert_not_called()
+
+    @patch("bptl.camunda.management.commands.run_poller.Poller")
+    def test_timeout(self, m_poller):
+        call_command("run_poller", timeout=60, stdout=StringIO())
+
+        self.assertEqual(m_poller.call_args.kwargs["long_polling_timeout"], 60)
+        m_poller.return_value.run.assert_called_once_with()
@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from bptl.conf.environ import priority_queues
+from bptl.tasks.tests.factories import TaskMappingFactory
+
+from ..routing import (
+    PriorityQueue,
+    get_execution_options,
+    get_execution_queues,
+    get_priority_queues,
+    get_queue,
+)
+from ..tasks import dispatch
+from .factories import ExternalTaskFactory
+
+
+@override_settings(CAMUNDA_PRIORITY_QUEUES=[(0, "celery"), (100, "celery-high")])
+class PriorityRoutingTests(TestCase):
+    def test_get_priority_queues(self):
+        self.assertEqual(
+            get_priority_queues(),
+            [
+                PriorityQueue(priority=100, queue="celery-high"),
+                PriorityQueue(priority=0, queue="celery"),
+            ],
+        )
+
+    def test_get_queue(self):
+        self.assertEqual(get_queue(200), "celery-high")
+        self.assertEqual(get_queue(100), "celery-high")
+        self.assertEqual(get_queue(99), "celery")
+        self.assertIsNone(get_queue(-1))
+        self.assertIsNone(get_queue(None))
+
+    def test_get_execution_queues(self):
+        self.assertEqual(get_execution_queues(), ["celery", "celery-high"])
+
+    def test_get_execution_options(self):
+        task = ExternalTaskFactory.build(priority=150)
+
+        self.assertEqual(get_execution_options(task), {"queue": "celery-high"})
+
+    @override_settings(CAMUNDA_PRIORITY_QUEUES=[])
+    def test_get_execution_options_not_configured(self):
+        task = ExternalTaskFactory.build(priority=150)
+
+        self.assertEqual(get_execution_options(task), {})
+
+    @patch("bptl.camunda.tasks.task_execute_and_complete.apply_async")
+    def test_dispatch(self, m_apply_async):
+        high = ExternalTaskFactory.create(priority=100)
+        low = ExternalTaskFactory.create(priority=1)
+
+        dispatch([high, low])
+
+        m_apply_async.assert_any_call((high.id,), queue="celery-high")
+        m_apply_async.assert_any_call((low.id,), queue="celery")
+
+    @override_settings(CAMUNDA_BULK_INGESTION=True)
+    @patch("bptl.camunda.tasks.group")
+    def test_dispatch_bulk(self, m_group):
+        high = ExternalTaskFactory.create(priority=100)
+        low = ExternalTaskFactory.create(priority=1)
+
+        dispatch([high, low])
+
+        signatures = list(m_group.call_args.args[0])
+        self.assertEqual(
+            [sig.options for sig in signatures],
+            [{"queue": "celery-high"}, {"queue": "celery"}],
+        )
+
+
+@override_settings(CAMUNDA_PRIORITY_QUEUES=[(0, "celery"), (100, "celery-high")])
+class TopicRoutingTests(TestCase):
+    def test_get_execution_queues(self):
+        TaskMappingFactory.create(topic_name="slow", queue="slow")
+        TaskMappingFactory.create(topic_name="other-slow", queue="slow")
+
+        self.assertEqual(get_execution_queues(), ["celery", "celery-high", "slow"])
+
+    def test_get_execution_options(self):
+        task_mapping = TaskMappingFactory.build(queue="slow", soft_time_limit=60)
+        task = ExternalTaskFactory.build(priority=150)
+
+        self.assertEqual(
+            get_execution_options(task, task_mapping),
+            {"queue": "slow", "soft_time_limit": 60},
+        )
+
+    def test_get_execution_options_priority_fallback(self):
+        task_mapping = TaskMappingFactory.build()
+        task = ExternalTaskFactory.build(priority=150)
+
+        self.assertEqual(
+            get_execution_options(task, task_mapping), {"queue": "celery-high"}
+        )
+
+    @patch("bptl.camunda.tasks.task_execute_and_complete.apply_async")
+    def test_dispatch(self, m_apply_async):
+        TaskMappingFactory.create(topic_name="slow", queue="slow", soft_time_limit=60)
+        slow = ExternalTaskFactory.create(topic_name="slow", priority=100)
+        other = ExternalTaskFactory.create(topic_name="other", priority=100)
+
+        dispatch([slow, other])
+
+        m_apply_async.assert_any_call((slow.id,), queue="slow", soft_time_limit=60)
+        m_apply_async.assert_any_call((other.id,), queue="celery-high")
+
+
+class PriorityQueuesSettingTests(SimpleTestCase):
+    def test_parse(self):
+        self.assertEqual(
+            priority_queues("100:celery-high, 0:celery,-100: celery-low"),
+            [(100, "celery-high"), (0, "celery"), (-100, "celery-low")],
+        )
+        self.assertEqual(priority_queues(""), [])
+
+    def test_invalid(self):
+        for value in ["celery", "high:celery", "100:", "100:celery,celery-low"]:
+            with self.subTest(value=value):
+                with self.assertRaises(ImproperlyConfigured):
+                    priority_queues(value)
@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+
+from ..models import PollerReplica
+from ..sharding import HashRing, assign_topics, get_assigned_topics
+
+NOW = timezone.make_aware(timezone.datetime(2020, 1, 1, 12))
+
+TOPICS = [f"topic-{i}" for i in range(100)]
+
+
+class HashRingTests(TestCase):
+    def test_deterministic(self):
+        ring1 = HashRing(["poller-1", "poller-2", "poller-3"])
+        ring2 = HashRing(["poller-3", "poller-1", "poller-2"])
+
+        for topic in TOPICS:
+            self.assertEqual(ring1.get_node(topic), ring2.get_node(topic))
+
+    def test_spread(self):
+        ring = HashRing(["poller-1", "poller-2", "poller-3"])
+
+        nodes = [ring.get_node(topic) for topic in TOPICS]
+
+        for node in ("poller-1", "poller-2", "poller-3"):
+            self.assertGreater(nodes.count(node), 15)
+
+    def test_join_moves_topics_to_new_node_only(self):
+        before = HashRing(["poller-1", "poller-2"])
+        after = HashRing(["poller-1", "poller-2", "poller-3"])
+
+        for topic in TOPICS:
+            node = after.get_node(topic)
+            if node != "poller-3":
+                self.assertEqual(node, before.get_node(topic))
+
+    def test_empty(self):
+        self.assertIsNone(HashRing([]).get_node("topic"))
+
+
+class AssignTopicsTests(TestCase):
+    def test_assign_topics(self):
+        replicas = [
+            PollerReplica(worker_id="configured", topics=["topic-1", "unknown"]),
+            PollerReplica(worker_id="poller-1"),
+            PollerReplica(worker_id="poller-2"),
+        ]
+
+        assignment = assign_topics(TOPICS, replicas)
+
+        self.assertEqual(assignment["configured"], ["topic-1"])
+        self.assertNotIn("topic-1", assignment["poller-1"] + assignment["poller-2"])
+        self.assertEqual(
+            sorted(assignment["poller-1"] + assignment["poller-2"] + ["topic-1"]),
+            sorted(TOPICS),
+        )
+
+    @override_settings(CAMUNDA_POLLER_SHARDING=True)
+    def test_assign_topics_all_replicas_configured(self):
+        replicas = [
+            PollerReplica(worker_id="poller-1", topics=["topic-1"]),
+            PollerReplica(worker_id="poller-2", topics=["topic-2"]),
+        ]
+
+        assignment = assign_topics(TOPICS, replicas)
+
+        self.assertIn("topic-1", assignment["poller-1"])
+        self.assertIn("topic-2", assignment["poller-2"])
+        self.assertEqual(
+            sorted(assignment["poller-1"] + assignment["poller-2"]), sorted(TOPICS)
+        )
+
+
+@freeze_time(NOW)
+@override_settings(CAMUNDA_POLLER_REPLICA_TIMEOUT=90)
+class GetAssignedTopicsTests(TestCase):
+    def test_register(self):
+        topics = get_assigned_topics("poller-1", TOPICS)
+
+        self.assertEqual(topics, TOPICS)
+        replica = PollerReplica.objects.get()
+        self.assertEqual(replica.worker_id, "poller-1")
+        self.assertEqual(replica.last_seen, NOW)
+
+    def test_rebalance(self):
+        PollerReplica.objects.create(worker_id="poller-2", last_seen=NOW)
+
+        topics = get_assigned_topics("poller-1", TOPICS)
+
+        self.assertLess(len(topics), len(TOPICS))
+        self.assertEqual(
+            topics, assign_topics(TOPICS, list(PollerReplica.objects.all()))["poller-1"]
+        )
+
+        # poller-2 has left
+        PollerReplica.objects.filter(worker_id="poller-2").update(
+            last_seen=NOW - timedelta(seconds=91)
+        )
+
+        self.assertEqual(get_assigned_topics("poller-1", TOPICS), TOPICS)
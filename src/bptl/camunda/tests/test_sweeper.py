@@ -0,0 +1,178 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests_mock
+from django_camunda.models import CamundaConfig
+from freezegun import freeze_time
+
+from bptl.tasks.tests.factories import TaskMappingFactory
+from bptl.utils.constants import Statuses
+
+from ..models import ExternalTask
+from ..sweeper import get_orphaned_tasks, get_pending_tasks, reconcile, sweep
+from .factories import ExternalTaskFactory
+
+NOW = timezone.make_aware(timezone.datetime(2020, 1, 1, 12))
+
+
+@freeze_time(NOW)
+@override_settings(CAMUNDA_SWEEPER_GRACE=5 * 60, CELERY_TASK_SOFT_TIME_LIMIT=30 * 60)
+class StaleTasksTests(TestCase):
+    def test_get_pending_tasks(self):
+        # fetched 6 minutes ago
+        pending = ExternalTaskFactory.create(lock_expires_at=NOW + timedelta(minutes=4))
+        # fetched a minute ago
+        ExternalTaskFactory.create(lock_expires_at=NOW + timedelta(minutes=9))
+        # lock about to expire
+        ExternalTaskFactory.create(lock_expires_at=NOW + timedelta(seconds=30))
+        ExternalTaskFactory.create(
+            status=Statuses.in_progress, lock_expires_at=NOW + timedelta(minutes=4)
+        )
+        # throttled, waiting for its retry
+        ExternalTaskFactory.create(
+            lock_expires_at=NOW + timedelta(minutes=4),
+            dispatched_at=NOW - timedelta(seconds=5),
+        )
+        # scheduled again before the grace period
+        dispatched = ExternalTaskFactory.create(
+            lock_expires_at=NOW + timedelta(minutes=4),
+            dispatched_at=NOW - timedelta(minutes=6),
+        )
+
+        self.assertEqual(
+            list(get_pending_tasks().order_by("pk")), [pending, dispatched]
+        )
+
+    def test_get_orphaned_tasks(self):
+        orphaned = [
+            ExternalTaskFactory.create(
+                status=status, lock_expires_at=NOW - timedelta(minutes=31)
+            )
+            for status in (Statuses.initial, Statuses.in_progress, Statuses.performed)
+        ]
+        ExternalTaskFactory.create(
+            status=Statuses.completed, lock_expires_at=NOW - timedelta(minutes=31)
+        )
+        ExternalTaskFactory.create(
+            status=Statuses.in_progress, lock_expires_at=NOW - timedelta(minutes=29)
+        )
+
+        self.assertEqual(list(get_orphaned_tasks().order_by("pk")), orphaned)
+
+    def test_get_orphaned_tasks_topic_time_limit(self):
+        TaskMappingFactory.create(topic_name="slow", soft_time_limit=60 * 60)
+        orphaned = ExternalTaskFactory.create(
+            status=Statuses.in_progress, lock_expires_at=NOW - timedelta(minutes=61)
+        )
+        # may still be running on a topic with a larger limit
+        ExternalTaskFactory.create(
+            status=Statuses.in_progress, lock_expires_at=NOW - timedelta(minutes=31)
+        )
+
+        self.assertEqual(list(get_orphaned_tasks()), [orphaned])
+
+
+@freeze_time(NOW)
+@requests_mock.Mocker()
+@override_settings(CAMUNDA_SWEEPER_GRACE=5 * 60, CELERY_TASK_SOFT_TIME_LIMIT=30 * 60)
+class SweepTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        config = CamundaConfig.get_solo()
+        config.root_url = "https://some.camunda.com"
+        config.rest_api_path = "engine-rest/"
+        config.save()
+
+    @patch("bptl.camunda.tasks.task_execute_and_complete.apply_async")
+    def test_sweep_redispatch(self, m, m_apply_async):
+        tasks = ExternalTaskFactory.create_batch(
+            3, lock_expires_at=NOW + timedelta(minutes=4)
+        )
+
+        result = sweep(batch_size=2)
+
+        self.assertEqual(result.redispatched, 3)
+        self.assertEqual(
+            [call.args[0] for call in m_apply_async.call_args_list],
+            [(task.id,) for task in tasks],
+        )
+        self.assertFalse(m.called)
+        # not re-dispatched again by the next sweep
+        self.assertEqual(sweep().redispatched, 0)
+
+    def test_sweep_reconcile(self, m):
+        refetched, gone = ExternalTaskFactory.create_batch(
+            2, status=Statuses.in_progress, lock_expires_at=NOW - timedelta(hours=1)
+        )
+        m.post(
+            "https://some.camunda.com/engine-rest/external-task",
+            json=[{"id": refetched.task_id, "workerId": "another-worker"}],
+        )
+
+        result = sweep()
+
+        self.assertEqual(result.superseded, 1)
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(
+            m.last_request.json(),
+            {"externalTaskIdIn": [refetched.task_id, gone.task_id]},
+        )
+        refetched.refresh_from_db()
+        self.assertEqual(refetched.status, Statuses.superseded)
+        self.assertEqual(
+            refetched.execution_error,
+            "The task was orphaned and is fetched again from Camunda.",
+        )
+        self.assertEqual(
+            refetched.status_logs()[0].extra_data, {"status": "superseded"}
+        )
+        gone.refresh_from_db()
+        self.assertEqual(gone.status, Statuses.failed)
+        self.assertEqual(
+            gone.execution_error,
+            "The task was orphaned and no longer exists in Camunda.",
+        )
+        self.assertEqual(gone.status_logs()[0].extra_data, {"status": "failed"})
+
+    def test_reconcile_finished_meanwhile(self, m):
+        task = ExternalTaskFactory.create(
+            status=Statuses.in_progress, lock_expires_at=NOW - timedelta(hours=1)
+        )
+        m.post("https://some.camunda.com/engine-rest/external-task", json=[])
+        # the execution completes the task after it was selected
+        ExternalTask.objects.filter(pk=task.pk).update(status=Statuses.completed)
+
+        reconcile([task])
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, Statuses.completed)
+        self.assertEqual(task.execution_error, "")
+        self.assertFalse(task.status_logs().exists())
+
+    def test_sweep_reconcile_batches(self, m):
+        ExternalTaskFactory.create_batch(
+            3, status=Statuses.initial, lock_expires_at=NOW - timedelta(hours=1)
+        )
+        m.post("https://some.camunda.com/engine-rest/external-task", json=[])
+
+        result = sweep(batch_size=2)
+
+        self.assertEqual(result.failed, 3)
+        self.assertEqual(m.call_count, 2)
+
+    def test_command(self, m):
+        stdout = StringIO()
+
+        call_command("sweep_tasks", stdout=stdout)
+
+        self.assertEqual(
+            stdout.getvalue(),
+            "Re-dispatched 0 task(s), superseded 0 task(s) and failed 0 gone "
+            "task(s).\n",
+        )
@@ -0,0 +1,130 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from celery.exceptions import Retry
+
+from bptl.tasks.tests.factories import TaskMappingFactory
+from bptl.utils.constants import Statuses
+
+from ..models import ExternalTask
+from ..tasks import task_execute_and_complete
+from ..throttling import THROTTLE_MAX_RETRIES, start_task
+from .factories import ExternalTaskFactory
+
+
+def create_running_task(topic_name: str, **kwargs) -> ExternalTask:
+    return ExternalTaskFactory.create(
+        topic_name=topic_name,
+        status=Statuses.in_progress,
+        lock_expires_at=timezone.now() + timedelta(minutes=5),
+        **kwargs,
+    )
+
+
+class ThrottlingTests(TestCase):
+    def test_start_task_no_limit(self):
+        TaskMappingFactory.create(topic_name="unlimited")
+        ExternalTaskFactory.create_batch(
+            3, topic_name="unlimited", status=Statuses.in_progress
+        )
+        task = ExternalTaskFactory.create(topic_name="unlimited")
+
+        self.assertTrue(start_task(task))
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, Statuses.in_progress)
+
+    def test_start_task_below_limit(self):
+        TaskMappingFactory.create(topic_name="limited", max_in_flight=2)
+        create_running_task("limited")
+        ExternalTaskFactory.create(topic_name="limited", status=Statuses.completed)
+        create_running_task("other")
+        task = ExternalTaskFactory.create(topic_name="limited")
+
+        self.assertTrue(start_task(task))
+
+    def test_start_task_limit_reached(self):
+        TaskMappingFactory.create(topic_name="limited", max_in_flight=1)
+        create_running_task("limited")
+        task = ExternalTaskFactory.create(topic_name="limited")
+
+        self.assertFalse(start_task(task))
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, Statuses.initial)
+
+    @patch("bptl.camunda.tasks.execute")
+    def test_task_execute_and_complete_throttled(self, m_execute):
+        TaskMappingFactory.create(topic_name="limited", max_in_flight=1)
+        create_running_task("limited")
+        task = ExternalTaskFactory.create(topic_name="limited")
+
+        with self.assertRaises(Retry):
+            task_execute_and_complete(task.id)
+
+        m_execute.assert_not_called()
+        task.refresh_from_db()
+        self.assertEqual(task.status, Statuses.initial)
+
+    def test_start_task_already_started(self):
+        task = ExternalTaskFactory.create()
+        ExternalTask.objects.filter(pk=task.pk).update(status=Statuses.in_progress)
+
+        self.assertFalse(start_task(task))
+
+        self.assertEqual(task.status, Statuses.in_progress)
+
+    def test_start_task_lock_expired_not_counted(self):
+        TaskMappingFactory.create(topic_name="limited", max_in_flight=1)
+        # left behind by a crashed worker
+        ExternalTaskFactory.create(
+            topic_name="limited",
+            status=Statuses.in_progress,
+            lock_expires_at=timezone.now() - timedelta(minutes=1),
+        )
+        task = ExternalTaskFactory.create(topic_name="limited")
+
+        self.assertTrue(start_task(task))
+
+    def test_start_task_no_limit_no_lock(self):
+        TaskMappingFactory.create(topic_name="unlimited")
+        task = ExternalTaskFactory.create(topic_name="unlimited")
+
+        with self.assertNumQueries(4) as context:
+            self.assertTrue(start_task(task))
+
+        self.assertFalse(
+            any("FOR UPDATE" in query["sql"] for query in context.captured_queries)
+        )
+
+    @patch("bptl.camunda.tasks.execute")
+    def test_task_execute_and_complete_throttled_lock_expired(self, m_execute):
+        TaskMappingFactory.create(topic_name="limited", max_in_flight=1)
+        create_running_task("limited")
+        task = ExternalTaskFactory.create(
+            topic_name="limited", lock_expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        task_execute_and_complete(task.id)
+
+        m_execute.assert_not_called()
+        task.refresh_from_db()
+        self.assertEqual(task.status, Statuses.failed)
+        self.assertEqual(task.logs.get().extra_data, {"status": Statuses.failed})
+
+    @patch("bptl.camunda.tasks.execute")
+    def test_task_execute_and_complete_throttled_max_retries(self, m_execute):
+        TaskMappingFactory.create(topic_name="limited", max_in_flight=1)
+        create_running_task("limited")
+        task = ExternalTaskFactory.create(topic_name="limited")
+
+        task_execute_and_complete.apply(
+            (task.id,), retries=THROTTLE_MAX_RETRIES, throw=True
+        )
+
+        m_execute.assert_not_called()
+        task.refresh_from_db()
+        self.assertEqual(task.status, Statuses.failed)
@@ -0,0 +1,164 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase
+
+import requests_mock
+from django_camunda.models import CamundaConfig
+
+from bptl.tasks.registry import WorkUnitRegistry
+from bptl.tasks.tests.factories import TaskMappingFactory
+
+from ..models import ExternalTask
+from ..utils import fetch_and_lock, get_required_variables
+from ..variables import OnDemandVariables
+from .factories import ExternalTaskFactory
+from .utils import get_fetch_and_lock_response
+
+# isolated registry for tests
+register = WorkUnitRegistry()
+
+
+@register
+@register.require_variables("zaakUrl")
+def declared(task):
+    pass
+
+
+@register
+def undeclared(task):
+    pass
+
+
+DECLARED = f"{declared.__module__}.{declared.__qualname__}"
+UNDECLARED = f"{undeclared.__module__}.{undeclared.__qualname__}"
+
+
+class OnDemandVariablesTests(SimpleTestCase):
+    def test_fetched_variables(self):
+        fetch = MagicMock()
+        variables = OnDemandVariables({"zaakUrl": "https://zaak"}, fetch=fetch)
+
+        self.assertEqual(variables["zaakUrl"], "https://zaak")
+        self.assertEqual(variables.get("zaakUrl"), "https://zaak")
+        self.assertIn("zaakUrl", variables)
+        fetch.assert_not_called()
+
+    def test_fetch_on_demand(self):
+        fetch = MagicMock(return_value={"zaakUrl": "stale", "zaaktype": "https://type"})
+        variables = OnDemandVariables({"zaakUrl": "https://zaak"}, fetch=fetch)
+
+        self.assertEqual(variables["zaaktype"], "https://type")
+        self.assertIsNone(variables.get("other"))
+        self.assertNotIn("other", variables)
+        with self.assertRaises(KeyError):
+            variables["other"]
+
+        fetch.assert_called_once_with()
+        self.assertEqual(variables["zaakUrl"], "https://zaak")
+
+
+@patch("bptl.camunda.utils.register", new=register)
+@requests_mock.Mocker()
+class FilteredFetchAndLockTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        config = CamundaConfig.get_solo()
+        config.root_url = "https://some.camunda.com"
+        config.rest_api_path = "engine-rest/"
+        config.save()
+
+    def test_get_required_variables(self, m):
+        self.assertEqual(
+            get_required_variables(DECLARED), ["bptlAppId", "callbackUrl", "zaakUrl"]
+        )
+        self.assertIsNone(get_required_variables(UNDECLARED))
+        self.assertIsNone(get_required_variables("unknown.callback"))
+
+    def test_fetch_and_lock(self, m):
+        TaskMappingFactory.create(topic_name="declared", callback=DECLARED)
+        TaskMappingFactory.create(topic_name="undeclared", callback=UNDECLARED)
+        m.post(
+            "https://some.camunda.com/engine-rest/external-task/fetchAndLock",
+            json=get_fetch_and_lock_response(topic="declared"),
+        )
+
+        fetch_and_lock(max_tasks=1)
+
+        topics = sorted(m.last_request.json()["topics"], key=lambda t: t["topicName"])
+        self.assertEqual(
+            topics,
+            [
+                {
+                    "topicName": "declared",
+                    "lockDuration": 600000,
+                    "variables": ["bptlAppId", "callbackUrl", "zaakUrl"],
+                },
+                {"topicName": "undeclared", "lockDuration": 600000},
+            ],
+        )
+        task = ExternalTask.objects.get()
+        self.assertTrue(task.variables_filtered)
+        self.assertEqual(task.execution_id, "anExecutionId")
+
+    def test_get_variables_on_demand(self, m):
+        task = ExternalTaskFactory.create(
+            instance_id="aProcessInstanceId",
+            execution_id="anExecutionId",
+            variables={"zaakUrl": {"type": "String", "value": "https://zaak"}},
+            variables_filtered=True,
+        )
+        m.post(
+            "https://some.camunda.com/engine-rest/variable-instance",
+            json=[
+                {
+                    "name": "element",
+                    "type": "String",
+                    "value": "local",
+                    "executionId": "anExecutionId",
+                },
+                {
+                    "name": "element",
+                    "type": "String",
+                    "value": "root",
+                    "executionId": "aProcessInstanceId",
+                },
+                {
+                    "name": "zaaktype",
+                    "type": "String",
+                    "value": "https://type",
+                    "executionId": "aProcessInstanceId",
+                },
+            ],
+        )
+
+        variables = task.get_variables()
+
+        self.assertEqual(variables["zaakUrl"], "https://zaak")
+        self.assertFalse(m.called)
+        self.assertEqual(variables["zaaktype"], "https://type")
+        self.assertEqual(variables["element"], "local")
+        self.assertEqual(
+            m.last_request.json(),
+            {
+                "processInstanceIdIn": ["aProcessInstanceId"],
+                "executionIdIn": ["aProcessInstanceId", "anExecutionId"],
+            },
+        )
+
+    def test_get_variables_on_demand_without_execution(self, m):
+        task = ExternalTaskFactory.create(
+            instance_id="aProcessInstanceId", execution_id="", variables_filtered=True
+        )
+        m.get(
+            "https://some.camunda.com/engine-rest/process-instance/aProcessInstanceId/variables",
+            json={"zaaktype": {"type": "String", "value": "https://type"}},
+        )
+
+        self.assertEqual(task.get_variables()["zaaktype"], "https://type")
+
+    def test_get_variables_unfiltered(self, m):
+        task = ExternalTaskFactory.create(variables={})
+
+        self.assertIsNone(task.get_variables().get("zaaktype"))
+        self.assertFalse(m.called)
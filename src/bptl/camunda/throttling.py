@@ -0,0 +1,75 @@
+"""
+Limit the number of concurrently executing tasks per topic.
+
+The ``max_in_flight`` of a task mapping protects slow or fragile downstream services
+from being flooded when many tasks of the same topic are fetched at once. Tasks over
+the limit are not failed, but put back on the queue to be retried later - until their
+lock expires, after which Camunda hands them to another worker.
+"""
+
+from django.db import transaction
+from django.utils import timezone
+
+from bptl.tasks.models import BaseTask, TaskMapping
+from bptl.tasks.status_counts import log_status
+from bptl.utils.constants import Statuses
+
+from .models import ExternalTask
+from .utils import LOCK_DURATION
+
+# seconds to wait before retrying a task that was throttled, and the number of retries
+# after which its lock has expired
+THROTTLE_COUNTDOWN = 5
+THROTTLE_MAX_RETRIES = LOCK_DURATION // THROTTLE_COUNTDOWN
+
+
+@transaction.atomic
+def start_task(task: ExternalTask) -> bool:
+    """
+    Mark ``task`` as in progress, unless the limit of its topic is reached.
+
+    If the topic has a limit, its task mapping row is locked while counting, so
+    concurrent workers can't both take the last slot. A slot is freed as soon as a task
+    leaves the in progress status, or its lock expires (e.g. when its worker crashed).
+
+    The task is only started if it still has the initial status, so it is never
+    executed twice if its execution was scheduled more than once. In that case,
+    ``task.status`` is updated to the current status.
+    """
+    task_mappings = TaskMapping.objects.filter(topic_name=task.topic_name)
+    max_in_flight = task_mappings.values_list("max_in_flight", flat=True).first()
+    if max_in_flight:
+        list(task_mappings.select_for_update().values_list("pk", flat=True))
+        in_flight = ExternalTask.objects.filter(
+            topic_name=task.topic_name,
+            status=Statuses.in_progress,
+            lock_expires_at__gt=timezone.now(),
+        ).count()
+        if in_flight >= max_in_flight:
+            return False
+
+    started = BaseTask.objects.filter(pk=task.pk, status=Statuses.initial).update(
+        status=Statuses.in_progress
+    )
+    if not started:
+        task.refresh_from_db(fields=["status"])
+        return False
+    task.status = Statuses.in_progress
+    return True
+
+
+def give_up(task: ExternalTask) -> bool:
+    """
+    Mark a throttled ``task`` whose lock expired as failed.
+
+    Camunda hands the task to another worker after its lock expired, so it must no
+    longer be executed here. Returns whether the task still had the initial status.
+    """
+    failed = BaseTask.objects.filter(pk=task.pk, status=Statuses.initial).update(
+        status=Statuses.failed,
+        execution_error="The lock expired while the topic had reached its limit.",
+    )
+    task.refresh_from_db(fields=["status", "execution_error"])
+    if failed:
+        log_status(task)
+    return bool(failed)
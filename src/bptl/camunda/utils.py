@@ -6,14 +6,18 @@ import json
 import logging
 from typing import List, Optional, Tuple, Union
 
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+
 import requests
 from dateutil import parser
-from django_camunda.client import get_client
+from django_camunda.client import Camunda, get_client
 from django_camunda.utils import serialize_variable
 from timeline_logger.models import TimelineLog
 
 from bptl.tasks.constants import EngineTypes
-from bptl.tasks.models import TaskMapping
+from bptl.tasks.models import BaseTask, TaskMapping
+from bptl.tasks.registry import register
 from bptl.utils.decorators import retry
 from bptl.utils.typing import Object, ProcessVariables
 
@@ -22,29 +26,72 @@ from .models import ExternalTask, get_worker_id
 logger = logging.getLogger(__name__)
 
 LOCK_DURATION = 60 * 10  # 10 minutes
+# variables used by BPTL itself rather than the work units, fetched for every task
+COMMON_VARIABLES = ["bptlAppId", "callbackUrl"]
+
 
+def get_required_variables(callback: str) -> Optional[List[str]]:
+    """
+    Return the names of the variables to fetch for the tasks of a callback.
 
-def fetch_and_lock(max_tasks: int, long_polling_timeout=None) -> Tuple[str, int, list]:
+    Returns ``None`` if the work unit doesn't declare its variables, in which case all
+    variables are fetched.
+    """
+    try:
+        required_variables = register[callback].required_variables
+    except KeyError:
+        return None
+    if required_variables is None:
+        return None
+    return list(dict.fromkeys(COMMON_VARIABLES + required_variables))
+
+
+def fetch_and_lock(
+    max_tasks: int,
+    long_polling_timeout=None,
+    bulk: bool = False,
+    worker_id: Optional[str] = None,
+    client: Optional[Camunda] = None,
+    topics: Optional[List[str]] = None,
+) -> Tuple[str, int, list]:
     """
     Fetch and lock a number of external tasks.
     API reference: https://docs.camunda.org/manual/7.12/reference/rest/external-task/fetch/
+
+    :param bulk: persist all fetched tasks in a fixed number of queries rather than
+      one insert per task, see :func:`bulk_create_external_tasks`.
+    :param worker_id: the worker ID to lock the tasks with. A new one is generated if
+      not provided.
+    :param client: an (open) Camunda client to re-use, e.g. to keep the HTTP session
+      alive between polls.
+    :param topics: restrict the fetch to these topics, e.g. the shard of a poller
+      replica. Inactive or unknown topics are ignored.
     """
-    camunda = get_client()
+    camunda = client or get_client()
 
     # Fetch the topics that are known (and active!) in this configured instance only
     mappings = TaskMapping.objects.filter(active=True, engine_type=EngineTypes.camunda)
-    topics = [
-        {
+    if topics is not None:
+        mappings = mappings.filter(topic_name__in=topics)
+    topics = []
+    filtered_topics = set()
+    for mapping in mappings:
+        topic = {
             "topicName": mapping.topic_name,
             "lockDuration": LOCK_DURATION * 1000,  # API expects miliseconds
         }
-        for mapping in mappings
-    ]
+        variables = get_required_variables(mapping.callback)
+        if variables is not None:
+            topic["variables"] = variables
+            filtered_topics.add(mapping.topic_name)
+        topics.append(topic)
 
-    worker_id = get_worker_id()
+    worker_id = worker_id or get_worker_id()
     body = {
         "workerId": worker_id,
         "maxTasks": max_tasks,
+        # fetch tasks with a higher priority first
+        "usePriority": True,
         "topics": topics,
     }
     if long_polling_timeout:
@@ -54,23 +101,70 @@ def fetch_and_lock(max_tasks: int, long_polling_timeout=None) -> Tuple[str, int,
         "external-task/fetchAndLock", method="POST", json=body
     )
 
-    fetched = []
-    for task in external_tasks:
-        fetched.append(
-            ExternalTask.objects.create(
-                worker_id=worker_id,
-                topic_name=task["topic_name"],
-                priority=task["priority"],
-                task_id=task["id"],
-                instance_id=task["process_instance_id"],
-                lock_expires_at=parser.parse(task["lock_expiration_time"]),
-                variables=task["variables"],
-            )
+    fetched = [
+        ExternalTask(
+            worker_id=worker_id,
+            topic_name=task["topic_name"],
+            priority=task["priority"],
+            task_id=task["id"],
+            instance_id=task["process_instance_id"],
+            execution_id=task["execution_id"],
+            lock_expires_at=parser.parse(task["lock_expiration_time"]),
+            variables=task["variables"],
+            variables_filtered=task["topic_name"] in filtered_topics,
         )
+        for task in external_tasks
+    ]
+    if bulk:
+        bulk_create_external_tasks(fetched)
+    else:
+        for task in fetched:
+            task.save()
 
     return (worker_id, len(fetched), fetched)
 
 
+@transaction.atomic
+def bulk_create_external_tasks(tasks: List[ExternalTask]) -> List[ExternalTask]:
+    """
+    Insert unsaved external tasks with a constant number of queries.
+
+    Django does not support ``bulk_create`` for multi-table inherited models, so the
+    :class:`BaseTask` parent rows are inserted first (Postgres returns their primary
+    keys), after which the :class:`ExternalTask` child rows are inserted in a single
+    statement pointing to their parents.
+    """
+    if not tasks:
+        return tasks
+
+    ctype = ContentType.objects.get_for_model(ExternalTask, for_concrete_model=False)
+    parent_fields = [
+        field.attname
+        for field in BaseTask._meta.concrete_fields
+        if not field.primary_key
+    ]
+    for task in tasks:
+        task.polymorphic_ctype = ctype
+
+    parents = BaseTask.objects.non_polymorphic().bulk_create(
+        [
+            BaseTask(**{attname: getattr(task, attname) for attname in parent_fields})
+            for task in tasks
+        ]
+    )
+    for task, parent in zip(tasks, parents):
+        task.id = task.basetask_ptr_id = parent.id
+
+    using = parents[0]._state.db
+    ExternalTask._base_manager._insert(
+        tasks, fields=ExternalTask._meta.local_concrete_fields, using=using
+    )
+    for task in tasks:
+        task._state.adding = False
+        task._state.db = using
+    return tasks
+
+
 def fail_retried_complete(
     exception: Exception,
     task: ExternalTask,
@@ -0,0 +1,81 @@
+"""
+Process variables of external tasks that were fetched with a variable filter.
+"""
+
+from typing import Any, Callable, Dict
+
+from django_camunda.api import get_all_process_instance_variables
+from django_camunda.client import get_client
+from django_camunda.utils import deserialize_variable
+
+
+class OnDemandVariables(dict):
+    """
+    Process variables that retrieve the remaining variables on a lookup miss.
+
+    Looking up a variable by name that was not fetched with the task (``[]``,
+    ``get`` or ``in``) retrieves all variables once, so work units that read more
+    variables than they declared keep working. Iterating only covers the fetched
+    variables.
+
+    :param variables: the (deserialized) variables fetched with the task.
+    :param fetch: callable returning all (deserialized) variables.
+    """
+
+    def __init__(self, variables: Dict[str, Any], fetch: Callable[[], Dict[str, Any]]):
+        super().__init__(variables)
+        self._fetch = fetch
+        self._complete = False
+
+    def _load(self) -> None:
+        if self._complete:
+            return
+        self._complete = True
+        for name, value in self._fetch().items():
+            # the fetched variables are as recent as the task
+            self.setdefault(name, value)
+
+    def __missing__(self, name: str):
+        self._load()
+        if not super().__contains__(name):
+            raise KeyError(name)
+        return super().__getitem__(name)
+
+    def __contains__(self, name) -> bool:
+        if not super().__contains__(name):
+            self._load()
+        return super().__contains__(name)
+
+    def get(self, name: str, default=None):
+        if not super().__contains__(name):
+            self._load()
+        return super().get(name, default)
+
+
+def get_execution_variables(instance_id: str, execution_id: str) -> Dict[str, Any]:
+    """
+    Retrieve the (deserialized) variables that are visible to an execution.
+
+    These are the variables of the process instance, overridden by the local
+    variables of the execution, e.g. the element of a multi-instance activity. Tasks
+    fetched before the execution was recorded fall back to the process instance
+    variables.
+    """
+    if not execution_id:
+        return get_all_process_instance_variables(instance_id)
+
+    client = get_client()
+    instances = client.post(
+        "variable-instance",
+        params={"deserializeValues": "false"},
+        json={
+            "processInstanceIdIn": [instance_id],
+            "executionIdIn": [instance_id, execution_id],
+        },
+        underscoreize=False,
+    )
+    # the local variables of the execution take precedence
+    instances = sorted(
+        instances, key=lambda instance: instance["executionId"] == execution_id
+    )
+    return {instance["name"]: deserialize_variable(instance) for instance in instances}
@@ -11,7 +11,7 @@ try:
 except ImportError:  # no celery in this proejct
     celery = None
 
-from .environ import config
+from .environ import config, priority_queues
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 DJANGO_PROJECT_DIR = os.path.abspath(
@@ -468,6 +468,10 @@ CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 #     },
 # }
 
+# consume multiple queues in the order they are given to the worker (-Q), which is
+# needed for the priority queues
+CELERY_BROKER_TRANSPORT_OPTIONS = {"queue_order_strategy": "priority"}
+
 CELERY_TASK_ACKS_LATE = True
 # ensure that no tasks are scheduled to a worker that may be running a long-poll
 # TODO: use different queues for long-poll workers
@@ -483,6 +487,17 @@ CELERY_ONCE = {
 
 # project application settings
 MAX_TASKS = 10
+# map Camunda task priorities to execution queues, e.g. "100:celery-high,0:celery"
+CAMUNDA_PRIORITY_QUEUES = config(
+    "CAMUNDA_PRIORITY_QUEUES", default="", cast=priority_queues
+)
+# derive the number of tasks to fetch from the execution queue depth, free worker slots
+# and recent execution times instead of using MAX_TASKS
+ADAPTIVE_MAX_TASKS = config("ADAPTIVE_MAX_TASKS", default=False)
+ADAPTIVE_MAX_TASKS_LIMIT = config("ADAPTIVE_MAX_TASKS_LIMIT", default=100)
+# the cache the workers share their execution times and slots with the poller through,
+# must be shared between the processes
+CAMUNDA_CAPACITY_CACHE_ALIAS = config("CAMUNDA_CAPACITY_CACHE_ALIAS", default="default")
 ZGW_CONSUMERS_CLIENT_CLASS = "bptl.work_units.zgw.client.ZGWClient"
 ZGW_CONSUMERS_TEST_SCHEMA_DIRS = [
     os.path.join(DJANGO_PROJECT_DIR, "work_units", "zgw", "tests", "schemas"),
@@ -490,6 +505,72 @@ ZGW_CONSUMERS_TEST_SCHEMA_DIRS = [
 
 
 LONG_POLLING_TIMEOUT_MINUTES = config("LONG_POLLING_TIMEOUT_MINUTES", default=10)
+# persist fetched tasks and their initial logs with batched queries and dispatch the
+# execution messages as a single celery group
+CAMUNDA_BULK_INGESTION = config("CAMUNDA_BULK_INGESTION", default=False)
+# extend the locks of running external tasks in the background before they expire
+CAMUNDA_LOCK_HEARTBEAT = config("CAMUNDA_LOCK_HEARTBEAT", default=False)
+# divide the topics among the running poller replicas
+CAMUNDA_POLLER_SHARDING = config("CAMUNDA_POLLER_SHARDING", default=False)
+# seconds after which a poller replica that hasn't polled is considered gone
+CAMUNDA_POLLER_REPLICA_TIMEOUT = config("CAMUNDA_POLLER_REPLICA_TIMEOUT", default=90)
+# number of threads of the Camunda poller to execute the tasks of inline topics with
+CAMUNDA_POLLER_INLINE_WORKERS = config("CAMUNDA_POLLER_INLINE_WORKERS", default=4)
+# seconds after fetching before a task that has not been started is re-dispatched by
+# the sweeper
+CAMUNDA_SWEEPER_GRACE = config("CAMUNDA_SWEEPER_GRACE", default=5 * 60)
+# seconds the auth headers of an application are cached, at most until their token
+# expires
+CREDENTIALS_CACHE_TIMEOUT = config("CREDENTIALS_CACHE_TIMEOUT", default=5 * 60)
+# number of kept-alive connections per service, and the number of retries of idempotent
+# requests on connection errors and 502/503/504 responses
+HTTP_POOL_MAXSIZE = config("HTTP_POOL_MAXSIZE", default=10)
+HTTP_POOL_RETRIES = config("HTTP_POOL_RETRIES", default=2)
+# directory to persist the compiled OAS schemas in, so new processes don't parse them
+OAS_INDEX_CACHE_DIR = config("OAS_INDEX_CACHE_DIR", default="")
+# cache the resources retrieved from the ZGW APIs, revalidated with their ETag. Entries
+# are kept ZGW_HTTP_CACHE_TIMEOUT seconds, and served without revalidation for the TTL
+# of their collection
+ZGW_HTTP_CACHE = config("ZGW_HTTP_CACHE", default=False)
+ZGW_HTTP_CACHE_ALIAS = config("ZGW_HTTP_CACHE_ALIAS", default="default")
+ZGW_HTTP_CACHE_TIMEOUT = config("ZGW_HTTP_CACHE_TIMEOUT", default=60 * 60)
+ZGW_HTTP_CACHE_CATALOGI_TTL = config("ZGW_HTTP_CACHE_CATALOGI_TTL", default=5 * 60)
+ZGW_HTTP_CACHE_TTLS = {
+    collection: ZGW_HTTP_CACHE_CATALOGI_TTL
+    for collection in (
+        "catalogussen",
+        "zaaktypen",
+        "statustypen",
+        "resultaattypen",
+        "roltypen",
+        "eigenschappen",
+        "informatieobjecttypen",
+        "besluittypen",
+    )
+}
+# seconds the catalogi metadata looked up by the work units is cached in the
+# ZTC_CACHE_ALIAS cache, 0 disables the cache
+ZTC_CACHE_TIMEOUT = config("ZTC_CACHE_TIMEOUT", default=0)
+ZTC_CACHE_ALIAS = config("ZTC_CACHE_ALIAS", default="default")
+# number of request logs of a task execution written to the timeline per query, 0
+# writes them one by one
+TIMELINE_LOG_BATCH_SIZE = config("TIMELINE_LOG_BATCH_SIZE", default=100)
+# what is captured of the requests of the work units by default, see
+# bptl.work_units.capture. Bodies over REQUEST_LOG_COMPRESS_THRESHOLD bytes are stored
+# compressed, 0 disables the compression
+REQUEST_LOG_PAYLOADS = config("REQUEST_LOG_PAYLOADS", default="full")
+REQUEST_LOG_SAMPLE_RATE = config("REQUEST_LOG_SAMPLE_RATE", default=100)
+REQUEST_LOG_MAX_BODY_SIZE = config("REQUEST_LOG_MAX_BODY_SIZE", default=4 * 1024)
+REQUEST_LOG_COMPRESS_THRESHOLD = config(
+    "REQUEST_LOG_COMPRESS_THRESHOLD", default=64 * 1024
+)
+# days after which the tasks with a status are removed, e.g. "completed:30,failed:90",
+# and the directory to archive the removed tasks to
+TASK_RETENTION = config("TASK_RETENTION", default="", split=True)
+TASK_RETENTION_ARCHIVE_DIR = config("TASK_RETENTION_ARCHIVE_DIR", default="")
+# number of tasks up to which the task list counts them, above it shows the estimate of
+# the query planner
+TASK_LIST_COUNT_LIMIT = config("TASK_LIST_COUNT_LIMIT", default=10000)
 
 # api settings
 REST_FRAMEWORK = {
@@ -37,9 +37,15 @@ MANAGERS = ADMINS
 # See https://docs.djangoproject.com/en/1.5/ref/settings/#allowed-hosts
 ALLOWED_HOSTS = getenv("ALLOWED_HOSTS", "*", split=True)
 
+# the caches are shared between the web, poller and celery worker processes
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": getenv("CACHE_LOCATION", "redis://redis:6379/1"),
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
     },
     # https://github.com/jazzband/django-axes/blob/master/docs/configuration.rst#cache-problems
     "axes_cache": {
@@ -69,18 +75,6 @@ if subpath:
 #         'INDEX_NAME': 'bptl',
 #     },
 # }
-#
-# # Caching
-# CACHES = {
-#     'default': {
-#         'BACKEND': 'django_redis.cache.RedisCache',
-#         'LOCATION': getenv('CACHE_LOCATION', 'redis://redis:6379/1'),
-#         'OPTIONS': {
-#             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-#             'IGNORE_EXCEPTIONS': True,
-#         }
-#     }
-# }
 
 #
 # Additional Django settings
@@ -1,3 +1,7 @@
+from typing import List, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+
 from decouple import Csv, config as _config, undefined
 
 
@@ -9,3 +13,23 @@ def config(option: str, default=undefined, *args, **kwargs):
     if default is not undefined and default is not None:
         kwargs.setdefault("cast", type(default))
     return _config(option, default=default, *args, **kwargs)
+
+
+def priority_queues(value: str) -> List[Tuple[int, str]]:
+    """
+    Parse comma separated ``<minimum priority>:<queue>`` tiers, e.g.
+    ``100:celery-high,0:celery``.
+    """
+    tiers = []
+    for tier in Csv()(value):
+        priority, _, queue = tier.partition(":")
+        try:
+            priority = int(priority)
+        except ValueError:
+            priority = None
+        if priority is None or not queue.strip():
+            raise ImproperlyConfigured(
+                f"Invalid priority queue {tier!r}, expected '<minimum priority>:<queue>'"
+            )
+        tiers.append((priority, queue.strip()))
+    return tiers
@@ -2,32 +2,50 @@ from typing import Dict
 
 from zgw_consumers.models import Service
 
+from .cache import credentials_cache
 from .models import AppServiceCredentials
 
 
 def get_credentials(app_id: str, *services: Service) -> Dict[Service, Dict[str, str]]:
+    """
+    Return the auth headers of the application ``app_id`` for each of ``services``.
+
+    The credentials configured for the application take precedence over the
+    credentials of the service itself. The headers are cached per application and
+    service, see :mod:`bptl.credentials.cache`.
+    """
+    # process variables may hold other values than app IDs, which are looked up anyway
+    cacheable = isinstance(app_id, str)
+
+    result = {}
+    missing = []
+    for service in services:
+        headers = credentials_cache.get(app_id, service.pk) if cacheable else None
+        if headers is None:
+            missing.append(service)
+        else:
+            result[service] = headers
+
+    if not missing:
+        return result
+
     credentials = AppServiceCredentials.objects.select_related("service").filter(
-        app__app_id=app_id, service__in=services
+        app__app_id=app_id, service__in=missing
     )
+    # explicit overrides defaults
     explicit = {
         app_creds.service: app_creds.get_auth_headers() for app_creds in credentials
     }
 
-    # explicit overrides defaults
-    # Generate auth headers from service configuration
-    default = {}
-    for service in services:
-        if service not in explicit:
-            client = service.build_client()
-            # Extract auth header from the client's auth (ape_pie.APIClient)
-            if hasattr(client, "auth") and client.auth:
-                # For ZGW auth, we need to trigger token generation
-                from requests import PreparedRequest
-
-                req = PreparedRequest()
-                req.headers = {}
-                client.auth(req)
-                default[service] = dict(req.headers)
-            else:
-                default[service] = {}
-    return {**default, **explicit}
+    for service in missing:
+        if service in explicit:
+            headers = explicit[service]
+        else:
+            # Generate auth headers from service configuration
+            headers = service.build_client().auth_header
+        if cacheable:
+            credentials_cache.set(
+                app_id, service.pk, headers, valid_for=service.jwt_valid_for
+            )
+        result[service] = dict(headers)
+    return result
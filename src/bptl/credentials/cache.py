@@ -0,0 +1,94 @@
+"""
+Cache the auth headers of the applications per service.
+
+Generating the auth headers takes a database query and, for ZGW services, signing a
+JWT. The headers are cached in the process and reused until shortly before the token
+expires: at its ``exp`` claim or, for tokens without one, ``jwt_valid_for`` seconds of
+the service after its ``iat`` claim. Saving or deleting credentials or services clears the affected entries in the
+current process, other processes pick up the changes within
+``CREDENTIALS_CACHE_TIMEOUT`` seconds.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+import jwt
+
+# seconds before the expiry of a token to stop using it
+EXPIRY_MARGIN = 60
+
+CacheKey = Tuple[str, int]
+
+
+def get_expiry(
+    headers: Dict[str, str], valid_for: Optional[int] = None
+) -> Optional[float]:
+    """
+    Return the expiry timestamp of the bearer token in ``headers``, if any.
+
+    :param valid_for: the validity of the token in seconds, for tokens that are only
+      issued with an ``iat`` claim.
+    """
+    scheme, _, token = headers.get("Authorization", "").partition(" ")
+    if scheme != "Bearer" or not token:
+        return None
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+    if "exp" in claims:
+        return claims["exp"]
+    if "iat" in claims and valid_for is not None:
+        return claims["iat"] + valid_for
+    return None
+
+
+class CredentialsCache:
+    """
+    Thread-safe cache of auth headers, keyed by app ID and service ID.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[CacheKey, Tuple[Dict[str, str], float]] = {}
+
+    def get(self, app_id: str, service_id: int) -> Optional[Dict[str, str]]:
+        with self._lock:
+            entry = self._entries.get((app_id, service_id))
+        if entry is None:
+            return None
+        headers, valid_until = entry
+        if time.time() >= valid_until:
+            return None
+        return dict(headers)
+
+    def set(
+        self,
+        app_id: str,
+        service_id: int,
+        headers: Dict[str, str],
+        valid_for: Optional[int] = None,
+    ) -> None:
+        valid_until = time.time() + settings.CREDENTIALS_CACHE_TIMEOUT
+        expiry = get_expiry(headers, valid_for=valid_for)
+        if expiry is not None:
+            valid_until = min(valid_until, expiry - EXPIRY_MARGIN)
+        with self._lock:
+            self._entries[(app_id, service_id)] = (dict(headers), valid_until)
+
+    def invalidate(self, service_id: Optional[int] = None) -> None:
+        """
+        Remove the entries of a service, or all entries.
+        """
+        with self._lock:
+            if service_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[1] == service_id]:
+                del self._entries[key]
+
+
+credentials_cache = CredentialsCache()
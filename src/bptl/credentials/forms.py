@@ -4,10 +4,10 @@ from django import forms
 from django.db.models import BLANK_CHOICE_DASH
 from django.utils.translation import gettext_lazy as _
 
-from zgw_consumers.concurrent import parallel
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
 
+from bptl.utils.concurrent import parallel
 from bptl.work_units.zgw.utils import get_paginated_results
 
 from .models import App
@@ -1,3 +1,4 @@
+import copy
 import logging
 from typing import Dict
 
@@ -113,31 +114,14 @@ class AppServiceCredentials(models.Model):
                 logger.warning("Unknown service auth_type specified: %s", auth_type)
 
     def get_auth_headers(self) -> Dict[str, str]:
-        old_values = (
-            self.service.client_id,
-            self.service.secret,
-            self.service.header_key,
-            self.service.header_value,
-        )
-
-        # overwrite the python object service. so those attributes are used in credential
-        # generation
-        if self.service.auth_type == AuthTypes.zgw:
-            self.service.client_id = self.client_id
-            self.service.secret = self.secret
-        elif self.service.auth_type == AuthTypes.api_key:
-            self.service.header_key = self.header_key
-            self.service.header_value = self.header_value
-
-        _client = self.service.build_client()
-        auth_header = _client.auth_header
-
-        # restore the possible direct-service-configured credentials
-        (
-            self.service.client_id,
-            self.service.secret,
-            self.service.header_key,
-            self.service.header_value,
-        ) = old_values
-
-        return auth_header
+        # generate the headers with a copy of the service, so the (possibly shared)
+        # service instance keeps its own credentials
+        service = copy.copy(self.service)
+        if service.auth_type == AuthTypes.zgw:
+            service.client_id = self.client_id
+            service.secret = self.secret
+        elif service.auth_type == AuthTypes.api_key:
+            service.header_key = self.header_key
+            service.header_value = self.header_value
+
+        return service.build_client().auth_header
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from zgw_consumers.models import Service
+
+from .cache import credentials_cache
+from .models import App, AppServiceCredentials
+
+
+@receiver([post_save, post_delete], sender=AppServiceCredentials)
+def clear_credentials_cache(sender, instance, **kwargs):
+    credentials_cache.invalidate(service_id=instance.service_id)
+
+
+@receiver([post_save, post_delete], sender=Service)
+def clear_service_credentials_cache(sender, instance, **kwargs):
+    credentials_cache.invalidate(service_id=instance.pk)
+
+
+@receiver([post_save, post_delete], sender=App)
+def clear_app_credentials_cache(sender, instance, **kwargs):
+    # the app ID may have changed
+    credentials_cache.invalidate()
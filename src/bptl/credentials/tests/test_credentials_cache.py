@@ -0,0 +1,115 @@
+import time
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+import jwt
+from freezegun import freeze_time
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from bptl.credentials.tests.factories import AppFactory, AppServiceCredentialsFactory
+from bptl.tasks.tests.factories import ServiceFactory
+
+from ..api import get_credentials
+from ..cache import credentials_cache
+
+
+@override_settings(CREDENTIALS_CACHE_TIMEOUT=3600)
+class CredentialsCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.service = ServiceFactory.create(
+            api_type=APITypes.zrc,
+            auth_type=AuthTypes.zgw,
+            client_id="service-client-id",
+            secret="service-secret",
+            jwt_valid_for=600,
+        )
+        cls.app = AppFactory.create()
+        cls.credentials = AppServiceCredentialsFactory.create(
+            app=cls.app,
+            service=cls.service,
+            client_id="app-client-id",
+            secret="app-secret",
+        )
+
+    def setUp(self):
+        super().setUp()
+        credentials_cache.invalidate()
+        self.addCleanup(credentials_cache.invalidate)
+
+    def test_headers_reused(self):
+        with freeze_time("2020-01-01 12:00:00"):
+            headers = get_credentials(self.app.app_id, self.service)[self.service]
+
+        with freeze_time("2020-01-01 12:05:00"), self.assertNumQueries(0):
+            cached = get_credentials(self.app.app_id, self.service)[self.service]
+
+        self.assertEqual(cached, headers)
+
+    def test_headers_renewed_before_expiry(self):
+        with freeze_time("2020-01-01 12:00:00"):
+            headers = get_credentials(self.app.app_id, self.service)[self.service]
+
+        with freeze_time("2020-01-01 12:09:30"):
+            renewed = get_credentials(self.app.app_id, self.service)[self.service]
+
+        self.assertNotEqual(renewed, headers)
+
+    def test_headers_renewed_before_expiry_without_exp(self):
+        # tokens that are only issued with the time they were issued at
+        with freeze_time("2020-01-01 12:00:00"):
+            token = jwt.encode(
+                {"iss": "app-client-id", "iat": int(time.time())},
+                "app-secret",
+                algorithm="HS256",
+            )
+            credentials_cache.set(
+                self.app.app_id,
+                self.service.pk,
+                {"Authorization": f"Bearer {token}"},
+                valid_for=self.service.jwt_valid_for,
+            )
+
+        with freeze_time("2020-01-01 12:08:30"):
+            self.assertIsNotNone(
+                credentials_cache.get(self.app.app_id, self.service.pk)
+            )
+
+        with freeze_time("2020-01-01 12:09:30"):
+            self.assertIsNone(credentials_cache.get(self.app.app_id, self.service.pk))
+
+    def test_invalidated_on_save(self):
+        get_credentials(self.app.app_id, self.service)
+
+        self.credentials.secret = "new-secret"
+        self.credentials.save()
+
+        with self.assertNumQueries(1):
+            get_credentials(self.app.app_id, self.service)
+
+        self.service.save()
+
+        with self.assertNumQueries(1):
+            get_credentials(self.app.app_id, self.service)
+
+    def test_service_not_mutated(self):
+        service = self.credentials.service
+        build_client = Service.build_client
+        built = []
+
+        def _build_client(instance, **kwargs):
+            built.append((instance is service, service.client_id))
+            return build_client(instance, **kwargs)
+
+        with patch.object(Service, "build_client", new=_build_client):
+            headers = self.credentials.get_auth_headers()
+
+        # the credentials were applied to a copy of the service
+        self.assertEqual(built, [(False, "service-client-id")])
+        token = headers["Authorization"].split(" ")[1]
+        payload = jwt.decode(token, "app-secret", algorithms=["HS256"])
+        self.assertEqual(payload["client_id"], "app-client-id")
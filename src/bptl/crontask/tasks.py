@@ -5,10 +5,10 @@ from django.conf import settings
 import requests
 from celery.utils.log import get_task_logger
 from celery_once import QueueOnce
-from timeline_logger.models import TimelineLog
 
 from bptl.tasks.api import TaskExpired, execute
 from bptl.tasks.registry import register
+from bptl.tasks.status_counts import log_status
 from bptl.utils.constants import Statuses
 from bptl.utils.decorators import retry
 
@@ -39,7 +39,7 @@ def task_create_cron_task(topic_name: str = "", variables: dict = None) -> CronT
     logger.info("Created `cron` tasks with task id %s" % task.id)
 
     # initial logging
-    TimelineLog.objects.create(content_object=task, extra_data={"status": task.status})
+    log_status(task, new=True)
 
     cron_task_execute_and_complete.delay(task.id)
 
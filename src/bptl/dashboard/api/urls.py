@@ -1,10 +1,11 @@
 from django.urls import path
 
-from .views import AggregateView
+from .views import AggregateView, CapacityView
 
 app_name = "dashboard-api"
 
 urlpatterns = [
     # Simply show the master template.
     path("aggregate/", AggregateView.as_view(), name="aggregate"),
+    path("capacity/", CapacityView.as_view(), name="capacity"),
 ]
@@ -21,15 +21,23 @@ class TaskFilter(FilterSet):
         widget=forms.CheckboxSelectMultiple,
     )
     instance_id = django_filters.CharFilter(
-        field_name="externaltask__instance_id",
-        lookup_expr="icontains",
+        method="filter_by_instance_id",
         label="Process Instance (ID)",
         widget=forms.TextInput,
     )
+    task_id = django_filters.CharFilter(
+        field_name="externaltask__task_id",
+        label="Task (ID)",
+        widget=forms.TextInput,
+    )
 
     class Meta:
         model = BaseTask
-        fields = ("status", "topic_name", "engine_type", "instance_id")
+        fields = ("status", "topic_name", "engine_type", "instance_id", "task_id")
+
+    def filter_by_instance_id(self, queryset, name, value: str) -> QuerySet:
+        # the (lowercase) IDs are matched by their prefix, which uses the index
+        return queryset.filter(externaltask__instance_id__startswith=value.lower())
 
     def filter_by_type(self, queryset, name, value: list) -> QuerySet:
         if not value:
@@ -0,0 +1,113 @@
+"""
+Paginate the task list by primary key.
+
+Offset pagination gets slower with every page, as the database has to skip all the
+tasks of the previous pages, and needs an exact count of the tasks for the number of
+pages. Instead, a page is the tasks just before (``?older=<pk>``) or after
+(``?newer=<pk>``) the tasks of the page it was navigated from, which is an index range
+scan on the primary key on any page. ``?newer=0`` is the last page.
+
+Above ``TASK_LIST_COUNT_LIMIT`` tasks, the total shows the estimate of the query
+planner instead of an exact count.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import QuerySet
+
+OLDER_PARAM = "older"
+NEWER_PARAM = "newer"
+
+
+def estimate_count(queryset: QuerySet) -> int:
+    """
+    Return the number of rows the query planner expects ``queryset`` to return.
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+def get_count(queryset: QuerySet) -> Tuple[int, bool]:
+    """
+    Return the number of tasks in ``queryset`` and whether it is estimated.
+    """
+    limit = settings.TASK_LIST_COUNT_LIMIT
+    if limit:
+        estimate = estimate_count(queryset.order_by())
+        if estimate > limit:
+            return estimate, True
+    return queryset.count(), False
+
+
+@dataclass
+class KeysetPage:
+    object_list: List
+    has_next: bool
+    has_previous: bool
+    count: int
+    estimated: bool
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_other_pages(self) -> bool:
+        return self.has_next or self.has_previous
+
+    @property
+    def next_cursor(self) -> Optional[int]:
+        return self.object_list[-1].pk if self.has_next else None
+
+    @property
+    def previous_cursor(self) -> Optional[int]:
+        return self.object_list[0].pk if self.has_previous else None
+
+
+def _parse_cursor(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def paginate(queryset: QuerySet, params, per_page: int) -> KeysetPage:
+    """
+    Return the page of ``queryset`` (newest first) selected by the cursor in
+    ``params``.
+    """
+    older = _parse_cursor(params.get(OLDER_PARAM))
+    newer = _parse_cursor(params.get(NEWER_PARAM))
+
+    if newer is not None:
+        page = queryset.filter(pk__gt=newer).order_by("pk")
+        tasks = list(page[: per_page + 1])
+        has_previous = len(tasks) > per_page
+        object_list = tasks[:per_page][::-1]
+        # the page it was navigated from holds older tasks
+        has_next = newer > 0
+    else:
+        page = queryset if older is None else queryset.filter(pk__lt=older)
+        tasks = list(page.order_by("-pk")[: per_page + 1])
+        has_next = len(tasks) > per_page
+        object_list = tasks[:per_page]
+        has_previous = older is not None
+
+    count, estimated = get_count(queryset)
+    return KeysetPage(
+        object_list=object_list,
+        has_next=has_next and bool(object_list),
+        has_previous=has_previous and bool(object_list),
+        count=count,
+        estimated=estimated,
+    )
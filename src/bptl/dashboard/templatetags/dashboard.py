@@ -12,8 +12,10 @@ register = Library()
 
 @register.filter
 def task_type(task) -> str:
+    # the task list fetches the tasks without their engine specific fields
+    task_class = task.get_real_instance_class()
     for type, model in ENGINETYPE_MODEL_MAPPING.items():
-        if isinstance(task, model):
+        if task_class is not None and issubclass(task_class, model):
             return EngineTypes.values[type]
     return ""
 
@@ -0,0 +1,125 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from bptl.accounts.tests.factories import SuperUserFactory
+from bptl.camunda.tests.factories import ExternalTaskFactory
+from bptl.crontask.models import CronTask
+from bptl.tasks.models import BaseTask
+from bptl.utils.constants import Statuses
+
+from ..pagination import estimate_count, paginate
+from ..templatetags.dashboard import task_type
+
+
+class TaskListTests(TestCase):
+    url = reverse("dashboard:task-list")
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(SuperUserFactory.create())
+
+    def get_pks(self, response):
+        return [task.pk for task in response.context["tasks"]]
+
+    def test_keyset_pages(self):
+        tasks = ExternalTaskFactory.create_batch(45)
+        pks = [task.pk for task in reversed(tasks)]
+
+        first = self.client.get(self.url)
+        page = first.context["page_obj"]
+        self.assertEqual(self.get_pks(first), pks[:20])
+        self.assertFalse(page.has_previous)
+        self.assertTrue(page.has_next)
+        self.assertEqual(page.count, 45)
+        self.assertFalse(page.estimated)
+
+        second = self.client.get(self.url, {"older": page.next_cursor})
+        page = second.context["page_obj"]
+        self.assertEqual(self.get_pks(second), pks[20:40])
+        self.assertTrue(page.has_previous)
+        self.assertTrue(page.has_next)
+
+        back = self.client.get(self.url, {"newer": page.previous_cursor})
+        self.assertEqual(self.get_pks(back), pks[:20])
+        self.assertFalse(back.context["page_obj"].has_previous)
+
+        last = self.client.get(self.url, {"newer": 0})
+        page = last.context["page_obj"]
+        self.assertEqual(self.get_pks(last), pks[25:])
+        self.assertTrue(page.has_previous)
+        self.assertFalse(page.has_next)
+
+    def test_pagination_keeps_filters(self):
+        ExternalTaskFactory.create_batch(21, status=Statuses.failed)
+
+        response = self.client.get(self.url, {"status": Statuses.failed})
+
+        next_cursor = response.context["page_obj"].next_cursor
+        self.assertContains(response, f"?status=failed&amp;older={next_cursor}")
+
+    def test_list_queries(self):
+        ExternalTaskFactory.create_batch(5)
+        CronTask.objects.create(topic_name="some-topic")
+
+        # session, user, tasks, count estimate, count
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
+
+        self.assertEqual(
+            [task_type(task) for task in response.context["tasks"]],
+            ["CronTask"] + ["Camunda"] * 5,
+        )
+
+    def test_filter_instance_id(self):
+        task = ExternalTaskFactory.create(
+            instance_id="4a7f1c2e-9b1d-4d2a-8f3e-1c2b3a4d5e6f"
+        )
+        ExternalTaskFactory.create(instance_id="5b8f1c2e-9b1d-4d2a-8f3e-1c2b3a4d5e6f")
+
+        for value in ["4A7F", task.instance_id]:
+            with self.subTest(value=value):
+                response = self.client.get(self.url, {"instance_id": value})
+
+                self.assertEqual(self.get_pks(response), [task.pk])
+                self.assertContains(response, task.instance_id)
+
+    def test_filter_task_id(self):
+        task = ExternalTaskFactory.create(task_id="some-task")
+        ExternalTaskFactory.create(task_id="other-task")
+
+        response = self.client.get(self.url, {"task_id": "some-task"})
+
+        self.assertEqual(self.get_pks(response), [task.pk])
+
+
+class CountTests(TestCase):
+    def test_estimate_count(self):
+        ExternalTaskFactory.create_batch(3)
+
+        self.assertGreater(estimate_count(BaseTask.objects.all()), 0)
+
+    @override_settings(TASK_LIST_COUNT_LIMIT=2)
+    def test_estimated_above_limit(self):
+        ExternalTaskFactory.create_batch(3)
+
+        with patch(
+            "bptl.dashboard.pagination.estimate_count", return_value=1000
+        ) as m_estimate:
+            page = paginate(BaseTask.objects.non_polymorphic(), {}, 20)
+
+        self.assertEqual(page.count, 1000)
+        self.assertTrue(page.estimated)
+        m_estimate.assert_called_once()
+
+    @override_settings(TASK_LIST_COUNT_LIMIT=0)
+    def test_exact_count_without_limit(self):
+        ExternalTaskFactory.create_batch(3)
+
+        with patch("bptl.dashboard.pagination.estimate_count") as m_estimate:
+            page = paginate(BaseTask.objects.non_polymorphic(), {}, 20)
+
+        self.assertEqual(page.count, 3)
+        self.assertFalse(page.estimated)
+        m_estimate.assert_not_called()
@@ -1,3 +1,4 @@
+from django.db.models import F
 from django.utils.decorators import method_decorator
 from django.views.generic import DetailView
 
@@ -7,16 +8,27 @@ from bptl.tasks.models import BaseTask
 
 from ..decorators import superuser_required
 from .filters import TaskFilter
+from .pagination import paginate
 
 
 @method_decorator(superuser_required, name="dispatch")
 class TaskListView(FilterView):
     template_name = "dashboard/task_list.html"
     filterset_class = TaskFilter
-    queryset = BaseTask.objects.all().order_by("-pk")
+    # the list only shows the common fields and the process instance, which saves a
+    # query per engine type
+    queryset = (
+        BaseTask.objects.non_polymorphic()
+        .annotate(instance_id=F("externaltask__instance_id"))
+        .order_by("-pk")
+    )
     context_object_name = "tasks"
     paginate_by = 20
 
+    def paginate_queryset(self, queryset, page_size):
+        page = paginate(queryset, self.request.GET, page_size)
+        return (None, page, page.object_list, page.has_other_pages())
+
 
 @method_decorator(superuser_required, name="dispatch")
 class TaskDetailView(DetailView):
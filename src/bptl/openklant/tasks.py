@@ -8,11 +8,11 @@ from django.conf import settings
 
 from celery.utils.log import get_task_logger
 from celery_once import QueueOnce
-from timeline_logger.models import TimelineLog
 
 from bptl.openklant.models import FailedOpenKlantTasks
 from bptl.tasks.api import execute
 from bptl.tasks.registry import register
+from bptl.tasks.status_counts import log_status
 from bptl.utils.constants import Statuses
 from bptl.utils.decorators import retry
 from bptl.work_units.mail.mail import build_email_messages, create_email
@@ -45,9 +45,7 @@ def task_fetch_and_patch():
     logger.info("Fetched %r tasks with %r", num_tasks, worker_id)
 
     for task in tasks:
-        TimelineLog.objects.create(
-            content_object=task, extra_data={"status": task.status}
-        )
+        log_status(task, new=True)
         task_execute.delay(task.id)
 
     task_schedule_new_fetch_and_patch.apply_async(countdown=60)
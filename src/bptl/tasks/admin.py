@@ -17,7 +17,7 @@ class DefaultServiceInline(admin.TabularInline):
 
 @admin.register(TaskMapping)
 class TaskMappingAdmin(admin.ModelAdmin):
-    list_display = ("__str__", "active")
+    list_display = ("__str__", "active", "queue", "max_in_flight", "inline")
     list_filter = ("active",)
     search_fields = ("topic_name", "callback")
     form = AdminTaskMappingForm
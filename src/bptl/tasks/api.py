@@ -3,10 +3,16 @@ Expose the public API to manage tasks.
 """
 
 import inspect
+import traceback
+from typing import Dict, List, Optional, Union
+
+from asgiref.sync import async_to_sync, sync_to_async
 
 from bptl.utils.constants import Statuses
-from bptl.utils.decorators import save_and_log
+from bptl.utils.decorators import record_failure, record_result, save_and_log
+from bptl.utils.timeline import buffer_logs
 
+from .base import AsyncWorkUnit
 from .models import BaseTask, TaskMapping
 from .registry import WorkUnitRegistry, register
 
@@ -15,6 +21,8 @@ __all__ = [
     "NoCallback",
     "TaskPerformed",
     "execute",
+    "aexecute",
+    "execute_many",
 ]
 
 
@@ -30,6 +38,49 @@ class TaskPerformed(Exception):
     pass
 
 
+def _get_callback(task: BaseTask, task_mapping: Optional[TaskMapping], registry):
+    if task_mapping is None:
+        raise NoCallback(
+            f"Could not find a topic/callback mapping for topic '{task.topic_name}'."
+        )
+
+    try:
+        handler = registry[task_mapping.callback]
+    except KeyError as exc:
+        raise NoCallback(
+            f"Callback '{task_mapping.callback}' is not in the provided registry."
+        ) from exc
+
+    # check task status
+    if task.status in [Statuses.completed, Statuses.performed]:
+        raise TaskPerformed(f"The task {task} has been already performed.")
+
+    # check for expiry
+    if hasattr(task, "expired") and task.expired:
+        raise TaskExpired(f"The task {task} expired before it could be handled.")
+
+    return handler.callback
+
+
+def _is_async(callback: callable) -> bool:
+    if inspect.isclass(callback):
+        return issubclass(callback, AsyncWorkUnit)
+    return inspect.iscoroutinefunction(callback)
+
+
+def _perform(callback: callable, task: BaseTask):
+    if inspect.isclass(callback):
+        return callback(task).perform()
+    return callback(task)
+
+
+async def _aperform(callback: callable, task: BaseTask):
+    if _is_async(callback):
+        return await _perform(callback, task)
+    # don't block the event loop
+    return await sync_to_async(_perform, thread_sensitive=False)(callback, task)
+
+
 @save_and_log()
 def execute(task: BaseTask, registry: WorkUnitRegistry = register) -> dict:
     """
@@ -50,31 +101,115 @@ def execute(task: BaseTask, registry: WorkUnitRegistry = register) -> dict:
     """
     # returns at most one result because of the unique constraint on topic_name
     task_mapping = TaskMapping.objects.filter(topic_name=task.topic_name).first()
-    if task_mapping is None:
-        raise NoCallback(
-            f"Could not find a topic/callback mapping for topic '{task.topic_name}'."
-        )
+    callback = _get_callback(task, task_mapping, registry)
 
-    try:
-        handler = registry[task_mapping.callback]
-    except KeyError as exc:
-        raise NoCallback(
-            f"Callback '{task_mapping.callback}' is not in the provided registry."
-        ) from exc
+    # actually call the task
+    if _is_async(callback):
+        result = async_to_sync(_aperform)(callback, task)
+    else:
+        result = _perform(callback, task)
 
-    # check task status
-    if task.status in [Statuses.completed, Statuses.performed]:
-        raise TaskPerformed(f"The task {task} has been already performed.")
+    return result or {}
 
-    # check for expiry
-    if hasattr(task, "expired") and task.expired:
-        raise TaskExpired(f"The task {task} expired before it could be handled.")
 
-    # actually call the task
-    callback = handler.callback
-    if inspect.isclass(callback):
-        result = callback(task).perform()
-    else:
-        result = callback(task)
+@save_and_log()
+async def aexecute(task: BaseTask, registry: WorkUnitRegistry = register) -> dict:
+    """
+    Execute the appropriate task for a fetched external task, asynchronously.
 
+    The async variant of :func:`execute`, to execute many tasks concurrently in one
+    event loop. Synchronous work units are performed in a thread pool, so they don't
+    block the event loop.
+    """
+    task_mapping = await TaskMapping.objects.filter(topic_name=task.topic_name).afirst()
+    callback = _get_callback(task, task_mapping, registry)
+
+    result = await _aperform(callback, task)
     return result or {}
+
+
+def _perform_many(callback: callable, tasks: List[BaseTask]) -> list:
+    perform_many = getattr(callback, "perform_many", None)
+    if perform_many is None:
+        results = []
+        for task in tasks:
+            try:
+                if _is_async(callback):
+                    results.append(async_to_sync(_aperform)(callback, task))
+                else:
+                    results.append(_perform(callback, task))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
+    try:
+        if inspect.iscoroutinefunction(perform_many):
+            results = async_to_sync(perform_many)(tasks)
+        else:
+            results = perform_many(tasks)
+    except Exception as exc:
+        return [exc] * len(tasks)
+
+    if len(results) != len(tasks):
+        error = ValueError(
+            f"The batch callback returned {len(results)} results for {len(tasks)} tasks."
+        )
+        return [error] * len(tasks)
+    return results
+
+
+def execute_many(
+    tasks: List[BaseTask], registry: WorkUnitRegistry = register
+) -> List[Union[dict, Exception]]:
+    """
+    Execute the appropriate tasks for a number of fetched external tasks.
+
+    The tasks are grouped by topic. The batch entry point (``perform_many``) of a
+    callback is called once for all tasks of its topic, so the tasks can share
+    lookups and connections. Callbacks without a batch entry point are called per task.
+
+    The result or error of every task is saved on the task, like :func:`execute` does.
+    Errors are returned rather than raised, so a failing task doesn't affect the other
+    tasks.
+
+    :return: the result dict or the raised exception of each task, in the order of
+      ``tasks``.
+    """
+    task_mappings = {
+        task_mapping.topic_name: task_mapping
+        for task_mapping in TaskMapping.objects.filter(
+            topic_name__in={task.topic_name for task in tasks}
+        )
+    }
+
+    results: Dict[int, Union[dict, Exception]] = {}
+    batches: Dict[str, List[int]] = {}
+    callbacks = {}
+    for index, task in enumerate(tasks):
+        try:
+            callback = _get_callback(task, task_mappings.get(task.topic_name), registry)
+        except Exception as exc:
+            results[index] = exc
+            continue
+        batches.setdefault(task.topic_name, []).append(index)
+        callbacks[task.topic_name] = callback
+
+    with buffer_logs():
+        for topic_name, indices in batches.items():
+            batch_results = _perform_many(
+                callbacks[topic_name], [tasks[index] for index in indices]
+            )
+            results.update(zip(indices, batch_results))
+
+    for index, task in enumerate(tasks):
+        result = results[index]
+        if isinstance(result, Exception):
+            error = "".join(
+                traceback.format_exception(type(result), result, result.__traceback__)
+            )
+            record_failure(task, error)
+        else:
+            results[index] = result = result or {}
+            record_result(task, Statuses.performed, result)
+
+    return [results[index] for index in range(len(tasks))]
@@ -28,3 +28,18 @@ class WorkUnit:
         raise NotImplementedError(
             "subclasses of WorkUnit must provide a perform() method"
         )
+
+
+class AsyncWorkUnit(WorkUnit):
+    """
+    A work unit that performs its I/O asynchronously.
+
+    Use :func:`bptl.tasks.api.aexecute` to run it concurrently with other tasks in an
+    event loop. :func:`bptl.tasks.api.execute` runs it to completion in its own event
+    loop, so async work units can be mapped to topics like any other work unit.
+    """
+
+    async def perform(self) -> dict:
+        raise NotImplementedError(
+            "subclasses of AsyncWorkUnit must provide an async perform() method"
+        )
@@ -5,3 +5,10 @@ class EngineTypes(DjangoChoices):
     camunda = ChoiceItem("camunda", "Camunda")
     openklant = ChoiceItem("openklant", "OpenKlant")
     crontask = ChoiceItem("crontask", "CronTask")
+
+
+class LogPayloads(DjangoChoices):
+    full = ChoiceItem("full", "Headers and bodies")
+    truncated = ChoiceItem("truncated", "Headers and truncated bodies")
+    headers = ChoiceItem("headers", "Headers only")
+    errors = ChoiceItem("errors", "Errors only")
@@ -0,0 +1,22 @@
+from django.core.management import BaseCommand
+
+from ...retention import BATCH_SIZE, date_undated_tasks
+
+
+class Command(BaseCommand):
+    help = (
+        "Set the creation time of the tasks created before it was recorded to the "
+        "time of their first log, so the retention policies apply to them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Number of tasks to update per batch. Defaults to {BATCH_SIZE}.",
+        )
+
+    def handle(self, **options):
+        dated = date_undated_tasks(batch_size=options["batch_size"])
+        self.stdout.write(f"Dated {dated} task(s).")
@@ -0,0 +1,33 @@
+from django.core.management import BaseCommand
+
+from ...retention import BATCH_SIZE, prune
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove the tasks and their logs expired according to the retention "
+        "policies, optionally archiving them first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Number of tasks to remove per batch. Defaults to {BATCH_SIZE}.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            help=(
+                "Directory to archive the removed tasks to. Defaults to the "
+                "TASK_RETENTION_ARCHIVE_DIR setting."
+            ),
+        )
+
+    def handle(self, **options):
+        result = prune(
+            batch_size=options["batch_size"], archive_dir=options["archive_dir"]
+        )
+        self.stdout.write(f"Removed {result.tasks} task(s) and {result.logs} log(s).")
+        if result.archive:
+            self.stdout.write(f"Archived the removed tasks to {result.archive}.")
@@ -0,0 +1,26 @@
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from ...status_counts import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the tasks per status shown on the dashboard from the status logs in "
+        "the timeline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=24,
+            help="Number of hours of status logs to count. Defaults to 24.",
+        )
+
+    def handle(self, **options):
+        since = timezone.now() - timedelta(hours=options["hours"])
+        tasks = rebuild(since)
+        self.stdout.write(f"Counted {tasks} task(s).")
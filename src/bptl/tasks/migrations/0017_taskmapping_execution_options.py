@@ -0,0 +1,43 @@
+# Generated by Django 5.2.9 on 2026-10-17 00:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0016_alter_defaultservice_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="taskmapping",
+            name="max_in_flight",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Maximum number of tasks of this topic that may be executed at the same time. Leave empty for no limit.",
+                null=True,
+                verbose_name="max in flight",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskmapping",
+            name="queue",
+            field=models.CharField(
+                blank=True,
+                help_text="Celery queue to execute the tasks of this topic from. Leave empty to use the default (priority) routing.",
+                max_length=100,
+                verbose_name="queue",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskmapping",
+            name="soft_time_limit",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Time in seconds a task of this topic may take before it is aborted. Leave empty to use the default time limit.",
+                null=True,
+                verbose_name="soft time limit",
+            ),
+        ),
+    ]
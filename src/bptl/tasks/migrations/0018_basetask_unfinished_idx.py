@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # the index is built without blocking writes to the table
+    atomic = False
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("tasks", "0017_taskmapping_execution_options"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="basetask",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ["initial", "in_progress", "performed"])
+                ),
+                fields=["status"],
+                name="basetask_unfinished_idx",
+            ),
+        ),
+    ]
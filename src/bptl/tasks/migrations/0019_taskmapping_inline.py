@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0018_basetask_unfinished_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="taskmapping",
+            name="inline",
+            field=models.BooleanField(
+                default=False,
+                help_text="Execute the tasks of this topic directly in the Camunda poller process rather than through the celery workers. Only suited for short tasks.",
+                verbose_name="execute inline",
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:56
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0019_taskmapping_inline"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="defaultservice",
+            name="log_payloads",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("full", "Headers and bodies"),
+                    ("truncated", "Headers and truncated bodies"),
+                    ("headers", "Headers only"),
+                    ("errors", "Errors only"),
+                ],
+                help_text="What to capture of the requests to this service. Leave empty to use the setting of the task mapping.",
+                max_length=20,
+                verbose_name="log payloads",
+            ),
+        ),
+        migrations.AddField(
+            model_name="defaultservice",
+            name="log_sample_rate",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text="Percentage of the successful requests to this service of which the payloads are captured. Leave empty to use the setting of the task mapping.",
+                null=True,
+                validators=[django.core.validators.MaxValueValidator(100)],
+                verbose_name="log sample rate",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskmapping",
+            name="log_payloads",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("full", "Headers and bodies"),
+                    ("truncated", "Headers and truncated bodies"),
+                    ("headers", "Headers only"),
+                    ("errors", "Errors only"),
+                ],
+                help_text="What to capture of the requests made by the tasks of this topic. Leave empty to use the default.",
+                max_length=20,
+                verbose_name="log payloads",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskmapping",
+            name="log_sample_rate",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text="Percentage of the successful requests of which the payloads are captured. Leave empty to use the default.",
+                null=True,
+                validators=[django.core.validators.MaxValueValidator(100)],
+                verbose_name="log sample rate",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:59
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # the index is built without blocking writes to the table
+    atomic = False
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("tasks", "0020_request_log_options"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="basetask",
+            name="created",
+            field=models.DateTimeField(
+                auto_now_add=True, null=True, verbose_name="created"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="basetask",
+            index=models.Index(
+                fields=["status", "created"], name="basetask_retention_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.9 on 2026-10-17 02:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0021_basetask_created"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatusCount",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "engine_type",
+                    models.CharField(
+                        choices=[
+                            ("camunda", "Camunda"),
+                            ("openklant", "OpenKlant"),
+                            ("crontask", "CronTask"),
+                        ],
+                        max_length=50,
+                        verbose_name="engine type",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("initial", "Initial"),
+                            ("in_progress", "In progress"),
+                            ("performed", "Performed"),
+                            ("failed", "Failed"),
+                            ("completed", "Completed"),
+                        ],
+                        max_length=50,
+                        verbose_name="status",
+                    ),
+                ),
+                ("hour", models.DateTimeField(verbose_name="hour")),
+                ("count", models.IntegerField(default=0, verbose_name="count")),
+            ],
+            options={
+                "verbose_name": "status count",
+                "verbose_name_plural": "status counts",
+                "indexes": [models.Index(fields=["hour"], name="statuscount_hour_idx")],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("engine_type", "status", "hour"),
+                        name="unique_status_count",
+                    )
+                ],
+            },
+        ),
+    ]
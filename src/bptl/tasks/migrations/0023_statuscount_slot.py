@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-17 02:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0022_statuscount"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="statuscount",
+            name="unique_status_count",
+        ),
+        migrations.AddField(
+            model_name="statuscount",
+            name="slot",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                help_text="The count of an hour is spread over multiple rows, so concurrent status logs don't all wait for the same row.",
+                verbose_name="slot",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="statuscount",
+            constraint=models.UniqueConstraint(
+                fields=("engine_type", "status", "hour", "slot"),
+                name="unique_status_count",
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.9 on 2026-10-17 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0023_statuscount_slot"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="basetask",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("initial", "Initial"),
+                    ("in_progress", "In progress"),
+                    ("performed", "Performed"),
+                    ("failed", "Failed"),
+                    ("completed", "Completed"),
+                    ("superseded", "Superseded"),
+                ],
+                default="initial",
+                help_text="The current status of task processing",
+                max_length=50,
+                verbose_name="status",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="statuscount",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("initial", "Initial"),
+                    ("in_progress", "In progress"),
+                    ("performed", "Performed"),
+                    ("failed", "Failed"),
+                    ("completed", "Completed"),
+                    ("superseded", "Superseded"),
+                ],
+                max_length=50,
+                verbose_name="status",
+            ),
+        ),
+    ]
@@ -3,6 +3,7 @@ Database model to map task topics and python code objects to process related tas
 """
 
 from django.contrib.contenttypes.fields import GenericRelation
+from django.core.validators import MaxValueValidator
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -12,7 +13,7 @@ from timeline_logger.models import TimelineLog
 
 from bptl.utils.constants import Statuses
 
-from .constants import EngineTypes
+from .constants import EngineTypes, LogPayloads
 from .query import BaseTaskQuerySet, TaskQuerySet
 
 
@@ -48,6 +49,62 @@ class TaskMapping(models.Model):
         default=EngineTypes.camunda,
         help_text=_("The engine type used for the task."),
     )
+    queue = models.CharField(
+        _("queue"),
+        max_length=100,
+        blank=True,
+        help_text=_(
+            "Celery queue to execute the tasks of this topic from. Leave empty to use "
+            "the default (priority) routing."
+        ),
+    )
+    max_in_flight = models.PositiveIntegerField(
+        _("max in flight"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Maximum number of tasks of this topic that may be executed at the same "
+            "time. Leave empty for no limit."
+        ),
+    )
+    soft_time_limit = models.PositiveIntegerField(
+        _("soft time limit"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Time in seconds a task of this topic may take before it is aborted. "
+            "Leave empty to use the default time limit."
+        ),
+    )
+    inline = models.BooleanField(
+        _("execute inline"),
+        default=False,
+        help_text=_(
+            "Execute the tasks of this topic directly in the Camunda poller process "
+            "rather than through the celery workers. Only suited for short tasks."
+        ),
+    )
+
+    log_payloads = models.CharField(
+        _("log payloads"),
+        max_length=20,
+        choices=LogPayloads.choices,
+        blank=True,
+        help_text=_(
+            "What to capture of the requests made by the tasks of this topic. Leave "
+            "empty to use the default."
+        ),
+    )
+    log_sample_rate = models.PositiveSmallIntegerField(
+        _("log sample rate"),
+        null=True,
+        blank=True,
+        validators=[MaxValueValidator(100)],
+        help_text=_(
+            "Percentage of the successful requests of which the payloads are "
+            "captured. Leave empty to use the default."
+        ),
+    )
 
     objects = TaskQuerySet.as_manager()
 
@@ -69,6 +126,26 @@ class DefaultService(models.Model):
         max_length=100,
         help_text="Alias for the service used in the particular task",
     )
+    log_payloads = models.CharField(
+        _("log payloads"),
+        max_length=20,
+        choices=LogPayloads.choices,
+        blank=True,
+        help_text=_(
+            "What to capture of the requests to this service. Leave empty to use the "
+            "setting of the task mapping."
+        ),
+    )
+    log_sample_rate = models.PositiveSmallIntegerField(
+        _("log sample rate"),
+        null=True,
+        blank=True,
+        validators=[MaxValueValidator(100)],
+        help_text=_(
+            "Percentage of the successful requests to this service of which the "
+            "payloads are captured. Leave empty to use the setting of the task mapping."
+        ),
+    )
 
     class Meta:
         verbose_name = _("default service")
@@ -114,10 +191,29 @@ class BaseTask(PolymorphicModel):
         blank=True,
         help_text=_("The error that occurred during execution."),
     )
+    created = models.DateTimeField(_("created"), auto_now_add=True, null=True)
     logs = GenericRelation(TimelineLog, related_query_name="task")
 
     objects = PolymorphicManager.from_queryset(BaseTaskQuerySet)()
 
+    class Meta(PolymorphicModel.Meta):
+        indexes = [
+            # the tasks expired according to the retention policies
+            models.Index(fields=["status", "created"], name="basetask_retention_idx"),
+            # the unfinished tasks are a small fraction of all tasks
+            models.Index(
+                fields=["status"],
+                name="basetask_unfinished_idx",
+                condition=models.Q(
+                    status__in=[
+                        Statuses.initial,
+                        Statuses.in_progress,
+                        Statuses.performed,
+                    ]
+                ),
+            ),
+        ]
+
     def get_variables(self) -> dict:
         """
         return input variables formatted for work_unit
@@ -132,3 +228,43 @@ class BaseTask(PolymorphicModel):
 
     def __str__(self):
         return f"{self.polymorphic_ctype}: {self.topic_name} / {self.id}"
+
+
+class StatusCount(models.Model):
+    """
+    The number of tasks of an engine type whose last status was logged in an hour.
+
+    Maintained on every status log, see :mod:`bptl.tasks.status_counts`.
+    """
+
+    engine_type = models.CharField(
+        _("engine type"), max_length=50, choices=EngineTypes.choices
+    )
+    status = models.CharField(_("status"), max_length=50, choices=Statuses.choices)
+    hour = models.DateTimeField(_("hour"))
+    slot = models.PositiveSmallIntegerField(
+        _("slot"),
+        default=0,
+        help_text=_(
+            "The count of an hour is spread over multiple rows, so concurrent status "
+            "logs don't all wait for the same row."
+        ),
+    )
+    count = models.IntegerField(_("count"), default=0)
+
+    class Meta:
+        verbose_name = _("status count")
+        verbose_name_plural = _("status counts")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["engine_type", "status", "hour", "slot"],
+                name="unique_status_count",
+            ),
+        ]
+        indexes = [models.Index(fields=["hour"], name="statuscount_hour_idx")]
+
+    def __str__(self):
+        return (
+            f"{self.engine_type} / {self.status} / {self.hour} "
+            f"({self.slot}): {self.count}"
+        )
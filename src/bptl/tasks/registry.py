@@ -7,7 +7,7 @@ performs a unit of work.
 
 import inspect
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from django.utils.functional import cached_property
 from django.utils.module_loading import autodiscover_modules
@@ -37,6 +37,23 @@ class Task:
             return []
         return self.callback._required_services
 
+    @property
+    def required_variables(self) -> Optional[List[str]]:
+        """
+        Return the process variables the callback reads, if it declares them.
+        """
+        return getattr(self.callback, "_required_variables", None)
+
+    @property
+    def perform_many(self) -> Optional[callable]:
+        """
+        Return the batch entry point of the callback, if it has one.
+
+        The batch entry point takes a list of tasks of the same topic and returns a
+        list with the result (or raised exception) of each task, in the same order.
+        """
+        return getattr(self.callback, "perform_many", None)
+
 
 @dataclass
 class RequiredService:
@@ -85,6 +102,10 @@ class WorkUnitRegistry:
                     f"The '{func_or_class}' class must have a `perform` method"
                 )
 
+        # check that the batch entry point can be called
+        if not callable(getattr(func_or_class, "perform_many", callable)):
+            raise TypeError(f"The '{func_or_class}' `perform_many` must be callable")
+
         dotted_path = f"{func_or_class.__module__}.{func_or_class.__qualname__}"
         self._registry[dotted_path] = Task(
             dotted_path=dotted_path,
@@ -123,6 +144,41 @@ class WorkUnitRegistry:
 
         return decorator
 
+    def require_variables(self, *names: str):
+        """
+        Decorate a callback with the names of the process variables it reads.
+
+        Only the declared variables are fetched with the task from the process engine,
+        which keeps large variables of other tasks out of the requests and the
+        database. Other variables are retrieved when they are looked up, so only
+        declare the variables if the callback reads them by name.
+        """
+
+        def decorator(func_or_class: callable):
+            # build a new list, so the declaration of a base class is not changed
+            func_or_class._required_variables = [
+                *getattr(func_or_class, "_required_variables", []),
+                *names,
+            ]
+            return func_or_class
+
+        return decorator
+
+    def batch(self, perform_many: callable):
+        """
+        Decorate a function callback with its batch entry point.
+
+        ``perform_many`` receives all tasks of a topic that were fetched together and
+        must return the result dict or the raised exception for every task, in the
+        same order. Class callbacks can define a ``perform_many`` classmethod instead.
+        """
+
+        def decorator(func: callable):
+            func.perform_many = perform_many
+            return func
+
+        return decorator
+
     def get_for(self, func_or_class: callable) -> str:
         """
         Retrieve the python dotted path for a given callable.
@@ -0,0 +1,179 @@
+"""
+Remove old tasks and their timeline logs.
+
+Tasks and their logs are never needed after a while, but nothing removed them, so the
+tables kept growing. The ``TASK_RETENTION`` setting configures per status after how
+many days a task is removed, e.g. ``completed:30,failed:90``. Statuses without a policy
+are kept.
+
+The expired tasks are removed in batches of their primary keys, each batch in its own
+transaction, so no long-running locks are taken. Their creation time and status are
+indexed, so finding a batch doesn't depend on the number of tasks that are kept.
+Optionally, the removed tasks and their logs are archived to a gzipped JSON lines file
+first.
+
+Tasks created before their creation time was recorded are not removed until they get
+the time of their first log, once, with the ``date_undated_tasks`` management command.
+"""
+
+import gzip
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import IO, List, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models.functions import Cast, Coalesce, Now
+from django.utils import timezone
+
+from timeline_logger.models import TimelineLog
+
+from .models import BaseTask
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+@dataclass
+class RetentionPolicy:
+    status: str
+    days: int
+
+
+@dataclass
+class PruneResult:
+    tasks: int = 0
+    logs: int = 0
+    archive: str = ""
+
+
+def get_policies() -> List[RetentionPolicy]:
+    """
+    Parse the configured retention policies.
+    """
+    policies = []
+    for policy in settings.TASK_RETENTION:
+        status, days = policy.split(":", 1)
+        policies.append(RetentionPolicy(status=status.strip(), days=int(days)))
+    return policies
+
+
+def get_task_content_types() -> List[ContentType]:
+    # the logs refer to the concrete task models
+    task_models = [model for model in apps.get_models() if issubclass(model, BaseTask)]
+    return list(ContentType.objects.get_for_models(*task_models).values())
+
+
+def get_logs(task_ids: List[int]) -> models.QuerySet:
+    return TimelineLog.objects.filter(
+        content_type__in=get_task_content_types(),
+        object_id__in=[str(task_id) for task_id in task_ids],
+    )
+
+
+def date_undated_tasks(batch_size: int = BATCH_SIZE) -> int:
+    """
+    Set the creation time of tasks created before it was recorded.
+    """
+    first_log = (
+        TimelineLog.objects.filter(
+            content_type__in=get_task_content_types(),
+            object_id=Cast(models.OuterRef("pk"), models.TextField()),
+        )
+        .order_by("timestamp")
+        .values("timestamp")[:1]
+    )
+    undated = BaseTask.objects.non_polymorphic().filter(created__isnull=True)
+
+    dated = 0
+    while task_ids := list(
+        undated.order_by("pk").values_list("pk", flat=True)[:batch_size]
+    ):
+        dated += (
+            BaseTask.objects.non_polymorphic()
+            .filter(pk__in=task_ids)
+            .update(created=Coalesce(models.Subquery(first_log), Now()))
+        )
+    return dated
+
+
+def serialize_task(task: BaseTask, logs: List[TimelineLog]) -> dict:
+    data = {
+        field.attname: getattr(task, field.attname)
+        for field in task._meta.concrete_fields
+    }
+    data["model"] = task._meta.label_lower
+    data["logs"] = [
+        {"timestamp": log.timestamp, "extra_data": log.extra_data} for log in logs
+    ]
+    return data
+
+
+def archive_tasks(archive: IO, task_ids: List[int]) -> None:
+    logs = {}
+    for log in get_logs(task_ids).order_by("pk"):
+        logs.setdefault(int(log.object_id), []).append(log)
+
+    for task in BaseTask.objects.filter(pk__in=task_ids).order_by("pk"):
+        data = serialize_task(task, logs.get(task.pk, []))
+        archive.write(f"{json.dumps(data, cls=DjangoJSONEncoder)}\n")
+    archive.flush()
+
+
+def get_expired_tasks(policy: RetentionPolicy) -> models.QuerySet:
+    expired_before = timezone.now() - timedelta(days=policy.days)
+    return BaseTask.objects.non_polymorphic().filter(
+        status=policy.status, created__lt=expired_before
+    )
+
+
+def prune(
+    batch_size: int = BATCH_SIZE, archive_dir: Optional[str] = None
+) -> PruneResult:
+    """
+    Remove the tasks expired according to the retention policies, with their logs.
+
+    :param archive_dir: the directory to archive the removed tasks to. Defaults to
+      the ``TASK_RETENTION_ARCHIVE_DIR`` setting, an empty value disables archiving.
+    """
+    result = PruneResult()
+    policies = get_policies()
+    if not policies:
+        return result
+
+    archive_dir = (
+        settings.TASK_RETENTION_ARCHIVE_DIR if archive_dir is None else archive_dir
+    )
+    archive = None
+    try:
+        for policy in policies:
+            expired = get_expired_tasks(policy).order_by("pk")
+            while task_ids := list(expired.values_list("pk", flat=True)[:batch_size]):
+                if archive_dir and archive is None:
+                    filename = timezone.now().strftime("tasks-%Y%m%d%H%M%S.jsonl.gz")
+                    result.archive = os.path.join(archive_dir, filename)
+                    archive = gzip.open(result.archive, "wt", encoding="utf-8")
+                if archive is not None:
+                    archive_tasks(archive, task_ids)
+
+                with transaction.atomic():
+                    result.logs += get_logs(task_ids).delete()[0]
+                    BaseTask.objects.non_polymorphic().filter(pk__in=task_ids).delete()
+                result.tasks += len(task_ids)
+                logger.info(
+                    "Removed %d %s task(s) older than %d days",
+                    len(task_ids),
+                    policy.status,
+                    policy.days,
+                )
+    finally:
+        if archive is not None:
+            archive.close()
+    return result
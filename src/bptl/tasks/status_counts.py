@@ -0,0 +1,196 @@
+"""
+Maintain the number of tasks per status for the dashboard.
+
+The dashboard shows the number of tasks per engine type by the last status they had in
+the past 24 hours. Rather than finding the last status log of every task in the
+timeline, the counts are kept per engine type, status and hour in
+:class:`bptl.tasks.models.StatusCount` whenever a status is logged: the count of the
+new status is incremented in the current hour, and the count of the previous status
+is decremented in the hour it was logged. The counts of a period are then the sum of
+its hours.
+
+Every status log of the current hour updates the same counts, so each count is spread
+over ``SLOTS`` rows. A transaction updates the rows of a random slot, and the rows are
+summed when the counts are read.
+"""
+
+import random
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import TruncHour
+
+from timeline_logger.models import TimelineLog
+
+from bptl.utils.constants import Statuses
+
+from .models import BaseTask, StatusCount
+
+# number of rows each count is spread over
+SLOTS = 8
+
+
+def get_engine_types() -> Dict[type, str]:
+    # imported here, the engine mapping imports the task models of all engines
+    from .engine_mapping import ENGINETYPE_MODEL_MAPPING
+
+    return {
+        model: engine_type for engine_type, model in ENGINETYPE_MODEL_MAPPING.items()
+    }
+
+
+def get_hour(timestamp: datetime) -> datetime:
+    return timestamp.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _update(changes: Counter) -> None:
+    slot = random.randrange(SLOTS)
+    # the rows are locked in the same order by all transactions, to avoid deadlocks
+    for (engine_type, status, hour), delta in sorted(changes.items()):
+        if not delta:
+            continue
+        lookup = {
+            "engine_type": engine_type,
+            "status": status,
+            "hour": hour,
+            "slot": slot,
+        }
+        counts = StatusCount.objects.filter(**lookup)
+        if counts.update(count=models.F("count") + delta):
+            continue
+        try:
+            with transaction.atomic():
+                StatusCount.objects.create(count=delta, **lookup)
+        except IntegrityError:
+            # created concurrently
+            counts.update(count=models.F("count") + delta)
+
+
+def _get_previous(task: BaseTask) -> Optional[TimelineLog]:
+    return (
+        task.logs.filter(extra_data__status__in=Statuses.values)
+        .order_by("-timestamp")
+        .first()
+    )
+
+
+def _count(
+    changes: Counter,
+    task: BaseTask,
+    log: TimelineLog,
+    previous: Optional[TimelineLog] = None,
+) -> None:
+    engine_type = get_engine_types().get(type(task))
+    if engine_type is None:
+        return
+    changes[(engine_type, task.status, get_hour(log.timestamp))] += 1
+    if previous is not None:
+        hour = get_hour(previous.timestamp)
+        changes[(engine_type, previous.extra_data["status"], hour)] -= 1
+
+
+def log_status(task: BaseTask, new: bool = False) -> TimelineLog:
+    """
+    Write the current status of ``task`` to the timeline and count it.
+
+    Pass ``new=True`` for a task without status logs, so its previous status isn't
+    looked up.
+    """
+    changes = Counter()
+    with transaction.atomic():
+        previous = None if new else _get_previous(task)
+        log = TimelineLog.objects.create(
+            content_object=task, extra_data={"status": task.status}
+        )
+        _count(changes, task, log, previous=previous)
+        _update(changes)
+    return log
+
+
+def bulk_log_status(tasks: List[BaseTask], new: bool = False) -> None:
+    """
+    Write the current status of each task to the timeline in one query and count it.
+
+    Pass ``new=True`` for tasks without status logs, so their previous status isn't
+    looked up.
+    """
+    changes = Counter()
+    with transaction.atomic():
+        previous = {} if new else {task.pk: _get_previous(task) for task in tasks}
+        logs = TimelineLog.objects.bulk_create(
+            [
+                TimelineLog(content_object=task, extra_data={"status": task.status})
+                for task in tasks
+            ]
+        )
+        for task, log in zip(tasks, logs):
+            _count(changes, task, log, previous=previous.get(task.pk))
+        _update(changes)
+
+
+def get_status_counts(since: datetime) -> Dict[str, Dict[str, int]]:
+    """
+    Return the number of tasks per engine type and status since the hour of ``since``.
+    """
+    counts = (
+        StatusCount.objects.filter(hour__gte=get_hour(since))
+        .values("engine_type", "status")
+        .annotate(tasks=models.Sum("count"))
+        .order_by()
+    )
+    items = {}
+    for count in counts:
+        # statuses logged before the counts were kept are only decremented
+        if count["tasks"] <= 0:
+            continue
+        items.setdefault(count["engine_type"], {})[count["status"]] = count["tasks"]
+    return items
+
+
+def rebuild(since: datetime) -> int:
+    """
+    Recount the tasks by their last status logged since ``since``, from the timeline.
+
+    Returns the number of counted tasks.
+    """
+    engine_types = get_engine_types()
+    content_types = ContentType.objects.get_for_models(*engine_types)
+    ct_id_to_engine_type = {
+        ct.id: engine_types[model] for model, ct in content_types.items()
+    }
+
+    last_logs = (
+        TimelineLog.objects.filter(
+            content_type__in=content_types.values(),
+            extra_data__status__in=Statuses.values,
+            timestamp__gte=since,
+        )
+        .distinct("content_type", "object_id")
+        .order_by("content_type", "object_id", "-timestamp")
+    )
+    # separate qs because annotate + distinct is not possible
+    counts = (
+        TimelineLog.objects.filter(pk__in=last_logs.values("pk"))
+        .annotate(hour=TruncHour("timestamp", tzinfo=timezone.utc))
+        .values("content_type_id", "extra_data__status", "hour")
+        .annotate(tasks=models.Count("pk"))
+        .order_by()
+    )
+
+    with transaction.atomic():
+        StatusCount.objects.all().delete()
+        StatusCount.objects.bulk_create(
+            [
+                StatusCount(
+                    engine_type=ct_id_to_engine_type[count["content_type_id"]],
+                    status=count["extra_data__status"],
+                    hour=count["hour"],
+                    count=count["tasks"],
+                )
+                for count in counts
+            ]
+        )
+    return sum(count["tasks"] for count in counts)
@@ -0,0 +1,21 @@
+"""celery tasks to maintain the tasks"""
+
+from dataclasses import asdict
+
+from celery_once import QueueOnce
+
+from ..celery import app
+from .retention import prune
+
+__all__ = ("task_prune_tasks",)
+
+
+@app.task(base=QueueOnce, once={"graceful": True})
+def task_prune_tasks():
+    """
+    Remove the tasks expired according to the retention policies.
+
+    Intended to be scheduled periodically with celery beat.
+    """
+    result = prune()
+    return asdict(result)
@@ -1,9 +1,15 @@
-from django.test import TestCase, tag
+from django.test import TestCase, override_settings, tag
 from django.utils import timezone
 
+from asgiref.sync import async_to_sync, sync_to_async
+from freezegun import freeze_time
+
 from bptl.camunda.tests.factories import ExternalTaskFactory
+from bptl.utils import timeline
+from bptl.utils.concurrent import parallel
 
-from ..api import NoCallback, TaskExpired, execute
+from ..api import NoCallback, TaskExpired, aexecute, execute, execute_many
+from ..base import AsyncWorkUnit
 from ..registry import WorkUnitRegistry
 from .factories import TaskMappingFactory
 
@@ -20,6 +26,57 @@ def task_2(task):
     return {"task_run": "task_2"}
 
 
+@register
+async def async_task(task):
+    return {"task_run": "async_task"}
+
+
+@register
+class AsyncTask(AsyncWorkUnit):
+    async def perform(self):
+        return {"task_run": "AsyncTask"}
+
+
+def log_requests(task, count=3):
+    for i in range(count):
+        timeline.log(task, {"request": {"url": f"https://example.com/{i}"}})
+    # nothing is written during the execution
+    assert not task.request_logs().exists()
+
+
+@register
+def logging_task(task):
+    log_requests(task)
+    return {"task_run": "logging_task"}
+
+
+@register
+def failing_logging_task(task):
+    log_requests(task)
+    raise Exception("The task is broken")
+
+
+@register
+async def async_logging_task(task):
+    await sync_to_async(log_requests, thread_sensitive=False)(task)
+    return {"task_run": "async_logging_task"}
+
+
+def perform_batch(tasks):
+    if any(task.topic_name == "broken" for task in tasks):
+        raise Exception("The batch is broken")
+    return [
+        {"task_run": "batch", "size": len(tasks)} if task.priority else ValueError("no")
+        for task in tasks
+    ]
+
+
+@register
+@register.batch(perform_batch)
+def batched_task(task):
+    return {"task_run": "batched_task"}
+
+
 @tag("public-api")
 class RouteTaskTests(TestCase):
     def test_route_to_correct_task(self):
@@ -66,3 +123,213 @@ class RouteTaskTests(TestCase):
 
         with self.assertRaises(TaskExpired):
             execute(task1, registry=register)
+
+
+@tag("public-api")
+class AsyncExecuteTests(TestCase):
+    def test_execute_async_work_units(self):
+        for callback in (async_task, AsyncTask):
+            with self.subTest(callback=callback):
+                TaskMappingFactory.create(
+                    topic_name=callback.__name__, callback=register.get_for(callback)
+                )
+                task = ExternalTaskFactory.create(topic_name=callback.__name__)
+
+                execute(task, registry=register)
+
+                task.refresh_from_db()
+                self.assertEqual(task.status, "performed")
+                self.assertEqual(task.result_variables, {"task_run": callback.__name__})
+
+    def test_aexecute(self):
+        for callback in (task_1, async_task, AsyncTask):
+            with self.subTest(callback=callback):
+                TaskMappingFactory.create(
+                    topic_name=callback.__name__, callback=register.get_for(callback)
+                )
+                task = ExternalTaskFactory.create(topic_name=callback.__name__)
+
+                result = async_to_sync(aexecute)(task, registry=register)
+
+                self.assertEqual(result, {"task_run": callback.__name__})
+                task.refresh_from_db()
+                self.assertEqual(task.status, "performed")
+                self.assertEqual(task.status_logs().count(), 1)
+
+    def test_aexecute_no_mapping_configured(self):
+        task = ExternalTaskFactory.create(topic_name="task-1")
+
+        with self.assertRaises(NoCallback):
+            async_to_sync(aexecute)(task, registry=register)
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, "failed")
+        self.assertIn("NoCallback", task.execution_error)
+
+
+@tag("public-api")
+class ExecuteManyTests(TestCase):
+    def test_batches_per_topic(self):
+        TaskMappingFactory.create(
+            topic_name="batched", callback=register.get_for(batched_task)
+        )
+        TaskMappingFactory.create(
+            topic_name="task-1", callback=register.get_for(task_1)
+        )
+        task1 = ExternalTaskFactory.create(topic_name="batched", priority=1)
+        task2 = ExternalTaskFactory.create(topic_name="task-1")
+        task3 = ExternalTaskFactory.create(topic_name="batched", priority=0)
+        task4 = ExternalTaskFactory.create(topic_name="batched", priority=1)
+
+        results = execute_many([task1, task2, task3, task4], registry=register)
+
+        batch_result = {"task_run": "batch", "size": 3}
+        self.assertEqual(results[0], batch_result)
+        self.assertEqual(results[1], {"task_run": "task_1"})
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(results[3], batch_result)
+        for task in (task1, task2, task3, task4):
+            task.refresh_from_db()
+            self.assertEqual(task.status_logs().count(), 1)
+        self.assertEqual(task1.status, "performed")
+        self.assertEqual(task1.result_variables, batch_result)
+        self.assertEqual(task2.status, "performed")
+        self.assertEqual(task3.status, "failed")
+        self.assertIn("ValueError: no", task3.execution_error)
+        self.assertEqual(task4.status, "performed")
+
+    def test_batch_failure(self):
+        TaskMappingFactory.create(
+            topic_name="broken", callback=register.get_for(batched_task)
+        )
+        tasks = ExternalTaskFactory.create_batch(2, topic_name="broken")
+
+        results = execute_many(tasks, registry=register)
+
+        self.assertEqual(len(results), 2)
+        for task in tasks:
+            task.refresh_from_db()
+            self.assertEqual(task.status, "failed")
+            self.assertIn("The batch is broken", task.execution_error)
+
+    def test_no_mapping_configured(self):
+        TaskMappingFactory.create(
+            topic_name="task-1", callback=register.get_for(task_1)
+        )
+        task1 = ExternalTaskFactory.create(topic_name="unknown")
+        task2 = ExternalTaskFactory.create(topic_name="task-1")
+
+        results = execute_many([task1, task2], registry=register)
+
+        self.assertIsInstance(results[0], NoCallback)
+        self.assertEqual(results[1], {"task_run": "task_1"})
+        task1.refresh_from_db()
+        self.assertEqual(task1.status, "failed")
+
+
+@tag("public-api")
+class RequestLogsTests(TestCase):
+    def _create_task(self, callback):
+        TaskMappingFactory.create(
+            topic_name=callback.__name__, callback=register.get_for(callback)
+        )
+        return ExternalTaskFactory.create(topic_name=callback.__name__)
+
+    def test_request_logs_written_after_execution(self):
+        task = self._create_task(logging_task)
+
+        execute(task, registry=register)
+
+        self.assertEqual(task.request_logs().count(), 3)
+        # the outcome is logged after the requests
+        self.assertEqual(
+            task.logs.order_by("pk").last().extra_data, {"status": "performed"}
+        )
+
+    def test_request_logs_written_on_failure(self):
+        task = self._create_task(failing_logging_task)
+
+        with self.assertRaises(Exception):
+            execute(task, registry=register)
+
+        self.assertEqual(task.request_logs().count(), 3)
+        self.assertEqual(task.status_logs().get().extra_data, {"status": "failed"})
+
+    def test_request_logs_written_after_async_execution(self):
+        task = self._create_task(async_logging_task)
+
+        async_to_sync(aexecute)(task, registry=register)
+
+        self.assertEqual(task.request_logs().count(), 3)
+
+    def test_request_logs_written_after_execute_many(self):
+        task = self._create_task(logging_task)
+
+        execute_many([task], registry=register)
+
+        self.assertEqual(task.request_logs().count(), 3)
+
+    @override_settings(TIMELINE_LOG_BATCH_SIZE=2)
+    def test_full_batch_written(self):
+        task = ExternalTaskFactory.create()
+
+        with timeline.buffer_logs():
+            for i in range(3):
+                timeline.log(task, {"request": {"url": f"https://example.com/{i}"}})
+            self.assertEqual(task.request_logs().count(), 2)
+
+        self.assertEqual(task.request_logs().count(), 3)
+
+    @override_settings(TIMELINE_LOG_BATCH_SIZE=0)
+    def test_buffer_disabled(self):
+        task = ExternalTaskFactory.create()
+
+        with timeline.buffer_logs():
+            timeline.log(task, {"request": {"url": "https://example.com"}})
+            self.assertEqual(task.request_logs().count(), 1)
+
+    def test_buffered_timestamps(self):
+        task = ExternalTaskFactory.create()
+
+        with freeze_time("2020-01-01 12:00:00") as frozen_time:
+            with timeline.buffer_logs():
+                timeline.log(task, {"request": {"url": "https://example.com"}})
+                frozen_time.move_to("2020-01-01 12:05:00")
+
+        self.assertEqual(
+            task.request_logs().get().timestamp.isoformat(), "2020-01-01T12:00:00+00:00"
+        )
+
+    def test_failed_batch_written_one_by_one(self):
+        task = ExternalTaskFactory.create()
+
+        with timeline.buffer_logs():
+            timeline.log(task, {"request": {"url": "https://example.com/1"}})
+            # null characters can't be stored in jsonb
+            timeline.log(task, {"request": {"url": "https://example.com/\u0000"}})
+            timeline.log(task, {"request": {"url": "https://example.com/2"}})
+
+        self.assertEqual(
+            [log.extra_data["request"]["url"] for log in task.request_logs()],
+            ["https://example.com/2", "https://example.com/1"],
+        )
+
+    def test_parallel_requests_buffered(self):
+        task = ExternalTaskFactory.create()
+
+        with timeline.buffer_logs():
+            with parallel() as executor:
+                list(
+                    executor.map(
+                        lambda i: timeline.log(
+                            task, {"request": {"url": f"https://example.com/{i}"}}
+                        ),
+                        range(3),
+                    )
+                )
+                executor.submit(
+                    timeline.log, task, {"request": {"url": "https://example.com"}}
+                ).result()
+            self.assertEqual(task.request_logs().count(), 0)
+
+        self.assertEqual(task.request_logs().count(), 4)
@@ -127,3 +127,60 @@ class TaskRegistryTests(SimpleTestCase):
         self.assertEqual(task.name, "sample_task")
         self.assertEqual(task.documentation, "Sample docstring.")
         self.assertEqual(task.dotted_path, dotted_path)
+
+    def test_require_variables(self):
+        @register.require_variables("zaakUrl")
+        class BaseUnit:
+            def __init__(self, task):
+                pass
+
+            def perform(self):
+                pass
+
+        @register.require_variables("zaaktype", "zaakUrl")
+        class Unit(BaseUnit):
+            pass
+
+        def undeclared(task):
+            pass
+
+        register(Unit)
+        register(undeclared)
+
+        task = register[f"{Unit.__module__}.{Unit.__qualname__}"]
+        self.assertEqual(task.required_variables, ["zaakUrl", "zaaktype", "zaakUrl"])
+        self.assertEqual(BaseUnit._required_variables, ["zaakUrl"])
+        task = register[f"{undeclared.__module__}.{undeclared.__qualname__}"]
+        self.assertIsNone(task.required_variables)
+
+    def test_batch_entry_point(self):
+        def perform_many(tasks):
+            return [{} for task in tasks]
+
+        @register.batch(perform_many)
+        def batched(task):
+            pass
+
+        def single(task):
+            pass
+
+        register(batched)
+        register(single)
+
+        task = register[f"{batched.__module__}.{batched.__qualname__}"]
+        self.assertIs(task.perform_many, perform_many)
+        task = register[f"{single.__module__}.{single.__qualname__}"]
+        self.assertIsNone(task.perform_many)
+
+    def test_batch_entry_point_not_callable(self):
+        class Task:
+            perform_many = "not callable"
+
+            def __init__(self, task):
+                pass
+
+            def perform(self):
+                pass
+
+        with self.assertRaises(TypeError):
+            register(Task)
@@ -0,0 +1,132 @@
+import gzip
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+from timeline_logger.models import TimelineLog
+
+from bptl.camunda.models import ExternalTask
+from bptl.camunda.tests.factories import ExternalTaskFactory
+from bptl.crontask.models import CronTask
+from bptl.utils.constants import Statuses
+
+from ..models import BaseTask
+from ..retention import date_undated_tasks, prune
+
+NOW = timezone.make_aware(timezone.datetime(2020, 6, 1, 12))
+
+
+def create_task(days_ago: int, status: str, model=ExternalTask):
+    with freeze_time(NOW - timedelta(days=days_ago)):
+        if model is ExternalTask:
+            task = ExternalTaskFactory.create(status=status)
+        else:
+            task = model.objects.create(topic_name="some-topic", status=status)
+        TimelineLog.objects.create(content_object=task, extra_data={"status": status})
+    return task
+
+
+@freeze_time(NOW)
+@override_settings(TASK_RETENTION=["completed:30", "failed:90"])
+class PruneTests(TestCase):
+    def test_expired_tasks_removed(self):
+        expired = [
+            create_task(31, Statuses.completed),
+            create_task(31, Statuses.completed, model=CronTask),
+            create_task(91, Statuses.failed),
+        ]
+        kept = [
+            create_task(29, Statuses.completed),
+            create_task(31, Statuses.failed),
+            create_task(365, Statuses.in_progress),
+        ]
+
+        result = prune(batch_size=1)
+
+        self.assertEqual(result.tasks, 3)
+        self.assertEqual(result.logs, 3)
+        self.assertEqual(
+            list(BaseTask.objects.order_by("pk").values_list("pk", flat=True)),
+            [task.pk for task in kept],
+        )
+        self.assertFalse(ExternalTask.objects.filter(pk=expired[0].pk).exists())
+        self.assertFalse(CronTask.objects.filter(pk=expired[1].pk).exists())
+        self.assertEqual(TimelineLog.objects.count(), 3)
+
+    @override_settings(TASK_RETENTION=[])
+    def test_no_policies(self):
+        create_task(365, Statuses.completed)
+
+        result = prune()
+
+        self.assertEqual(result.tasks, 0)
+        self.assertEqual(BaseTask.objects.count(), 1)
+
+    def test_archive(self):
+        task = create_task(31, Statuses.completed)
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            result = prune(archive_dir=archive_dir)
+
+            with gzip.open(result.archive, "rt") as archive:
+                lines = [json.loads(line) for line in archive]
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]["id"], task.pk)
+        self.assertEqual(lines[0]["model"], "camunda.externaltask")
+        self.assertEqual(lines[0]["task_id"], task.task_id)
+        self.assertEqual(lines[0]["logs"][0]["extra_data"], {"status": "completed"})
+
+    def test_nothing_archived(self):
+        create_task(1, Statuses.completed)
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            result = prune(archive_dir=archive_dir)
+
+        self.assertEqual(result.archive, "")
+
+    def test_undated_tasks(self):
+        task = create_task(31, Statuses.completed)
+        undated = create_task(31, Statuses.completed)
+        ExternalTask.objects.filter(pk__in=[task.pk, undated.pk]).update(created=None)
+        TimelineLog.objects.filter(object_id=str(undated.pk)).delete()
+
+        self.assertEqual(date_undated_tasks(), 2)
+
+        task.refresh_from_db()
+        undated.refresh_from_db()
+        self.assertEqual(task.created, NOW - timedelta(days=31))
+        # without logs, the task is considered new
+        self.assertGreater(undated.created, NOW - timedelta(days=1))
+
+    def test_undated_tasks_kept(self):
+        task = create_task(31, Statuses.completed)
+        ExternalTask.objects.filter(pk=task.pk).update(created=None)
+
+        result = prune()
+
+        self.assertEqual(result.tasks, 0)
+        self.assertTrue(ExternalTask.objects.filter(pk=task.pk).exists())
+
+    def test_date_undated_tasks_command(self):
+        task = create_task(31, Statuses.completed)
+        ExternalTask.objects.filter(pk=task.pk).update(created=None)
+        stdout = StringIO()
+
+        call_command("date_undated_tasks", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), "Dated 1 task(s).\n")
+
+    def test_command(self):
+        create_task(31, Statuses.completed)
+        stdout = StringIO()
+
+        call_command("prune_tasks", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), "Removed 1 task(s) and 1 log(s).\n")
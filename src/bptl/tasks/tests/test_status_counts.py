@@ -0,0 +1,177 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db.models import Sum
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from freezegun import freeze_time
+from rest_framework.test import APITestCase
+from timeline_logger.models import TimelineLog
+
+from bptl.camunda.tests.factories import ExternalTaskFactory
+from bptl.crontask.models import CronTask
+from bptl.utils.constants import Statuses
+
+from ..constants import EngineTypes
+from ..models import StatusCount
+from ..status_counts import bulk_log_status, get_status_counts, log_status, rebuild
+
+NOW = timezone.make_aware(timezone.datetime(2020, 6, 1, 12, 30))
+
+
+def set_status(task, status: str, hours_ago: int = 0, new: bool = False):
+    task.status = status
+    task.save()
+    with freeze_time(NOW - timedelta(hours=hours_ago)):
+        log_status(task, new=new)
+
+
+@freeze_time(NOW)
+class StatusCountTests(TestCase):
+    def test_new_tasks_counted(self):
+        task = ExternalTaskFactory.create()
+        set_status(task, Statuses.initial, new=True)
+        cron_task = CronTask.objects.create(topic_name="some-topic")
+        set_status(cron_task, Statuses.initial, new=True)
+
+        counts = get_status_counts(NOW - timedelta(hours=24))
+
+        self.assertEqual(
+            counts,
+            {
+                EngineTypes.camunda: {Statuses.initial: 1},
+                EngineTypes.crontask: {Statuses.initial: 1},
+            },
+        )
+
+    def test_transition_moves_count(self):
+        task = ExternalTaskFactory.create()
+        set_status(task, Statuses.initial, hours_ago=2, new=True)
+        set_status(task, Statuses.in_progress, hours_ago=1)
+        set_status(task, Statuses.completed)
+
+        counts = get_status_counts(NOW - timedelta(hours=24))
+
+        self.assertEqual(counts, {EngineTypes.camunda: {Statuses.completed: 1}})
+        self.assertEqual(
+            StatusCount.objects.filter(status=Statuses.initial).aggregate(
+                count=Sum("count")
+            )["count"],
+            0,
+        )
+
+    @patch("bptl.tasks.status_counts.random.randrange", side_effect=[0, 1, 1])
+    def test_spread_over_slots(self, m_randrange):
+        tasks = ExternalTaskFactory.create_batch(3)
+        for task in tasks:
+            set_status(task, Statuses.initial, new=True)
+
+        counts = get_status_counts(NOW - timedelta(hours=24))
+
+        self.assertEqual(counts, {EngineTypes.camunda: {Statuses.initial: 3}})
+        self.assertEqual(
+            dict(StatusCount.objects.values_list("slot", "count")), {0: 1, 1: 2}
+        )
+
+    def test_counted_by_last_status_in_period(self):
+        task = ExternalTaskFactory.create()
+        set_status(task, Statuses.initial, hours_ago=30, new=True)
+        other_task = ExternalTaskFactory.create()
+        set_status(other_task, Statuses.initial, hours_ago=30, new=True)
+        set_status(other_task, Statuses.failed, hours_ago=1)
+
+        counts = get_status_counts(NOW - timedelta(hours=24))
+
+        self.assertEqual(counts, {EngineTypes.camunda: {Statuses.failed: 1}})
+
+    def test_bulk_log_status(self):
+        tasks = ExternalTaskFactory.create_batch(2, status=Statuses.initial)
+        bulk_log_status(tasks, new=True)
+        for task in tasks:
+            task.status = Statuses.failed
+        bulk_log_status(tasks)
+
+        counts = get_status_counts(NOW - timedelta(hours=24))
+
+        self.assertEqual(counts, {EngineTypes.camunda: {Statuses.failed: 2}})
+        self.assertEqual(TimelineLog.objects.count(), 4)
+
+    def test_rebuild(self):
+        task = ExternalTaskFactory.create(status=Statuses.completed)
+        for status, hours_ago in [(Statuses.initial, 2), (Statuses.completed, 1)]:
+            with freeze_time(NOW - timedelta(hours=hours_ago)):
+                TimelineLog.objects.create(
+                    content_object=task, extra_data={"status": status}
+                )
+        cron_task = CronTask.objects.create(topic_name="some-topic")
+        TimelineLog.objects.create(
+            content_object=cron_task, extra_data={"status": Statuses.initial}
+        )
+        StatusCount.objects.create(
+            engine_type=EngineTypes.camunda,
+            status=Statuses.failed,
+            hour=NOW.replace(minute=0),
+            count=-1,
+        )
+
+        stdout = StringIO()
+        call_command("rebuild_status_counts", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue().strip(), "Counted 2 task(s).")
+        self.assertEqual(
+            get_status_counts(NOW - timedelta(hours=24)),
+            {
+                EngineTypes.camunda: {Statuses.completed: 1},
+                EngineTypes.crontask: {Statuses.initial: 1},
+            },
+        )
+        self.assertEqual(
+            StatusCount.objects.get(engine_type=EngineTypes.camunda).hour,
+            NOW.replace(minute=0) - timedelta(hours=1),
+        )
+
+    def test_rebuild_since(self):
+        task = ExternalTaskFactory.create(status=Statuses.completed)
+        with freeze_time(NOW - timedelta(hours=30)):
+            TimelineLog.objects.create(
+                content_object=task, extra_data={"status": Statuses.completed}
+            )
+
+        self.assertEqual(rebuild(NOW - timedelta(hours=24)), 0)
+        self.assertFalse(StatusCount.objects.exists())
+
+
+@freeze_time(NOW)
+class AggregateAPITests(APITestCase):
+    url = reverse("dashboard:dashboard-api:aggregate")
+
+    def test_counts(self):
+        task = ExternalTaskFactory.create()
+        set_status(task, Statuses.initial, new=True)
+        set_status(task, Statuses.failed)
+        cron_task = CronTask.objects.create(topic_name="some-topic")
+        set_status(cron_task, Statuses.failed, new=True)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["items"],
+            {
+                EngineTypes.camunda: {Statuses.failed: 1},
+                EngineTypes.crontask: {Statuses.failed: 1},
+            },
+        )
+        self.assertEqual(response.json()["total"], {Statuses.failed: 2})
+
+    def test_no_counts(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        total = response.json()["total"]
+        self.assertEqual(set(total), set(Statuses.values))
+        self.assertEqual(set(total.values()), {0})
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List
 
-from zgw_consumers.concurrent import parallel
+from bptl.utils.concurrent import parallel
 
 
 class mock_parallel(parallel):
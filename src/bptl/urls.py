@@ -29,6 +29,7 @@ urlpatterns = [
     path("tasks/", include("bptl.dashboard.urls")),
     path("taskmappings/", include("bptl.tasks.urls")),
     path("camunda/", include("bptl.camunda.urls")),
+    path("zgw/", include("bptl.work_units.zgw.urls")),
     path("schema", SpectacularAPIView.as_view(schema=None), name="api-schema"),
     path(
         "docs/",
@@ -4,6 +4,16 @@ from django.conf import settings
 from django.core.checks import Error, Warning, register
 from django.forms import ModelForm
 
+PROCESS_LOCAL_CACHE_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+def is_process_local_cache(alias: str) -> bool:
+    """
+    Return whether the entries of cache ``alias`` are only visible to the process.
+    """
+    backend = settings.CACHES.get(alias, {}).get("BACKEND")
+    return backend in PROCESS_LOCAL_CACHE_BACKENDS
+
 
 def get_subclasses(cls):
     for subclass in cls.__subclasses__():
@@ -0,0 +1,29 @@
+"""
+Run functions concurrently in the context of the caller.
+"""
+
+from contextvars import copy_context
+
+from zgw_consumers.concurrent import parallel as _parallel
+
+
+class parallel(_parallel):
+    """
+    :class:`zgw_consumers.concurrent.parallel` that copies the context variables.
+
+    The threads of a thread pool start with an empty context, so the functions are run
+    in a copy of the context of the caller. This keeps e.g. the request logs of a task
+    execution in its timeline buffer, see :mod:`bptl.utils.timeline`.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(copy_context().run, fn, *args, **kwargs)
+
+    def map(self, fn, *iterables, timeout=None, chunksize=1):
+        context = copy_context()
+
+        def run(*args):
+            # a context can only be entered by one thread at a time
+            return context.copy().run(fn, *args)
+
+        return super().map(run, *iterables, timeout=timeout, chunksize=chunksize)
@@ -9,3 +9,5 @@ class Statuses(DjangoChoices):
     performed = ChoiceItem("performed", _("Performed"))
     failed = ChoiceItem("failed", _("Failed"))
     completed = ChoiceItem("completed", _("Completed"))
+    # replaced by a new row after it was orphaned, see bptl.camunda.sweeper
+    superseded = ChoiceItem("superseded", _("Superseded"))
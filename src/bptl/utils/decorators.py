@@ -8,9 +8,12 @@ from functools import wraps
 from django.core.cache import caches
 
 import requests
-from timeline_logger.models import TimelineLog
+from asgiref.sync import sync_to_async
+
+from bptl.tasks.status_counts import log_status
 
 from .constants import Statuses
+from .timeline import abuffer_logs, buffer_logs
 
 logger = logging.getLogger(__name__)
 
@@ -60,33 +63,64 @@ def cache(key: str, alias: str = "default", **set_options):
     return decorator
 
 
+def record_failure(task, error: str) -> None:
+    """
+    Mark ``task`` as failed with the formatted ``error``.
+    """
+    task.status = Statuses.failed
+    task.execution_error = error
+    task.save(update_fields=["status", "execution_error"])
+
+    log_status(task)
+
+
+def record_result(task, status, result) -> None:
+    """
+    Save the ``result`` of ``task`` with the given status.
+    """
+    task.status = status
+    if status == Statuses.performed:
+        task.result_variables = result
+    task.save(update_fields=["status", "result_variables"])
+
+    log_status(task)
+
+
 def save_and_log(status=Statuses.performed):
+    """
+    Save the outcome of the decorated (sync or async) function on the task.
+
+    The requests logged during the function are written to the timeline in batches,
+    before its outcome.
+    """
+
     def inner(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(task, *args, **kwargs):
+                try:
+                    async with abuffer_logs():
+                        result = await func(task, *args, **kwargs)
+                except Exception:
+                    await sync_to_async(record_failure)(task, traceback.format_exc())
+                    raise
+                else:
+                    await sync_to_async(record_result)(task, status, result)
+                return result
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(task, *args, **kwargs):
             try:
-                result = func(task, *args, **kwargs)
-            except Exception as exc:
-                task.status = Statuses.failed
-                task.execution_error = traceback.format_exc()
-                task.save(update_fields=["status", "execution_error"])
-
-                TimelineLog.objects.create(
-                    content_object=task, extra_data={"status": task.status}
-                )
-
+                with buffer_logs():
+                    result = func(task, *args, **kwargs)
+            except Exception:
+                record_failure(task, traceback.format_exc())
                 raise
-
             else:
-                task.status = status
-                if status == Statuses.performed:
-                    task.result_variables = result
-                task.save(update_fields=["status", "result_variables"])
-
-                TimelineLog.objects.create(
-                    content_object=task, extra_data={"status": task.status}
-                )
-
+                record_result(task, status, result)
             return result
 
         return wrapper
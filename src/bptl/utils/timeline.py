@@ -0,0 +1,134 @@
+"""
+Write the HTTP request logs of a task execution to the timeline in batches.
+
+Work units log every request they make to the timeline. Within :func:`buffer_logs`
+(entered by :func:`bptl.utils.decorators.save_and_log` around the execution of a task)
+the entries are collected and written with one ``bulk_create`` when the execution
+ends, whether it succeeded or failed, or as soon as ``TIMELINE_LOG_BATCH_SIZE``
+entries are collected. Outside of it, the entries are written immediately.
+
+The buffer is stored in a context variable, so it follows the execution into the
+threads of ``sync_to_async`` and the coroutines of an event loop. Thread pools don't
+copy the context: run concurrent requests through
+:class:`bptl.utils.concurrent.parallel`, otherwise their entries are written
+immediately. Buffered entries keep the time they were logged.
+"""
+
+import logging
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from asgiref.sync import sync_to_async
+from timeline_logger.models import TimelineLog
+
+logger = logging.getLogger(__name__)
+
+
+class LogBuffer:
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.entries: List[TimelineLog] = []
+        self._lock = threading.Lock()
+
+    def _take(self) -> List[TimelineLog]:
+        with self._lock:
+            entries, self.entries = self.entries, []
+        return entries
+
+    def add(self, entry: TimelineLog) -> None:
+        with self._lock:
+            self.entries.append(entry)
+            full = len(self.entries) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        entries = self._take()
+        if not entries:
+            return
+        try:
+            _insert(entries)
+            return
+        except Exception:
+            logger.warning(
+                "Could not write %d timeline log entries at once, writing them one "
+                "by one",
+                len(entries),
+                exc_info=True,
+            )
+        # losing a log is better than losing the outcome of the task, but one bad
+        # entry shouldn't take the others with it
+        for entry in entries:
+            try:
+                _insert([entry])
+            except Exception:
+                logger.exception("Could not write timeline log entry %r", entry)
+
+
+def _insert(entries: List[TimelineLog]) -> None:
+    # a savepoint keeps a surrounding transaction usable if the insert fails
+    with transaction.atomic():
+        # a raw insert keeps the timestamps, which auto_now_add would overwrite
+        TimelineLog._base_manager._insert(entries, fields=INSERT_FIELDS, raw=True)
+
+
+INSERT_FIELDS = [
+    field for field in TimelineLog._meta.local_concrete_fields if not field.primary_key
+]
+
+_buffer: ContextVar[Optional[LogBuffer]] = ContextVar("timeline_buffer", default=None)
+
+
+def log(content_object, extra_data: dict) -> None:
+    """
+    Log ``extra_data`` to the timeline of ``content_object``.
+    """
+    entry = TimelineLog(
+        content_object=content_object, extra_data=extra_data, timestamp=timezone.now()
+    )
+    buffer = _buffer.get()
+    if buffer is None:
+        entry.save()
+    else:
+        buffer.add(entry)
+
+
+def _start() -> tuple:
+    if not settings.TIMELINE_LOG_BATCH_SIZE or _buffer.get() is not None:
+        return None, None
+    buffer = LogBuffer(settings.TIMELINE_LOG_BATCH_SIZE)
+    return buffer, _buffer.set(buffer)
+
+
+@contextmanager
+def buffer_logs():
+    """
+    Collect the entries logged within the block and write them when it exits.
+    """
+    buffer, token = _start()
+    try:
+        yield
+    finally:
+        if buffer is not None:
+            _buffer.reset(token)
+            buffer.flush()
+
+
+@asynccontextmanager
+async def abuffer_logs():
+    """
+    Async variant of :func:`buffer_logs`.
+    """
+    buffer, token = _start()
+    try:
+        yield
+    finally:
+        if buffer is not None:
+            _buffer.reset(token)
+            await sync_to_async(buffer.flush)()
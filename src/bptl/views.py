@@ -1,9 +1,14 @@
 from django.utils.decorators import method_decorator
 from django.views.generic.base import TemplateView
 
+from .camunda.routing import get_priority_queues
 from .decorators import superuser_required
 
 
 @method_decorator(superuser_required, name="dispatch")
 class IndexView(TemplateView):
     template_name = "index.html"
+
+    def get_context_data(self, **kwargs):
+        kwargs.setdefault("priority_queues", get_priority_queues())
+        return super().get_context_data(**kwargs)
@@ -0,0 +1,161 @@
+"""
+Limit the payloads captured in the request logs of the work units.
+
+List responses and search results can be megabytes, which bloats the timeline. What is
+captured of a request is configured per topic on the task mapping, and per service on
+its default services, falling back to the ``REQUEST_LOG_*`` settings:
+
+* ``full``: the headers and bodies of all requests;
+* ``truncated``: the bodies are cut off after ``REQUEST_LOG_MAX_BODY_SIZE`` bytes;
+* ``headers``: the headers of all requests, without bodies;
+* ``errors``: the headers and bodies of error responses only.
+
+With a sample rate below 100%, only that share of the successful requests has its
+payloads captured. The method, URL and status of every request are always logged. Bodies
+over ``REQUEST_LOG_COMPRESS_THRESHOLD`` bytes are stored compressed, see
+:func:`decode_body`.
+"""
+
+import base64
+import json
+import random
+import zlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from bptl.tasks.constants import LogPayloads
+from bptl.tasks.models import BaseTask, DefaultService, TaskMapping
+
+POLICY_CACHE_ATTR = "_capture_policies"
+
+ENCODING = "zlib+base64"
+
+
+@dataclass(frozen=True)
+class CapturePolicy:
+    payloads: str
+    sample_rate: int
+
+    @classmethod
+    def default(cls) -> "CapturePolicy":
+        return cls(
+            payloads=settings.REQUEST_LOG_PAYLOADS,
+            sample_rate=settings.REQUEST_LOG_SAMPLE_RATE,
+        )
+
+    def override(self, config) -> "CapturePolicy":
+        """
+        Return the policy with the options set on ``config``.
+        """
+        if config is None:
+            return self
+        return CapturePolicy(
+            payloads=config.log_payloads or self.payloads,
+            sample_rate=(
+                self.sample_rate
+                if config.log_sample_rate is None
+                else config.log_sample_rate
+            ),
+        )
+
+    def _sampled(self) -> bool:
+        return self.sample_rate >= 100 or random.uniform(0, 100) < self.sample_rate
+
+    def capture(self, extra_data: dict) -> dict:
+        """
+        Strip the payloads from the ``extra_data`` of a request log.
+        """
+        is_error = extra_data["response"]["status"] >= 400
+        if self.payloads == LogPayloads.errors:
+            keep_headers = keep_bodies = is_error
+        else:
+            keep_headers = is_error or self._sampled()
+            keep_bodies = keep_headers and self.payloads != LogPayloads.headers
+        max_size = (
+            settings.REQUEST_LOG_MAX_BODY_SIZE
+            if self.payloads == LogPayloads.truncated and not is_error
+            else None
+        )
+
+        for section in ("request", "response"):
+            data = extra_data[section]
+            if not keep_headers:
+                data["headers"] = {}
+            if not keep_bodies:
+                data["data"] = None
+            elif data["data"] is not None:
+                data.update(encode_body(data["data"], max_size=max_size))
+        return extra_data
+
+
+def encode_body(body: Any, max_size: Optional[int] = None) -> dict:
+    """
+    Truncate the body to ``max_size`` bytes, or compress it when it's large.
+    """
+    threshold = settings.REQUEST_LOG_COMPRESS_THRESHOLD
+    if max_size is None and not threshold:
+        return {"data": body}
+
+    content = body if isinstance(body, str) else json.dumps(body, cls=DjangoJSONEncoder)
+    size = len(content.encode("utf-8"))
+
+    if max_size is not None and size > max_size:
+        truncated = content.encode("utf-8")[:max_size].decode("utf-8", "ignore")
+        return {"data": truncated, "size": size, "truncated": True}
+
+    if threshold and size > threshold:
+        compressed = zlib.compress(content.encode("utf-8"))
+        return {
+            "data": base64.b64encode(compressed).decode("ascii"),
+            "size": size,
+            "encoding": ENCODING,
+        }
+    return {"data": body}
+
+
+def decode_body(section: dict) -> Any:
+    """
+    Return the body of the ``request`` or ``response`` of a request log.
+
+    Compressed bodies are decompressed, truncated bodies are returned as (partial)
+    text.
+    """
+    if section.get("encoding") != ENCODING:
+        return section.get("data")
+    content = zlib.decompress(base64.b64decode(section["data"])).decode("utf-8")
+    try:
+        return json.loads(content)
+    except ValueError:
+        return content
+
+
+def _get_policies(task: BaseTask) -> dict:
+    task_mapping = TaskMapping.objects.filter(topic_name=task.topic_name).first()
+    policy = CapturePolicy.default().override(task_mapping)
+    policies = {None: policy}
+    if task_mapping is not None:
+        default_services = DefaultService.objects.filter(
+            task_mapping=task_mapping
+        ).select_related("service")
+        for default_service in default_services:
+            policies[default_service.service.api_root] = policy.override(
+                default_service
+            )
+    return policies
+
+
+def get_capture_policy(task: Optional[BaseTask], api_root: str) -> CapturePolicy:
+    """
+    Return the capture policy of the requests to ``api_root`` for ``task``.
+
+    The policies are looked up once per task execution.
+    """
+    if task is None:
+        return CapturePolicy.default()
+    policies = vars(task).get(POLICY_CACHE_ATTR)
+    if policies is None:
+        policies = vars(task)[POLICY_CACHE_ATTR] = _get_policies(task)
+    return policies.get(api_root, policies[None])
@@ -11,13 +11,16 @@ from urllib.parse import parse_qs, urljoin, urlparse
 
 import requests
 from requests.structures import CaseInsensitiveDict
-from timeline_logger.models import TimelineLog
 from zds_client.oas import schema_fetcher
-from zds_client.schema import get_headers, get_operation_url
 from zgw_consumers.models import Service
 
 from bptl.credentials.api import get_credentials
 from bptl.tasks.base import BaseTask
+from bptl.utils import timeline
+
+from .capture import get_capture_policy
+from .oas import SchemaIndex, schema_indexes
+from .pools import pool_registry
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +56,7 @@ class JSONClient:
     """
 
     task = None
-    _schema = None
+    _schema_index = None
 
     operation_suffix_mapping = {
         "list": "_list",
@@ -66,19 +69,28 @@ class JSONClient:
 
     @property
     def schema(self):
-        if self._schema is None:
+        return self.schema_index.schema
+
+    @property
+    def schema_index(self) -> SchemaIndex:
+        if self._schema_index is None:
             self.fetch_schema()
-        return self._schema
+        return self._schema_index
 
     def fetch_schema(self) -> None:
         url = urljoin(self.api_root, "schema/openapi.yaml")
-        logger.info("Fetching schema at '%s'", url)
-        self._schema = schema_fetcher.fetch(url, {"v": "3"})
+
+        def load() -> SchemaIndex:
+            logger.info("Fetching schema at '%s'", url)
+            return SchemaIndex.compile(schema_fetcher.fetch(url, {"v": "3"}))
+
+        self._schema_index = schema_indexes.get(f"url:{url}", load)
 
     def __init__(self, service: Service, auth_header: Dict[str, str]):
         self.api_root = service.api_root
         self.auth = auth_header
         self.session = requests.Session()
+        pool_registry.mount(self.session, self.api_root)
 
     def __enter__(self):
         return self
@@ -104,7 +116,8 @@ class JSONClient:
         headers.setdefault("Accept", "application/json")
 
         if operation:
-            schema_headers = get_headers(self.schema, operation)
+            schema_operation = self.schema_index.get_operation(operation)
+            schema_headers = schema_operation.headers if schema_operation else {}
             for header, value in schema_headers.items():
                 headers.setdefault(header, value)
         if self.auth:
@@ -153,7 +166,8 @@ class JSONClient:
                 "data": response_data,
             },
         }
-        TimelineLog.objects.create(content_object=self.task, extra_data=extra_data)
+        policy = get_capture_policy(self.task, self.api_root)
+        timeline.log(self.task, policy.capture(extra_data))
 
     def list(
         self,
@@ -165,18 +179,13 @@ class JSONClient:
         op_suffix = self.operation_suffix_mapping["list"]
         operation_id = f"{resource}{op_suffix}"
         operation_path = None
-        for path, methods in self.schema["paths"].items():
-            for name, method in methods.items():
-                if name == "parameters":
-                    continue
-
-                if method["operationId"] == operation_id:
-                    format_kwargs = DEFAULT_PATH_PARAMETERS.copy()
-                    format_kwargs.update(**path_kwargs)
-                    operation_path = path.format(**format_kwargs)
-                    if operation_path.endswith("/") or operation_path.startswith("/"):
-                        operation_path = operation_path[1:]
-                    break
+        operation = self.schema_index.get_operation(operation_id)
+        if operation:
+            format_kwargs = DEFAULT_PATH_PARAMETERS.copy()
+            format_kwargs.update(**path_kwargs)
+            operation_path = operation.path.format(**format_kwargs)
+            if operation_path.endswith("/") or operation_path.startswith("/"):
+                operation_path = operation_path[1:]
 
         if not operation_path:
             raise ValueError(
@@ -0,0 +1,177 @@
+"""
+Resolve OAS operations with a pre-compiled index of the schema.
+
+Looking up an operation used to scan all paths and methods of the schema, and the ZGW
+clients parsed the YAML schema of their API once per client instance. The schemas are
+now parsed and compiled into an index of ``operationId -> (path, method, headers)``
+once per process.
+
+The parsed schema and index can be persisted in ``OAS_INDEX_CACHE_DIR``, so new
+processes (e.g. restarted celery worker processes) load them with :mod:`marshal`
+instead of parsing the YAML again.
+"""
+
+import hashlib
+import logging
+import marshal
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+
+import yaml
+from zds_client.schema import filter_header_params
+
+logger = logging.getLogger(__name__)
+
+# bump when the compiled format changes
+INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Operation:
+    path: str
+    method: str
+    # required headers with their default values
+    headers: Dict[str, str]
+
+
+def _get_header_defaults(params: list, schema: dict) -> Dict[str, str]:
+    headers = {}
+    for param in filter_header_params(params, schema):
+        enum = param["schema"].get("enum", [])
+        default = param["schema"].get("default")
+        # only headers with a single sensible value can be set automatically
+        if default or len(enum) == 1:
+            headers[param["name"]] = default or enum[0]
+    return headers
+
+
+def compile_operations(schema: dict) -> Dict[str, Operation]:
+    """
+    Map the operation IDs of ``schema`` to their path template, method and headers.
+    """
+    operations = {}
+    for path, path_item in schema.get("paths", {}).items():
+        path_params = path_item.get("parameters", [])
+        for method, operation in path_item.items():
+            if method == "parameters" or "operationId" not in operation:
+                continue
+            headers = _get_header_defaults(
+                path_params + operation.get("parameters", []), schema
+            )
+            # the first match wins, like the sequential scans did
+            operations.setdefault(
+                operation["operationId"],
+                Operation(path=path, method=method.upper(), headers=headers),
+            )
+    return operations
+
+
+class SchemaIndex:
+    def __init__(self, schema: dict, operations: Dict[str, Operation]):
+        self.schema = schema
+        self.operations = operations
+
+    @classmethod
+    def compile(cls, schema: dict) -> "SchemaIndex":
+        return cls(schema, compile_operations(schema))
+
+    def get_operation(self, operation_id: str) -> Optional[Operation]:
+        return self.operations.get(operation_id)
+
+    def dumps(self) -> bytes:
+        operations = {
+            operation_id: (operation.path, operation.method, operation.headers)
+            for operation_id, operation in self.operations.items()
+        }
+        return marshal.dumps((INDEX_VERSION, self.schema, operations))
+
+    @classmethod
+    def loads(cls, data: bytes) -> Optional["SchemaIndex"]:
+        version, schema, operations = marshal.loads(data)
+        if version != INDEX_VERSION:
+            return None
+        return cls(
+            schema,
+            {
+                operation_id: Operation(*operation)
+                for operation_id, operation in operations.items()
+            },
+        )
+
+
+def _get_cache_path(content: bytes) -> Optional[str]:
+    cache_dir = settings.OAS_INDEX_CACHE_DIR
+    if not cache_dir:
+        return None
+    digest = hashlib.sha256(content).hexdigest()
+    return os.path.join(cache_dir, f"oas-{digest}.marshal")
+
+
+def compile_schema(content: bytes) -> SchemaIndex:
+    """
+    Parse and index a YAML (or JSON) schema, using the persisted index if available.
+    """
+    cache_path = _get_cache_path(content)
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as cache_file:
+                index = SchemaIndex.loads(cache_file.read())
+            if index is not None:
+                return index
+        except (OSError, EOFError, ValueError, TypeError):
+            logger.warning("Could not load the OAS index %s", cache_path, exc_info=True)
+
+    index = SchemaIndex.compile(yaml.safe_load(content))
+
+    if cache_path:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # write atomically, other processes may be reading it
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as cache_file:
+                cache_file.write(index.dumps())
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError):
+            logger.warning(
+                "Could not persist the OAS index %s", cache_path, exc_info=True
+            )
+
+    return index
+
+
+class SchemaIndexRegistry:
+    """
+    Process-wide registry of schema indexes, e.g. per API type or schema URL.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, Optional[SchemaIndex]] = {}
+
+    def get(
+        self, key: str, load: Callable[[], Optional[SchemaIndex]]
+    ) -> Optional[SchemaIndex]:
+        """
+        Return the index for ``key``, calling ``load`` to build it on first use.
+
+        ``None`` is remembered as well, so unavailable schemas aren't retried.
+        """
+        try:
+            return self._indexes[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._indexes:
+                self._indexes[key] = load()
+            return self._indexes[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes = {}
+
+
+schema_indexes = SchemaIndexRegistry()
@@ -2,11 +2,11 @@ import logging
 from typing import Dict, Optional
 
 from zds_client.client import Client as ZDSClient
-from zgw_consumers.concurrent import parallel
 
 from bptl.openklant.client import get_openklant_client
 from bptl.openklant.exceptions import OpenKlantEmailException
 from bptl.openklant.models import OpenKlantConfig, OpenKlantInternalTaskModel
+from bptl.utils.concurrent import parallel
 from bptl.work_units.open_klant.api import (
     get_details_betrokkene,
     get_klantcontact_for_interne_taak,
@@ -0,0 +1,95 @@
+"""
+Share HTTP connection pools between the clients of a service.
+
+The clients are built per task (and often per call), and every client used to open its
+own connections, repeating the TCP and TLS handshakes with the same services over and
+over. The registry hands out one :class:`requests.adapters.HTTPAdapter` per API root,
+which the clients mount on their session, so the connections are kept alive and reused
+by all clients of the process.
+
+The adapters (and the underlying urllib3 pools) are thread-safe, so they can be used
+from the threads of :class:`bptl.utils.concurrent.parallel`. Connections can't be
+shared with forked processes, so the registry starts over in a forked child, e.g. a
+celery prefork worker process.
+"""
+
+import os
+import threading
+from typing import Dict
+
+from django.conf import settings
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that outlives the sessions it is mounted on.
+
+    Sessions close their adapters when they are closed, which ``ape_pie`` clients do
+    after every request made outside a ``with`` block.
+    """
+
+    def close(self):
+        pass
+
+    def close_pools(self) -> None:
+        super().close()
+
+
+def get_retry_policy() -> Retry:
+    """
+    Retry failed connections and unavailable services for idempotent requests.
+    """
+    return Retry(
+        total=settings.HTTP_POOL_RETRIES,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        # return the last response, so the clients raise their usual HTTP errors
+        raise_on_status=False,
+    )
+
+
+class PoolRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._adapters: Dict[str, SharedHTTPAdapter] = {}
+
+    def get_adapter(self, api_root: str) -> SharedHTTPAdapter:
+        with self._lock:
+            adapter = self._adapters.get(api_root)
+            if adapter is None:
+                adapter = self._adapters[api_root] = SharedHTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+                    max_retries=get_retry_policy(),
+                )
+            return adapter
+
+    def mount(self, session: requests.Session, api_root: str) -> None:
+        """
+        Route the requests of ``session`` to ``api_root`` over the shared pool.
+        """
+        if not api_root:
+            return
+        session.mount(api_root, self.get_adapter(api_root))
+
+    def clear(self) -> None:
+        with self._lock:
+            adapters, self._adapters = self._adapters, {}
+        for adapter in adapters.values():
+            adapter.close_pools()
+
+    def _reset_after_fork(self) -> None:
+        # the sockets belong to the parent process, so they are left alone
+        self._lock = threading.Lock()
+        self._adapters = {}
+
+
+pool_registry = PoolRegistry()
+
+os.register_at_fork(after_in_child=pool_registry._reset_after_fork)
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from solo.admin import SingletonModelAdmin
+
+from .models import NotificationsConfig
+
+
+@admin.register(NotificationsConfig)
+class NotificationsConfigAdmin(SingletonModelAdmin):
+    pass
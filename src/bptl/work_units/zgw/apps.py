@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class ZGWConfig(AppConfig):
+    name = "bptl.work_units.zgw"
+
+    def ready(self):
+        from . import checks  # noqa
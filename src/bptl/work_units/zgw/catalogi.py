@@ -0,0 +1,301 @@
+"""
+Cache the catalogi (ZTC) metadata looked up by the ZGW work units.
+
+Catalogue data hardly ever changes, yet nearly every ZGW work unit looks up a ZAAKTYPE
+or its STATUSTYPEn, ROLTYPEn, RESULTAATTYPEn or EIGENSCHAPpen. The types of a ZAAKTYPE
+are fetched once, indexed by the fields they are looked up by, and stored in the Django
+cache ``ZTC_CACHE_ALIAS`` for ``ZTC_CACHE_TIMEOUT`` seconds, per application.
+
+All versions of a ZAAKTYPE are cached together, so the version valid on a given date is
+selected from the cached entry. Metadata that was not found is not cached, since it may
+be added any moment. The notifications about a ZAAKTYPE invalidate its types, and the
+notifications about a CATALOGUS (or a new ZAAKTYPE in it) its ZAAKTYPEn, see
+:mod:`bptl.work_units.zgw.invalidation`.
+
+Run the ``warm_catalogi_cache`` management command to fill the cache up front.
+
+The batch entry points of work units share the lookups of the tasks in a batch through
+a ``memo``, whether the cache is enabled or not.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.api_models.catalogi import ZaakType
+
+from .client import ZGWClient
+from .http_cache import get_identity
+from .invalidation import get_invalidated_at, get_marker_key
+from .utils import get_paginated_results
+
+KEY_PREFIX = "ztc"
+
+# fields the types of a ZAAKTYPE are looked up by, with their normalization
+INDEXED_FIELDS: Dict[str, Dict[str, Optional[Callable]]] = {
+    "statustype": {"volgnummer": None, "isEindstatus": None},
+    "roltype": {"omschrijving": None, "omschrijvingGeneriek": None},
+    "resultaattype": {"omschrijving": str.lower},
+    "eigenschap": {"naam": None},
+}
+
+
+@dataclass
+class TypeIndex:
+    results: List[dict]
+    # field -> value -> positions in results
+    indexes: Dict[str, Dict[Any, List[int]]]
+
+    @staticmethod
+    def _normalize(resource: str, field: str, value):
+        normalize = INDEXED_FIELDS[resource][field]
+        return normalize(value) if normalize and value is not None else value
+
+    @classmethod
+    def build(cls, resource: str, results: List[dict]) -> "TypeIndex":
+        indexes = {}
+        for field in INDEXED_FIELDS[resource]:
+            index = indexes[field] = {}
+            for position, result in enumerate(results):
+                value = cls._normalize(resource, field, result.get(field))
+                index.setdefault(value, []).append(position)
+        return cls(results=results, indexes=indexes)
+
+    def filter(self, resource: str, **lookups) -> List[dict]:
+        positions = range(len(self.results))
+        for field, value in lookups.items():
+            value = self._normalize(resource, field, value)
+            matches = set(self.indexes[field].get(value, []))
+            positions = [position for position in positions if position in matches]
+        return [self.results[position] for position in positions]
+
+
+def select_zaaktypen(zaaktypen: List[dict], datum: date) -> List[dict]:
+    """
+    Return the versions of a ZAAKTYPE valid on ``datum``.
+
+    If multiple versions are valid, the version without ``eindeGeldigheid`` or else the
+    one valid the longest is preferred, e.g. when the old version ends on the day the
+    new version starts.
+    """
+    candidates = [factory(ZaakType, zaaktype) for zaaktype in zaaktypen]
+
+    def _filter_on_geldigheid(zaaktype: ZaakType) -> bool:
+        if zaaktype.einde_geldigheid:
+            return zaaktype.begin_geldigheid <= datum <= zaaktype.einde_geldigheid
+        return zaaktype.begin_geldigheid <= datum
+
+    valid = [zt for zt in candidates if _filter_on_geldigheid(zt)]
+    if len(valid) > 1:
+        without_einde_geldigheid = [zt for zt in valid if not zt.einde_geldigheid]
+        if without_einde_geldigheid:
+            valid = without_einde_geldigheid
+        else:
+            max_einde_geldigheid = max(zt.einde_geldigheid for zt in valid)
+            valid = [zt for zt in valid if zt.einde_geldigheid == max_einde_geldigheid]
+
+    urls = {zt.url for zt in valid}
+    return [zaaktype for zaaktype in zaaktypen if zaaktype["url"] in urls]
+
+
+class Catalogi:
+    """
+    Cached lookups of catalogi metadata through ``client``, a Catalogi API client.
+
+    :param memo: a dict to keep the looked up entries in, shared by the tasks of a
+      batch. The entries are keyed by application, like in the cache.
+    """
+
+    def __init__(self, client: ZGWClient, memo: Optional[Dict[str, Any]] = None):
+        self.client = client
+        self.memo = memo
+
+    def _get_key(self, *parts) -> str:
+        variant = json.dumps(
+            [get_identity(self.client.auth_header), self.client.base_url, *parts]
+        )
+        digest = hashlib.sha256(variant.encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:{digest}"
+
+    def _get(
+        self, parts: tuple, fetch: Callable[[], Any], dependencies: Tuple[str, ...] = ()
+    ) -> Any:
+        """
+        Return the cached entry, unless one of the ``dependencies`` was invalidated.
+        """
+        key = self._get_key(*parts)
+        if self.memo is not None and key in self.memo:
+            return self.memo[key]
+
+        entry = self._get_cached(key, parts, fetch, dependencies)
+        if self.memo is not None and entry is not None:
+            self.memo[key] = entry
+        return entry
+
+    def _get_cached(
+        self,
+        key: str,
+        parts: tuple,
+        fetch: Callable[[], Any],
+        dependencies: Tuple[str, ...],
+    ) -> Any:
+        if not settings.ZTC_CACHE_TIMEOUT:
+            return fetch()
+
+        values = caches[settings.ZTC_CACHE_ALIAS].get_many(
+            [key, *(get_marker_key(url) for url in dependencies)]
+        )
+        if key in values:
+            stored_at, entry = values[key]
+            invalidated_at = get_invalidated_at(values, dependencies)
+            if invalidated_at is None or invalidated_at < stored_at:
+                return entry
+
+        requested_at = time.time()
+        entry = fetch()
+        if entry is not None:
+            self._set(parts, entry, requested_at)
+        return entry
+
+    def _set(self, parts: tuple, entry: Any, stored_at: float) -> None:
+        if settings.ZTC_CACHE_TIMEOUT:
+            caches[settings.ZTC_CACHE_ALIAS].set(
+                self._get_key(*parts),
+                (stored_at, entry),
+                timeout=settings.ZTC_CACHE_TIMEOUT,
+            )
+
+    def _fetch_types(self, resource: str, zaaktype: str) -> Optional[TypeIndex]:
+        results = get_paginated_results(
+            self.client, resource, query_params={"zaaktype": zaaktype}
+        )
+        return TypeIndex.build(resource, results) if results else None
+
+    def get_types(self, resource: str, zaaktype: str, **lookups) -> List[dict]:
+        """
+        Return the ``resource`` types of ``zaaktype`` matching ``lookups``.
+        """
+        index = self._get(
+            (resource, zaaktype),
+            lambda: self._fetch_types(resource, zaaktype),
+            dependencies=(zaaktype,),
+        )
+        if index is None:
+            return []
+        return index.filter(resource, **lookups)
+
+    def get_catalogus(self, domein: str, rsin: str) -> Optional[dict]:
+        def _fetch():
+            catalogussen = self.client.list(
+                "catalogus", request_kwargs={"params": {"domein": domein, "rsin": rsin}}
+            )
+            return next(iter(catalogussen.get("results", [])), None)
+
+        return self._get(("catalogus", domein, rsin), _fetch)
+
+    def get_zaaktypen(self, catalogus: str, identificatie: str) -> List[dict]:
+        """
+        Return all versions of the ZAAKTYPE ``identificatie`` in ``catalogus``.
+        """
+
+        def _fetch():
+            query_params = {"catalogus": catalogus, "identificatie": identificatie}
+            results = get_paginated_results(
+                self.client, "zaaktype", query_params=query_params
+            )
+            return results or None
+
+        entry = self._get(
+            ("zaaktype", catalogus, identificatie), _fetch, dependencies=(catalogus,)
+        )
+        return entry or []
+
+    def find_zaaktype(
+        self, domein: str, rsin: str, identificatie: str, datum: Optional[date] = None
+    ) -> dict:
+        """
+        Return the version of the ZAAKTYPE ``identificatie`` valid on ``datum``.
+
+        Raises ValueError if there is no unique version.
+        """
+        datum = datum or date.today()
+        catalogus = self.get_catalogus(domein, rsin)
+        if catalogus is None:
+            raise ValueError(
+                "No catalogus found with domein %s and RSIN %s." % (domein, rsin)
+            )
+
+        zaaktypen = self.get_zaaktypen(catalogus["url"], identificatie)
+        if not zaaktypen:
+            raise ValueError(
+                "No zaaktype was found with catalogus %s and identificatie %s."
+                % (catalogus["url"], identificatie)
+            )
+
+        zaaktypen = select_zaaktypen(zaaktypen, datum)
+        if len(zaaktypen) != 1:
+            raise ValueError(
+                "No%s zaaktype was found with catalogus %s, identificatie %s with begin_geldigheid <= %s <= einde_geldigheid."
+                % (
+                    "" if len(zaaktypen) == 0 else " unique",
+                    catalogus["url"],
+                    identificatie,
+                    datum,
+                )
+            )
+        return zaaktypen[0]
+
+    def get_statustype(
+        self, zaaktype: str, volgnummer: Optional[int] = None, eindstatus=False
+    ) -> Optional[dict]:
+        lookups = {"isEindstatus": True} if eindstatus else {"volgnummer": volgnummer}
+        return next(iter(self.get_types("statustype", zaaktype, **lookups)), None)
+
+    def get_roltypen(self, zaaktype: str, **lookups) -> List[dict]:
+        return self.get_types("roltype", zaaktype, **lookups)
+
+    def get_resultaattypen(self, zaaktype: str, **lookups) -> List[dict]:
+        return self.get_types("resultaattype", zaaktype, **lookups)
+
+    def get_eigenschap(self, zaaktype: str, naam: str) -> Optional[dict]:
+        return next(iter(self.get_types("eigenschap", zaaktype, naam=naam)), None)
+
+    def warm_up(self) -> int:
+        """
+        Cache the metadata of all ZAAKTYPEn, returns the number of ZAAKTYPEn.
+        """
+        requested_at = time.time()
+        zaaktypen = get_paginated_results(self.client, "zaaktype")
+        catalogussen = {
+            catalogus["url"]: catalogus
+            for catalogus in get_paginated_results(self.client, "catalogus")
+        }
+
+        versions = {}
+        for zaaktype in zaaktypen:
+            key = (zaaktype["catalogus"], zaaktype["identificatie"])
+            versions.setdefault(key, []).append(zaaktype)
+
+        for (catalogus_url, identificatie), results in versions.items():
+            self._set(("zaaktype", catalogus_url, identificatie), results, requested_at)
+            if catalogus := catalogussen.get(catalogus_url):
+                self._set(
+                    ("catalogus", catalogus["domein"], catalogus["rsin"]),
+                    catalogus,
+                    requested_at,
+                )
+
+        for zaaktype in zaaktypen:
+            for resource in INDEXED_FIELDS:
+                requested_at = time.time()
+                index = self._fetch_types(resource, zaaktype["url"])
+                if index is not None:
+                    self._set((resource, zaaktype["url"]), index, requested_at)
+        return len(zaaktypen)
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from bptl.utils.checks import is_process_local_cache
+
+
+def get_invalidated_aliases() -> list:
+    aliases = []
+    if settings.ZGW_HTTP_CACHE:
+        aliases.append(settings.ZGW_HTTP_CACHE_ALIAS)
+    if settings.ZTC_CACHE_TIMEOUT:
+        aliases.append(settings.ZTC_CACHE_ALIAS)
+    return list(dict.fromkeys(aliases))
+
+
+@register()
+def check_invalidation_cache(app_configs, **kwargs):
+    """
+    Check that the invalidation markers reach the workers that cache the resources.
+    """
+    return [
+        Warning(
+            f"The cache {alias!r} of the ZGW resources is local to each process.",
+            hint=(
+                "The resources invalidated by notifications or by the writes of other "
+                "workers stay cached until they expire. Configure a shared cache "
+                "backend like Redis."
+            ),
+            id="zgw.W001",
+        )
+        for alias in get_invalidated_aliases()
+        if is_process_local_cache(alias)
+    ]
@@ -9,16 +9,20 @@ ZGWClient from zgw-consumers <1.0. It builds on ape_pie's APIClient and adds:
 - OAS schema support for operation resolution
 """
 
+import time
 from typing import Any, Union
 from urllib.parse import urljoin
 
-import yaml
 from ape_pie import APIClient
 from furl import furl
-from requests import PreparedRequest
+from requests import PreparedRequest, Response
 from timeline_logger.models import TimelineLog
 from zgw_consumers.models import Service
 
+from ..oas import SchemaIndex, compile_schema, schema_indexes
+from ..pools import pool_registry
+from .http_cache import HTTPCache, get_cache_key, get_http_cache, get_ttl
+from .invalidation import invalidate
 from .log import DBLog
 
 
@@ -40,6 +44,18 @@ class NoAuth(Exception):
     pass
 
 
+def _load_index(api_type: str) -> SchemaIndex | None:
+    # the schemas are shipped in the ZGW_CONSUMERS_TEST_SCHEMA_DIRS, remote schemas
+    # aren't fetched to avoid network calls during client initialization - the
+    # pluralization fallback handles all standard cases
+    try:
+        from zgw_consumers_oas import read_schema
+
+        return compile_schema(read_schema(api_type))
+    except Exception:
+        return None
+
+
 class ZGWClient(APIClient):
     """
     A proper API client for ZGW services, built on ape_pie.APIClient.
@@ -89,44 +105,35 @@ class ZGWClient(APIClient):
             **kwargs: Additional kwargs (e.g., nlx_base_url for NLX support)
         """
         super().__init__(base_url, request_kwargs, **kwargs)
+        pool_registry.mount(self, base_url)
         self.service = service
+        # per instance, so clients used concurrently log to their own task
+        self._log = DBLog()
         self._schema = None  # Lazy-loaded OAS schema
 
-    def _load_schema(self):
+    def _get_schema_index(self) -> SchemaIndex | None:
         """
-        Lazy-load the OAS schema for this service.
-
-        Returns the parsed OAS schema or None if not available.
+        Return the compiled OAS schema of this service, shared by all clients.
 
-        This attempts to load schemas from:
-        1. Test schema files (for testing)
-        2. Remote service endpoint (in production)
-        3. Falls back to None (uses pluralization inference)
+        Returns None if no schema is available, in which case the operations are
+        inferred (pluralization) instead.
         """
-        if self._schema is not None:
-            return self._schema
-
         if not self.service:
             return None
 
-        # Try to load from test schemas first (during testing)
-        try:
-            from zgw_consumers_oas import read_schema
-
-            # Map API types to schema file names
-            api_type = getattr(self.service, "api_type", None)
-            if api_type:
-                schema_bytes = read_schema(api_type)
-                self._schema = yaml.safe_load(schema_bytes)
-                return self._schema
-        except Exception:
-            # Schema loading from files failed - try remote or fall back to None
-            pass
-
-        # In production, we don't fetch schemas from remote services
-        # to avoid network calls during client initialization.
-        # The pluralization fallback handles all standard cases.
-        return None
+        api_type = getattr(self.service, "api_type", None)
+        if not api_type:
+            return None
+        return schema_indexes.get(f"api_type:{api_type}", lambda: _load_index(api_type))
+
+    def _load_schema(self):
+        """
+        Return the parsed OAS schema for this service, or None if not available.
+        """
+        if self._schema is None:
+            index = self._get_schema_index()
+            self._schema = index.schema if index else None
+        return self._schema
 
     @property
     def schema(self):
@@ -152,26 +159,17 @@ class ZGWClient(APIClient):
         Returns:
             Tuple of (path, method) or raises ValueError if not found
         """
-        schema = self._load_schema()
-        if not schema or "paths" not in schema:
-            # No schema available - try to infer from operation_id
+        index = self._get_schema_index()
+        operation = index.get_operation(operation_id) if index else None
+        if operation is None:
+            # No schema available or operation not found - try to infer it
             return self._infer_operation_url(operation_id, **kwargs)
 
-        # Search for the operation in the schema
-        for path, path_item in schema["paths"].items():
-            for method, operation in path_item.items():
-                if method.lower() in ["get", "post", "put", "patch", "delete"]:
-                    if operation.get("operationId") == operation_id:
-                        # Substitute path parameters
-                        resolved_path = path
-                        for key, value in kwargs.items():
-                            resolved_path = resolved_path.replace(
-                                f"{{{key}}}", str(value)
-                            )
-                        return resolved_path.lstrip("/"), method.upper()
-
-        # Fallback to inference if not found in schema
-        return self._infer_operation_url(operation_id, **kwargs)
+        # Substitute path parameters
+        resolved_path = operation.path
+        for key, value in kwargs.items():
+            resolved_path = resolved_path.replace(f"{{{key}}}", str(value))
+        return resolved_path.lstrip("/"), operation.method
 
     def _infer_operation_url(self, operation_id: str, **kwargs) -> tuple[str, str]:
         """
@@ -345,16 +343,93 @@ class ZGWClient(APIClient):
             return TimelineLog.objects.none()
         return TimelineLog.objects.filter(extra_data__service_name=self.service)
 
-    def request(self, method: str, url: str, *args, **kwargs):
+    def request(
+        self, method: str, url: str, *args, bypass_cache: bool = False, **kwargs
+    ):
         """
-        Override request to add logging functionality.
+        Override request to add caching and logging functionality.
+
+        Resources are retrieved through the HTTP cache, see
+        :mod:`bptl.work_units.zgw.http_cache`. Pass ``bypass_cache=True`` to skip the
+        cached response, e.g. to read a resource right after changing it.
+        """
+        http_cache = get_http_cache()
+        if http_cache is None:
+            return self._send(method, url, *args, **kwargs)
+
+        full_url = urljoin(self.base_url, url)
+        method = method.upper()
+        if method == "GET" and (ttl := get_ttl(full_url)) is not None:
+            return self._cached_get(
+                http_cache,
+                ttl,
+                url,
+                full_url,
+                *args,
+                bypass_cache=bypass_cache,
+                **kwargs,
+            )
 
-        This intercepts all HTTP requests and logs them via the _log descriptor.
+        response = self._send(method, url, *args, **kwargs)
+        if method in ("PUT", "PATCH", "DELETE"):
+            # the entries of other applications and query parameters are stale too
+            invalidate(full_url)
+        return response
+
+    def _cached_get(
+        self,
+        http_cache: HTTPCache,
+        ttl: int,
+        url: str,
+        full_url: str,
+        *args,
+        bypass_cache: bool = False,
+        **kwargs,
+    ):
+        key = get_cache_key(full_url, self.auth_header, kwargs.get("params"))
+        entry = None if bypass_cache else http_cache.get(key, full_url)
+        if entry is not None:
+            if entry.is_fresh(ttl):
+                response = entry.to_response(full_url)
+                self._log_response("GET", url, response, cached=True, **kwargs)
+                return response
+            if entry.etag:
+                kwargs["headers"] = {
+                    **(kwargs.get("headers") or {}),
+                    "If-None-Match": entry.etag,
+                }
+
+        requested_at = time.time()
+        response = self._send("GET", url, *args, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            http_cache.refresh(key, entry, ttl, requested_at)
+            return entry.to_response(full_url)
+        if response.status_code == 200:
+            http_cache.store(key, response, ttl, requested_at)
+        return response
+
+    def _send(self, method: str, url: str, *args, **kwargs):
+        """
+        Perform the request and log it via the _log descriptor.
         """
         # Call the parent request method
         response = super().request(method, url, *args, **kwargs)
+        self._log_response(method, url, response, **kwargs)
+        return response
 
-        # Log the request/response if logging is enabled
+    def _log_response(
+        self,
+        method: str,
+        url: str,
+        response: Response,
+        cached: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Log the request/response if logging is enabled.
+
+        Responses served from the HTTP cache are logged with ``cached=True``.
+        """
         if self._log.task is not None:
             # Extract request data
             request_data = kwargs.get("json") or kwargs.get("data")
@@ -401,10 +476,10 @@ class ZGWClient(APIClient):
                 response_headers=response_headers_dict,
                 response_data=response_data,
                 params=request_params,
+                api_root=self.base_url,
+                cached=cached,
             )
 
-        return response
-
     # API convenience methods for ZGW resources
     # These provide a higher-level API on top of the HTTP methods
 
@@ -487,13 +562,20 @@ class ZGWClient(APIClient):
         params = query_params or kwargs.get("request_kwargs", {}).get("params", {})
         return self.operation(operation_id, params=params, **kwargs)
 
-    def retrieve(self, resource: str, url: str | None = None, **kwargs) -> dict:
+    def retrieve(
+        self,
+        resource: str,
+        url: str | None = None,
+        bypass_cache: bool = False,
+        **kwargs,
+    ) -> dict:
         """
         Retrieve a single resource from the API using operation resolution.
 
         Args:
             resource: The resource type (e.g., "zaak", "document")
             url: Optional full URL to the resource
+            bypass_cache: Retrieve the resource from the API, not from the HTTP cache
             **kwargs: Additional parameters (uuid, request_kwargs, etc.)
 
         Returns:
@@ -529,7 +611,7 @@ class ZGWClient(APIClient):
         if "params" in request_kwargs:
             get_kwargs["params"] = request_kwargs["params"]
 
-        response = self.get(request_url, **get_kwargs)
+        response = self.get(request_url, bypass_cache=bypass_cache, **get_kwargs)
         response.raise_for_status()
         return response.json()
 
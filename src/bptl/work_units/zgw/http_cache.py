@@ -0,0 +1,165 @@
+"""
+Cache the resources retrieved by the ZGW clients.
+
+Tasks of the same process instance retrieve the same ZAAK, ZAAKTYPE and CATALOGUS over
+and over. The responses of resource detail URLs are stored in the Django cache
+(``ZGW_HTTP_CACHE_ALIAS``), per URL and application:
+
+* responses with an ``ETag`` are revalidated with ``If-None-Match``, so an unchanged
+  resource costs a ``304 Not Modified`` instead of a full response;
+* resources with a TTL in ``ZGW_HTTP_CACHE_TTLS`` (by default the catalogi resources,
+  which rarely change) are served from the cache without a request until the TTL
+  expires.
+
+Writes through a client invalidate the cached resource (for all applications and query
+parameters), and so do the notifications of
+the Notificaties API (see :mod:`bptl.work_units.zgw.invalidation`). To read a resource
+right after it was changed indirectly (e.g. creating a STATUS changes the ZAAK), pass
+``bypass_cache=True``.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.cache import caches
+
+import jwt
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .invalidation import get_invalidated_at, get_marker_key
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "zgw-http"
+
+UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float
+
+    def is_fresh(self, ttl: int) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def to_response(self, url: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        return response
+
+
+def get_ttl(url: str) -> Optional[int]:
+    """
+    Return the TTL of the resource ``url``, or None if it is not cacheable.
+
+    Only resource detail URLs (``.../<collection>/<uuid>``) are cached, the TTL is
+    looked up by collection name.
+    """
+    segments = urlparse(url).path.rstrip("/").split("/")
+    if len(segments) < 2 or not UUID_RE.match(segments[-1]):
+        return None
+    return settings.ZGW_HTTP_CACHE_TTLS.get(segments[-2], 0)
+
+
+def get_identity(auth_headers: Dict[str, str]) -> str:
+    """
+    Identify the application the auth headers belong to.
+
+    Resources are cached per application, since their authorizations may differ. The
+    JWTs of the ZGW APIs are signed again and again (with a new ``iat`` claim), so
+    their client ID is used.
+    """
+    scheme, _, token = auth_headers.get("Authorization", "").partition(" ")
+    if scheme == "Bearer" and token:
+        try:
+            claims = jwt.decode(token, options={"verify_signature": False})
+        except jwt.InvalidTokenError:
+            pass
+        else:
+            return f"client_id:{claims.get('client_id', '')}"
+    return json.dumps(sorted(auth_headers.items()))
+
+
+def get_cache_key(url: str, auth_headers: Dict[str, str], params=None) -> str:
+    variant = json.dumps([get_identity(auth_headers), url, params], default=str)
+    digest = hashlib.sha256(variant.encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}:{digest}"
+
+
+class HTTPCache:
+    def __init__(self, alias: str):
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, key: str, url: str) -> Optional[CachedResponse]:
+        """
+        Return the cached response, unless ``url`` was invalidated since.
+        """
+        # a broken cache slows the tasks down, it shouldn't make them fail
+        try:
+            values = self.cache.get_many([key, get_marker_key(url)])
+        except Exception:
+            logger.warning("Could not read the HTTP cache", exc_info=True)
+            return None
+
+        entry = values.get(key)
+        if entry is None:
+            return None
+        invalidated_at = get_invalidated_at(values, [url])
+        if invalidated_at is not None and invalidated_at >= entry.stored_at:
+            return None
+        return entry
+
+    def set(self, key: str, entry: CachedResponse, ttl: int) -> None:
+        timeout = max(ttl, settings.ZGW_HTTP_CACHE_TIMEOUT)
+        try:
+            self.cache.set(key, entry, timeout=timeout)
+        except Exception:
+            logger.warning("Could not write the HTTP cache", exc_info=True)
+
+    def store(
+        self, key: str, response: requests.Response, ttl: int, requested_at: float
+    ) -> None:
+        etag = response.headers.get("ETag", "")
+        # without ETag or TTL the response can't be reused
+        if not etag and not ttl:
+            return
+        entry = CachedResponse(
+            etag=etag,
+            headers=dict(response.headers),
+            content=response.content,
+            # changes during the request invalidate the response
+            stored_at=requested_at,
+        )
+        self.set(key, entry, ttl)
+
+    def refresh(
+        self, key: str, entry: CachedResponse, ttl: int, requested_at: float
+    ) -> None:
+        self.set(key, replace(entry, stored_at=requested_at), ttl)
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    if not settings.ZGW_HTTP_CACHE:
+        return None
+    return HTTPCache(settings.ZGW_HTTP_CACHE_ALIAS)
@@ -0,0 +1,91 @@
+"""
+Invalidate the cached ZGW resources when they change.
+
+The HTTP cache and the catalogi cache store their entries per application, so the
+entries of a resource can't be looked up to delete them. Instead, invalidating a
+resource stores the time it changed in a marker, which is read together with the
+cached entries. Entries stored before the marker are ignored.
+
+The resources are invalidated on the notifications of the Notificaties API, received
+by :class:`bptl.work_units.zgw.views.NotificationCallbackView`.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "zgw-invalidated"
+
+# notification channels whose resources are cached
+KANALEN = ("zaaktypen", "catalogussen", "zaken", "objecten")
+
+
+def get_marker_key(url: str) -> str:
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}:{digest}"
+
+
+def get_aliases() -> List[str]:
+    # the markers are stored next to the entries they invalidate
+    return list(
+        dict.fromkeys([settings.ZGW_HTTP_CACHE_ALIAS, settings.ZTC_CACHE_ALIAS])
+    )
+
+
+def get_marker_timeout() -> int:
+    # the markers must outlive the entries stored before them
+    return max(
+        settings.ZGW_HTTP_CACHE_TIMEOUT,
+        settings.ZTC_CACHE_TIMEOUT,
+        *settings.ZGW_HTTP_CACHE_TTLS.values(),
+    )
+
+
+def invalidate(*urls: str) -> None:
+    """
+    Invalidate the cached entries of the resources ``urls``.
+    """
+    markers = {get_marker_key(url): time.time() for url in urls}
+    for alias in get_aliases():
+        try:
+            caches[alias].set_many(markers, timeout=get_marker_timeout())
+        except Exception:
+            logger.warning("Could not invalidate the cached resources", exc_info=True)
+
+
+def get_invalidated_at(
+    values: Dict[str, float], urls: Iterable[str]
+) -> Optional[float]:
+    """
+    Return the last time one of ``urls`` was invalidated, read from ``values``.
+
+    ``values`` are the result of a ``get_many`` including the marker keys of ``urls``.
+    """
+    timestamps = [values[key] for url in urls if (key := get_marker_key(url)) in values]
+    return max(timestamps, default=None)
+
+
+def handle_notification(notification: dict) -> List[str]:
+    """
+    Invalidate the resources changed according to ``notification``.
+
+    The main object is invalidated as well, e.g. a ZAAK changes when its STATUS is
+    created, and so are the types of a ZAAKTYPE. Returns the invalidated URLs.
+    """
+    if notification["kanaal"] not in KANALEN:
+        return []
+
+    urls = [notification["hoofdObject"], notification["resourceUrl"]]
+    # a new (version of a) ZAAKTYPE changes the ZAAKTYPEn of its CATALOGUS
+    if catalogus := notification.get("kenmerken", {}).get("catalogus"):
+        urls.append(catalogus)
+
+    urls = list(dict.fromkeys(urls))
+    invalidate(*urls)
+    return urls
@@ -1,4 +1,6 @@
-from timeline_logger.models import TimelineLog
+from bptl.utils import timeline
+
+from ..capture import get_capture_policy
 
 
 class DBLog:
@@ -15,6 +17,8 @@ class DBLog:
         response_headers: dict,
         response_data: dict,
         params: dict = None,
+        api_root: str = "",
+        cached: bool = False,
     ):
 
         extra_data = {
@@ -32,4 +36,8 @@ class DBLog:
                 "data": response_data,
             },
         }
-        TimelineLog.objects.create(content_object=self.task, extra_data=extra_data)
+        if cached:
+            # served from the HTTP cache, without a request
+            extra_data["response"]["cached"] = True
+        policy = get_capture_policy(self.task, api_root)
+        timeline.log(self.task, policy.capture(extra_data))
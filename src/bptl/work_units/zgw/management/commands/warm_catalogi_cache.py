@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+
+from bptl.credentials.api import get_credentials
+
+from ...catalogi import Catalogi
+
+
+class Command(BaseCommand):
+    help = (
+        "Cache the zaaktypen of the Catalogi APIs with their statustypen, roltypen, "
+        "resultaattypen and eigenschappen."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--app-id",
+            action="append",
+            dest="app_ids",
+            default=[],
+            help=(
+                "Warm the cache for the credentials of this application, can be "
+                "repeated. Defaults to the credentials of the services."
+            ),
+        )
+
+    def handle(self, **options):
+        if not settings.ZTC_CACHE_TIMEOUT:
+            raise CommandError("The catalogi cache is disabled (ZTC_CACHE_TIMEOUT).")
+
+        services = Service.objects.filter(api_type=APITypes.ztc)
+        if not services:
+            raise CommandError("No Catalogi API services are configured.")
+
+        for service in services:
+            for app_id in options["app_ids"] or [None]:
+                client = service.build_client()
+                if app_id is not None:
+                    client.set_auth_value(get_credentials(app_id, service)[service])
+
+                count = Catalogi(client).warm_up()
+                self.stdout.write(
+                    f"Cached {count} zaaktype(n) of {service.api_root}"
+                    + (f" for {app_id}." if app_id else ".")
+                )
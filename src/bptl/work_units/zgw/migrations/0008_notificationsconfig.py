@@ -0,0 +1,39 @@
+# Generated by Django 5.2.9 on 2026-10-17 01:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zgw", "0007_delete_metaobjecttypesconfig"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationsConfig",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "auth_key",
+                    models.CharField(
+                        blank=True,
+                        help_text="The key the Notificaties API sends in the 'Authorization: Basic <key>' header of the callbacks. Configure the same header for the subscription (abonnement).",
+                        max_length=255,
+                        verbose_name="auth key",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "notifications configuration",
+            },
+        ),
+    ]
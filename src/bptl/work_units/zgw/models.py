@@ -0,0 +1,28 @@
+from django.db import models
+from django.utils.encoding import force_str
+from django.utils.translation import gettext_lazy as _
+
+from solo.models import SingletonModel
+
+
+class NotificationsConfig(SingletonModel):
+    """
+    The configuration of the notifications BPTL receives from the Notificaties API.
+    """
+
+    auth_key = models.CharField(
+        _("auth key"),
+        max_length=255,
+        blank=True,
+        help_text=_(
+            "The key the Notificaties API sends in the 'Authorization: Basic <key>' "
+            "header of the callbacks. Configure the same header for the subscription "
+            "(abonnement)."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("notifications configuration")
+
+    def __str__(self):
+        return force_str(self._meta.verbose_name)
@@ -6,11 +6,11 @@ from django.utils.translation import gettext_lazy as _
 
 from djangorestframework_camel_case.settings import api_settings
 from djangorestframework_camel_case.util import camelize
-from zgw_consumers.concurrent import parallel
 
 from bptl.core.utils import fetch_next_url_pagination
 from bptl.tasks.base import check_variable
 from bptl.tasks.models import BaseTask
+from bptl.utils.concurrent import parallel
 from bptl.work_units.zgw.utils import get_paginated_results
 
 from .client import ObjectsClient, get_objects_client, get_objecttypes_client
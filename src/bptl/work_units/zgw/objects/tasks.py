@@ -2,11 +2,11 @@ import datetime
 import logging
 from typing import Dict, List
 
-from zgw_consumers.concurrent import parallel
 from zgw_consumers.constants import APITypes
 
 from bptl.tasks.base import BaseTask, MissingVariable, check_variable
 from bptl.tasks.registry import register
+from bptl.utils.concurrent import parallel
 from bptl.work_units.zgw.tasks.base import ZGWWorkUnit, require_zrc, require_ztc
 
 from .client import require_objects_service, require_objecttypes_service
@@ -0,0 +1,22 @@
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import serializers
+
+
+class NotificationSerializer(serializers.Serializer):
+    kanaal = serializers.CharField(help_text=_("The channel of the notification."))
+    hoofdObject = serializers.URLField(
+        help_text=_("URL-reference to the main object of the changed resource.")
+    )
+    resource = serializers.CharField(help_text=_("The type of the changed resource."))
+    resourceUrl = serializers.URLField(
+        help_text=_("URL-reference to the changed resource.")
+    )
+    actie = serializers.CharField(help_text=_("The action performed on the resource."))
+    aanmaakdatum = serializers.DateTimeField()
+    kenmerken = serializers.DictField(
+        child=serializers.CharField(allow_blank=True),
+        required=False,
+        default=dict,
+        help_text=_("Attributes of the main object to filter on."),
+    )
@@ -9,10 +9,14 @@ from bptl.tasks.base import WorkUnit
 from bptl.tasks.models import DefaultService
 from bptl.tasks.registry import register
 
+from ..catalogi import Catalogi
 from ..client import MultipleServices, NoAuth, NoService
 
 PROCESS_VAR_NAME = "bptlAppId"
 
+# attribute of the task instance holding its clients per API type
+CLIENT_CACHE_ATTR = "_zgw_clients"
+
 
 require_zrc = register.require_service(
     APITypes.zrc, description=_("The Zaken API to use.")
@@ -29,7 +33,23 @@ require_brc = register.require_service(
 
 
 class ZGWWorkUnit(WorkUnit):
+    # the catalogi lookups shared with the other tasks of a batch
+    catalogi_memo = None
+
     def get_client(self, service_type: str):
+        """
+        Return the ZGW client for ``service_type``, configured for the task.
+
+        The clients are cached on the task instance, which lives for one execution.
+        The service and credentials of an API type are resolved once, for all helper
+        methods and for the nested work units performed for the same task.
+        """
+        clients = vars(self.task).setdefault(CLIENT_CACHE_ATTR, {})
+        if service_type not in clients:
+            clients[service_type] = self.build_client(service_type)
+        return clients[service_type]
+
+    def build_client(self, service_type: str):
         """
         create ZGW client with requested parameters
         """
@@ -63,3 +83,9 @@ class ZGWWorkUnit(WorkUnit):
                 client.set_auth_value(auth_headers)
 
         return client
+
+    def get_catalogi(self) -> Catalogi:
+        """
+        Return the cached lookups of the Catalogi API configured for the task.
+        """
+        return Catalogi(self.get_client(APITypes.ztc), memo=self.catalogi_memo)
@@ -4,12 +4,12 @@ from urllib.parse import urlparse
 from uuid import UUID
 
 from zds_client.schema import get_operation_url
-from zgw_consumers.concurrent import parallel
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
 
 from bptl.tasks.base import check_variable
 from bptl.tasks.registry import register
+from bptl.utils.concurrent import parallel
 
 from ..client import NoService
 from .base import ZGWWorkUnit
@@ -58,21 +58,15 @@ class CreateResultaatTask(ZGWWorkUnit):
                     url=zaak_url,
                     request_kwargs={"headers": {"Accept-Crs": "EPSG:4326"}},
                 )
-                ztc_client = self.get_client(APITypes.ztc)
-                resultaattypen = ztc_client.list(
-                    "resultaattype",
-                    request_kwargs={"params": {"zaaktype": zaak["zaaktype"]}},
-                )
-                if resultaattypen["count"] == 0:
+                catalogi = self.get_catalogi()
+                if not catalogi.get_resultaattypen(zaak["zaaktype"]):
                     raise ValueError(
                         "No resultaattypen were found for zaaktype %s."
                         % zaak["zaaktype"]
                     )
-                resultaattype = [
-                    rt
-                    for rt in resultaattypen["results"]
-                    if rt["omschrijving"].lower() == omschrijving.lower()
-                ]
+                resultaattype = catalogi.get_resultaattypen(
+                    zaak["zaaktype"], omschrijving=omschrijving
+                )
                 if len(resultaattype) != 1:
                     raise ValueError(
                         "No%s resultaattype was found with zaaktype %s and omschrijving %s."
@@ -62,16 +62,9 @@ class CreateRolTask(ZGWWorkUnit):
             request_kwargs={"headers": {"Accept-Crs": "EPSG:4326"}},
         )
 
-        ztc_client = self.get_client(APITypes.ztc)
-        query_params = {
-            "zaaktype": zaak["zaaktype"],
-        }
-        rol_typen = ztc_client.list("roltype", query_params)
-        rol_typen = [
-            rol_type
-            for rol_type in rol_typen["results"]
-            if rol_type["omschrijving"] == omschrijving
-        ]
+        rol_typen = self.get_catalogi().get_roltypen(
+            zaak["zaaktype"], omschrijving=omschrijving
+        )
         if not rol_typen:
             raise ValueError(
                 f"No matching roltype with zaaktype = {zaak['zaaktype']} and omschrijving = {omschrijving} is found"
@@ -50,7 +50,6 @@ class CreateStatusTask(ZGWWorkUnit):
 
         if "statusVolgnummer" in variables:
             volgnummer = int(variables["statusVolgnummer"])
-            ztc_client = self.get_client(APITypes.ztc)
 
             logger.info("Deriving statustype URL from Catalogi API")
             zaak = zrc_client.retrieve(
@@ -59,23 +58,14 @@ class CreateStatusTask(ZGWWorkUnit):
                 request_kwargs={"headers": {"Accept-Crs": "EPSG:4326"}},
             )
 
-            statustypen = ztc_client.list(
-                "statustype", query_params={"zaaktype": zaak["zaaktype"]}
+            statustype = self.get_catalogi().get_statustype(
+                zaak["zaaktype"], volgnummer=volgnummer
             )
-
-            if statustypen["next"]:
-                raise NotImplementedError("Pagination not implemented yet")
-
-            try:
-                statustype = next(
-                    st["url"]
-                    for st in statustypen["results"]
-                    if st["volgnummer"] == volgnummer
-                )
-            except StopIteration:
+            if statustype is None:
                 raise ValueError(
                     f"Statustype met volgnummer '{variables['statusVolgnummer']}' niet gevonden."
                 )
+            statustype = statustype["url"]
         else:
             statustype = check_variable(variables, "statustype")
 
@@ -92,3 +82,18 @@ class CreateStatusTask(ZGWWorkUnit):
     def perform(self):
         status = self.create_status()
         return {"statusUrl": status["url"]}
+
+    @classmethod
+    def perform_many(cls, tasks) -> list:
+        # the tasks of a topic usually concern zaken of the same zaaktype, whose
+        # statustypen are looked up once for the batch
+        memo = {}
+        results = []
+        for task in tasks:
+            work_unit = cls(task)
+            work_unit.catalogi_memo = memo
+            try:
+                results.append(work_unit.perform())
+            except Exception as exc:
+                results.append(exc)
+        return results
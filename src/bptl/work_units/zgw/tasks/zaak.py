@@ -4,8 +4,6 @@ from typing import Any, Dict, Optional
 
 from django.utils import timezone
 
-from zgw_consumers.api_models.base import factory
-from zgw_consumers.api_models.catalogi import ZaakType
 from zgw_consumers.api_models.constants import RolOmschrijving
 from zgw_consumers.constants import APITypes
 
@@ -79,83 +77,10 @@ class CreateZaakTask(ZGWWorkUnit):
                 zaaktype_identificatie = check_variable(
                     variables, "zaaktypeIdentificatie"
                 )
-
-                request_kwargs = {
-                    "params": {"domein": catalogus_domein, "rsin": catalogus_rsin}
-                }
-                client_ztc = self.get_client(APITypes.ztc)
-                catalogus = client_ztc.list("catalogus", request_kwargs=request_kwargs)
-                try:
-                    catalogus_url = catalogus["results"][0]["url"]
-                except (KeyError, IndexError):
-                    raise ValueError(
-                        "No catalogus found with domein %s and RSIN %s."
-                        % (catalogus_domein, catalogus_rsin)
-                    )
-
-                request_kwargs = {
-                    "params": {
-                        "catalogus": catalogus_url,
-                        "identificatie": zaaktype_identificatie,
-                    }
-                }
-                zaaktypen = client_ztc.list("zaaktype", request_kwargs=request_kwargs)
-                if zaaktypen["count"] == 0:
-                    raise ValueError(
-                        "No zaaktype was found with catalogus %s and identificatie %s."
-                        % (
-                            catalogus_url,
-                            zaaktype_identificatie,
-                        )
-                    )
-
-                zaaktypen = [
-                    factory(ZaakType, zaaktype) for zaaktype in zaaktypen["results"]
-                ]
-
-                def _filter_on_geldigheid(zaaktype: ZaakType) -> bool:
-                    if zaaktype.einde_geldigheid:
-                        return (
-                            zaaktype.begin_geldigheid
-                            <= date.today()
-                            <= zaaktype.einde_geldigheid
-                        )
-                    else:
-                        return zaaktype.begin_geldigheid <= date.today()
-
-                zaaktypen = [zt for zt in zaaktypen if _filter_on_geldigheid(zt)]
-                # Use the ZT with none as einde geldigheid or einde geldigheid that's further into the future
-                # in the edge case that einde geldigheid old zaaktype is today and a new zaaktype is geldig from today.
-                if len(zaaktypen) > 1:
-                    zaaktypen_without_einde_geldigheid = [
-                        zt for zt in zaaktypen if not zt.einde_geldigheid
-                    ]
-
-                    # If this does not exist -> get one with einde_geldigheid most distant into the future
-                    if len(zaaktypen_without_einde_geldigheid) == 0:
-                        max_einde_geldigheid = max(
-                            [zt.einde_geldigheid for zt in zaaktypen]
-                        )
-                        zaaktypen = [
-                            zt
-                            for zt in zaaktypen
-                            if zt.einde_geldigheid == max_einde_geldigheid
-                        ]
-                    else:
-                        zaaktypen = zaaktypen_without_einde_geldigheid
-
-                if len(zaaktypen) != 1:
-                    raise ValueError(
-                        "No%s zaaktype was found with catalogus %s, identificatie %s with begin_geldigheid <= %s <= einde_geldigheid."
-                        % (
-                            "" if len(zaaktypen) == 0 else " unique",
-                            catalogus_url,
-                            zaaktype_identificatie,
-                            date.today(),
-                        )
-                    )
-
-                zaaktype_url = zaaktypen[0].url
+                zaaktype = self.get_catalogi().find_zaaktype(
+                    catalogus_domein, catalogus_rsin, zaaktype_identificatie
+                )
+                zaaktype_url = zaaktype["url"]
 
             self._zaaktype = zaaktype_url
         return self._zaaktype
@@ -189,30 +114,21 @@ class CreateZaakTask(ZGWWorkUnit):
         if not hoofdbehandelaar:
             return None
 
-        ztc_client = self.get_client(APITypes.ztc)
+        catalogi = self.get_catalogi()
+        zaaktype = self._get_zaaktype(variables)
 
         roltypen = []
         for omschrijving_generiek in [
             RolOmschrijving.initiator,
             RolOmschrijving.behandelaar,
         ]:
-            query_params = {
-                "zaaktype": self._get_zaaktype(variables),
-                "omschrijvingGeneriek": omschrijving_generiek,
-            }
-            response = ztc_client.list("roltype", query_params)
-            if not response:
-                logger.info(
-                    "Roltype specified, but no matching roltype found in the zaaktype.",
-                    extra={"query_params": query_params},
+            roltypen += [
+                rt
+                for rt in catalogi.get_roltypen(
+                    zaaktype, omschrijvingGeneriek=omschrijving_generiek
                 )
-                return None
-            else:
-                roltypen += [
-                    rt
-                    for rt in response["results"]
-                    if rt["omschrijving"] in ["Initiator", "Hoofdbehandelaar"]
-                ]
+                if rt["omschrijving"] in ["Initiator", "Hoofdbehandelaar"]
+            ]
 
         zrc_client = self.get_client(APITypes.zrc)
         for rt in roltypen:
@@ -241,11 +157,10 @@ class CreateZaakTask(ZGWWorkUnit):
         variables = self.task.get_variables()
 
         # get statustype for initial status
-        ztc_client = self.get_client(APITypes.ztc)
-        statustypen = ztc_client.list(
-            "statustype", {"zaaktype": self._get_zaaktype(variables)}
-        )["results"]
-        statustype = next(filter(lambda x: x["volgnummer"] == 1, statustypen))
+        zaaktype = self._get_zaaktype(variables)
+        statustype = self.get_catalogi().get_statustype(zaaktype, volgnummer=1)
+        if statustype is None:
+            raise ValueError(f"No initial statustype found for zaaktype {zaaktype}.")
 
         initial_status_remarks = variables.get("initialStatusRemarks", "")
 
@@ -319,7 +234,6 @@ class CloseZaakTask(ZGWWorkUnit):
 
         # build clients
         zrc_client = self.get_client(APITypes.zrc)
-        ztc_client = self.get_client(APITypes.ztc)
 
         # get statustype to close zaak
         zaak_url = variables.get("zaakUrl", variables.get("zaak"))
@@ -328,8 +242,9 @@ class CloseZaakTask(ZGWWorkUnit):
             url=zaak_url,
             request_kwargs={"headers": {"Accept-Crs": "EPSG:4326"}},
         )["zaaktype"]
-        statustypen = ztc_client.list("statustype", {"zaaktype": zaaktype})["results"]
-        statustype = next(filter(lambda x: x["isEindstatus"] is True, statustypen))
+        statustype = self.get_catalogi().get_statustype(zaaktype, eindstatus=True)
+        if statustype is None:
+            raise ValueError(f"No eindstatus statustype found for zaaktype {zaaktype}.")
 
         # create status to close zaak
         data = {
@@ -345,6 +260,7 @@ class CloseZaakTask(ZGWWorkUnit):
         zaak_closed = zrc_client.retrieve(
             "zaak",
             url=zaak_url,
+            bypass_cache=True,
             request_kwargs={"headers": {"Accept-Crs": "EPSG:4326"}},
         )
         return zaak_closed
@@ -362,6 +278,7 @@ class CloseZaakTask(ZGWWorkUnit):
 
 @register
 @require_zrc
+@register.require_variables("identificatie", "bronorganisatie")
 class LookupZaak(ZGWWorkUnit):
     """
     Look up a single ZAAK by identificatie and bronorganisatie.
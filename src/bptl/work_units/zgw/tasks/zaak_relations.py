@@ -185,7 +185,6 @@ class CreateEigenschap(ZGWWorkUnit):
 
     def perform(self) -> dict:
         # prep clients
-        ztc_client = self.get_client(APITypes.ztc)
         zrc_client = self.get_client(APITypes.zrc)
 
         # get vars
@@ -212,22 +211,13 @@ class CreateEigenschap(ZGWWorkUnit):
             )
             zaaktype = zaak["zaaktype"]
 
-        # fetch eigenschappen
-        eigenschappen = get_paginated_results(
-            ztc_client, "eigenschap", query_params={"zaaktype": zaaktype}
-        )
-        try:
-            eigenschap_url = next(
-                (
-                    eigenschap["url"]
-                    for eigenschap in eigenschappen
-                    if eigenschap["naam"] == naam
-                )
-            )
-        except StopIteration:
+        # look up the eigenschap
+        zaaktype_eigenschap = self.get_catalogi().get_eigenschap(zaaktype, naam)
+        if zaaktype_eigenschap is None:
             # eigenschap not found - abort
             logger.info("Eigenschap '%s' did not exist on the zaaktype, aborting.")
             return {}
+        eigenschap_url = zaaktype_eigenschap["url"]
 
         # Now make sure eigenschap doesnt already exist
         zaak = zrc_client.retrieve(
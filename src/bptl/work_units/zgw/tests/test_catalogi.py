@@ -0,0 +1,186 @@
+from datetime import date
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+import requests_mock
+from zgw_consumers.constants import APITypes
+
+from bptl.tasks.tests.factories import ServiceFactory
+
+from ..catalogi import Catalogi
+from ..client import ZGWClient
+from .compat import generate_oas_component
+
+ZTC_URL = "https://some.ztc.nl/api/v1/"
+CATALOGUS = f"{ZTC_URL}catalogussen/7022a89e-0dd1-4074-9c3a-1a990e6c18ab"
+ZAAKTYPE_1 = f"{ZTC_URL}zaaktypen/c9bd2abb-c6b0-4c47-a6b6-3b5bb1bf4d02"
+ZAAKTYPE_2 = f"{ZTC_URL}zaaktypen/5f7ee6e8-a2b1-4b0e-8b93-3a35d4e4b4b5"
+
+
+def _paginated(*results) -> dict:
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+def get_zaaktypen() -> list:
+    return [
+        generate_oas_component(
+            "ztc",
+            "schemas/ZaakType",
+            url=ZAAKTYPE_1,
+            catalogus=CATALOGUS,
+            identificatie="ZT1",
+            beginGeldigheid="2021-01-01",
+            eindeGeldigheid="2021-06-30",
+        ),
+        generate_oas_component(
+            "ztc",
+            "schemas/ZaakType",
+            url=ZAAKTYPE_2,
+            catalogus=CATALOGUS,
+            identificatie="ZT1",
+            beginGeldigheid="2021-07-01",
+            eindeGeldigheid=None,
+        ),
+    ]
+
+
+def mock_catalogi(m):
+    m.get(
+        f"{ZTC_URL}catalogussen?domein=ABR&rsin=002220647",
+        json=_paginated({"url": CATALOGUS, "domein": "ABR", "rsin": "002220647"}),
+    )
+    m.get(
+        f"{ZTC_URL}zaaktypen?catalogus={CATALOGUS}&identificatie=ZT1",
+        json=_paginated(*get_zaaktypen()),
+    )
+    m.get(
+        f"{ZTC_URL}statustypen?zaaktype={ZAAKTYPE_2}",
+        json=_paginated(
+            {"url": f"{ZTC_URL}statustypen/1", "volgnummer": 1, "isEindstatus": False},
+            {"url": f"{ZTC_URL}statustypen/2", "volgnummer": 2, "isEindstatus": True},
+        ),
+    )
+    m.get(
+        f"{ZTC_URL}roltypen?zaaktype={ZAAKTYPE_2}",
+        json=_paginated(
+            {
+                "url": f"{ZTC_URL}roltypen/1",
+                "omschrijving": "Initiator",
+                "omschrijvingGeneriek": "initiator",
+            },
+            {
+                "url": f"{ZTC_URL}roltypen/2",
+                "omschrijving": "Hoofdbehandelaar",
+                "omschrijvingGeneriek": "behandelaar",
+            },
+        ),
+    )
+    m.get(
+        f"{ZTC_URL}resultaattypen?zaaktype={ZAAKTYPE_2}",
+        json=_paginated({"url": f"{ZTC_URL}resultaattypen/1", "omschrijving": "Klaar"}),
+    )
+    m.get(
+        f"{ZTC_URL}eigenschappen?zaaktype={ZAAKTYPE_2}",
+        json=_paginated({"url": f"{ZTC_URL}eigenschappen/1", "naam": "kleur"}),
+    )
+
+
+@override_settings(ZTC_CACHE_TIMEOUT=60)
+@requests_mock.Mocker()
+class CatalogiTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _get_catalogi(self, client_id="bptl") -> Catalogi:
+        client = ZGWClient(ZTC_URL)
+        client.set_auth_value({"Authorization": f"Token {client_id}"})
+        return Catalogi(client)
+
+    def test_types_indexed(self, m):
+        mock_catalogi(m)
+        catalogi = self._get_catalogi()
+
+        initial = catalogi.get_statustype(ZAAKTYPE_2, volgnummer=1)
+        eindstatus = catalogi.get_statustype(ZAAKTYPE_2, eindstatus=True)
+        missing = catalogi.get_statustype(ZAAKTYPE_2, volgnummer=3)
+        roltypen = catalogi.get_roltypen(ZAAKTYPE_2, omschrijvingGeneriek="behandelaar")
+        resultaattypen = catalogi.get_resultaattypen(ZAAKTYPE_2, omschrijving="KLAAR")
+
+        self.assertEqual(initial["url"], f"{ZTC_URL}statustypen/1")
+        self.assertEqual(eindstatus["url"], f"{ZTC_URL}statustypen/2")
+        self.assertIsNone(missing)
+        self.assertEqual([rt["url"] for rt in roltypen], [f"{ZTC_URL}roltypen/2"])
+        self.assertEqual(len(resultaattypen), 1)
+        self.assertEqual(
+            catalogi.get_eigenschap(ZAAKTYPE_2, "kleur")["url"],
+            f"{ZTC_URL}eigenschappen/1",
+        )
+        # one request per type
+        self.assertEqual(m.call_count, 4)
+
+    def test_cached_across_instances(self, m):
+        mock_catalogi(m)
+
+        self._get_catalogi().get_statustype(ZAAKTYPE_2, volgnummer=1)
+        self._get_catalogi().get_statustype(ZAAKTYPE_2, volgnummer=2)
+        self._get_catalogi("other-app").get_statustype(ZAAKTYPE_2, volgnummer=1)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_find_zaaktype_valid_on_date(self, m):
+        mock_catalogi(m)
+        catalogi = self._get_catalogi()
+
+        old = catalogi.find_zaaktype("ABR", "002220647", "ZT1", date(2021, 3, 1))
+        new = catalogi.find_zaaktype("ABR", "002220647", "ZT1", date(2021, 8, 1))
+
+        self.assertEqual(old["url"], ZAAKTYPE_1)
+        self.assertEqual(new["url"], ZAAKTYPE_2)
+        self.assertEqual(m.call_count, 2)
+
+        with self.assertRaisesMessage(ValueError, "No zaaktype was found"):
+            catalogi.find_zaaktype("ABR", "002220647", "ZT1", date(2020, 1, 1))
+
+    def test_missing_not_cached(self, m):
+        m.get(f"{ZTC_URL}statustypen?zaaktype={ZAAKTYPE_2}", json=_paginated())
+        catalogi = self._get_catalogi()
+
+        self.assertIsNone(catalogi.get_statustype(ZAAKTYPE_2, volgnummer=1))
+        self.assertIsNone(catalogi.get_statustype(ZAAKTYPE_2, volgnummer=1))
+        self.assertEqual(m.call_count, 2)
+
+    @override_settings(ZTC_CACHE_TIMEOUT=0)
+    def test_disabled(self, m):
+        mock_catalogi(m)
+
+        self._get_catalogi().get_statustype(ZAAKTYPE_2, volgnummer=1)
+        self._get_catalogi().get_statustype(ZAAKTYPE_2, volgnummer=1)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_warm_up_command(self, m):
+        service = ServiceFactory.create(api_root=ZTC_URL, api_type=APITypes.ztc)
+        # registered first, the filtered lists take precedence
+        m.get(
+            f"{ZTC_URL}catalogussen",
+            json=_paginated({"url": CATALOGUS, "domein": "ABR", "rsin": "002220647"}),
+        )
+        m.get(f"{ZTC_URL}zaaktypen", json=_paginated(*get_zaaktypen()))
+        mock_catalogi(m)
+        for resource in ("statustypen", "roltypen", "resultaattypen", "eigenschappen"):
+            m.get(f"{ZTC_URL}{resource}?zaaktype={ZAAKTYPE_1}", json=_paginated())
+        stdout = StringIO()
+
+        call_command("warm_catalogi_cache", stdout=stdout)
+
+        self.assertIn(f"Cached 2 zaaktype(n) of {ZTC_URL}.", stdout.getvalue())
+        calls = m.call_count
+        catalogi = Catalogi(service.build_client())
+        zaaktype = catalogi.find_zaaktype("ABR", "002220647", "ZT1", date(2021, 8, 1))
+        catalogi.get_statustype(zaaktype["url"], eindstatus=True)
+        self.assertEqual(m.call_count, calls)
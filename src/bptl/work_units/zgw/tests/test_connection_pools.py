@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+
+from bptl.work_units.clients import JSONClient
+from bptl.work_units.pools import PoolRegistry, SharedHTTPAdapter, pool_registry
+
+from ..client import ZGWClient
+
+ZRC_URL = "https://some.zrc.nl/api/v1/"
+
+
+class PoolRegistryTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(pool_registry.clear)
+
+    def test_clients_share_adapter(self):
+        service = Service(api_type=APITypes.zrc, api_root=ZRC_URL)
+        client1 = service.build_client()
+        client2 = ZGWClient(ZRC_URL)
+        json_client = JSONClient(service, {})
+
+        adapter = client1.get_adapter(f"{ZRC_URL}zaken")
+
+        self.assertIsInstance(adapter, SharedHTTPAdapter)
+        self.assertIs(client2.get_adapter(f"{ZRC_URL}zaken"), adapter)
+        self.assertIs(json_client.session.get_adapter(f"{ZRC_URL}zaken"), adapter)
+        self.assertIsNot(
+            client1.get_adapter("https://other.nl/api/v1/zaken"),
+            adapter,
+        )
+
+    def test_closing_client_keeps_pool(self):
+        client = ZGWClient(ZRC_URL)
+        adapter = client.get_adapter(ZRC_URL)
+
+        with patch.object(adapter.poolmanager, "clear") as m_clear:
+            client.close()
+
+        m_clear.assert_not_called()
+
+    @override_settings(HTTP_POOL_MAXSIZE=3, HTTP_POOL_RETRIES=4)
+    def test_adapter_configuration(self):
+        registry = PoolRegistry()
+
+        adapter = registry.get_adapter(ZRC_URL)
+
+        self.assertEqual(adapter._pool_maxsize, 3)
+        self.assertEqual(adapter.max_retries.total, 4)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertNotIn("POST", adapter.max_retries.allowed_methods)
+
+    def test_reset_after_fork(self):
+        registry = PoolRegistry()
+        adapter = registry.get_adapter(ZRC_URL)
+
+        registry._reset_after_fork()
+
+        self.assertIsNot(registry.get_adapter(ZRC_URL), adapter)
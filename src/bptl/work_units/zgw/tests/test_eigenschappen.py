@@ -1,5 +1,6 @@
 from copy import deepcopy
 
+from django.core.cache import cache
 from django.test import TestCase
 
 import requests_mock
@@ -70,6 +71,12 @@ class CreateEigenschapRelationTaskTests(TestCase):
             },
         )
 
+    def setUp(self):
+        super().setUp()
+        # the catalogi metadata is cached across tasks
+        cache.clear()
+        self.addCleanup(cache.clear)
+
     def test_relate_eigenschap(self, m):
         mock_service_oas_get(m, ZRC_URL, "zrc")
         mock_service_oas_get(m, ZTC_URL, "ztc")
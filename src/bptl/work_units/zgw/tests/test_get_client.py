@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 from django.db import IntegrityError
 from django.test import TestCase
@@ -87,3 +88,31 @@ class GetZGWClientTests(TestCase):
         err_message = "Multiple 'zrc' services configured for topic 'some-topic'"
         with self.assertRaisesMessage(MultipleServices, err_message):
             self.work_unit.get_client(APITypes.zrc)
+
+    @patch("bptl.work_units.zgw.tasks.base.get_credentials")
+    def test_clients_cached_per_task(self, m_get_credentials):
+        m_get_credentials.side_effect = lambda app_id, service: {
+            service: {"Authorization": "Bearer token"}
+        }
+        self.task.variables = {"bptlAppId": serialize_variable("some-app-id")}
+        self.task.save()
+        DefaultServiceFactory.create(
+            task_mapping=self.mapping, service=self.service, alias="ZRC"
+        )
+
+        with self.assertNumQueries(1):
+            client = self.work_unit.get_client(APITypes.zrc)
+            # nested work units performed for the same task
+            nested_client = ZGWWorkUnit(self.task).get_client(APITypes.zrc)
+
+        self.assertIs(nested_client, client)
+        m_get_credentials.assert_called_once()
+
+        other_task = ExternalTaskFactory.create(
+            topic_name="some-topic",
+            variables={"bptlAppId": serialize_variable("some-app-id")},
+        )
+        other_client = ZGWWorkUnit(other_task).get_client(APITypes.zrc)
+
+        self.assertIsNot(other_client, client)
+        self.assertIs(other_client._log.task, other_task)
@@ -0,0 +1,161 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+import jwt
+import requests_mock
+from freezegun import freeze_time
+
+from ..client import ZGWClient
+from ..http_cache import get_identity, get_ttl
+
+ZRC_URL = "https://some.zrc.nl/api/v1/"
+ZTC_URL = "https://some.ztc.nl/api/v1/"
+ZAAK = f"{ZRC_URL}zaken/4f8b4811-5d7e-4e9b-8201-b35f5101f891"
+ZAAKTYPE = f"{ZTC_URL}zaaktypen/c9bd2abb-c6b0-4c47-a6b6-3b5bb1bf4d02"
+
+
+@override_settings(ZGW_HTTP_CACHE=True, ZGW_HTTP_CACHE_TTLS={"zaaktypen": 300})
+@requests_mock.Mocker()
+class HTTPCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _get_client(self, base_url: str, client_id="bptl") -> ZGWClient:
+        client = ZGWClient(base_url)
+        client.set_auth_value({"Authorization": f"Token {client_id}"})
+        return client
+
+    def test_revalidated_with_etag(self, m):
+        m.get(ZAAK, json={"url": ZAAK}, headers={"ETag": '"abc"'})
+        client = self._get_client(ZRC_URL)
+
+        client.retrieve("zaak", url=ZAAK)
+        m.get(ZAAK, status_code=304, headers={"ETag": '"abc"'})
+        zaak = client.retrieve("zaak", url=ZAAK)
+
+        self.assertEqual(zaak, {"url": ZAAK})
+        self.assertEqual(m.call_count, 2)
+        self.assertNotIn("If-None-Match", m.request_history[0].headers)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+
+    def test_changed_resource_replaced(self, m):
+        m.get(ZAAK, json={"status": None}, headers={"ETag": '"abc"'})
+        client = self._get_client(ZRC_URL)
+        client.retrieve("zaak", url=ZAAK)
+
+        m.get(ZAAK, json={"status": "open"}, headers={"ETag": '"def"'})
+        self.assertEqual(client.retrieve("zaak", url=ZAAK), {"status": "open"})
+
+        m.get(ZAAK, status_code=304)
+        self.assertEqual(client.retrieve("zaak", url=ZAAK), {"status": "open"})
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"def"')
+
+    def test_served_from_cache_within_ttl(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+        client = self._get_client(ZTC_URL)
+
+        with freeze_time("2020-01-01 12:00:00"):
+            client.retrieve("zaaktype", url=ZAAKTYPE)
+        with freeze_time("2020-01-01 12:04:59"):
+            zaaktype = client.retrieve("zaaktype", url=ZAAKTYPE)
+
+        self.assertEqual(zaaktype, {"url": ZAAKTYPE})
+        self.assertEqual(m.call_count, 1)
+
+        with freeze_time("2020-01-01 12:05:01"):
+            client.retrieve("zaaktype", url=ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_cached_per_application(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+
+        self._get_client(ZTC_URL, "app1").retrieve("zaaktype", url=ZAAKTYPE)
+        self._get_client(ZTC_URL, "app1").retrieve("zaaktype", url=ZAAKTYPE)
+        self._get_client(ZTC_URL, "app2").retrieve("zaaktype", url=ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_bypass(self, m):
+        m.get(ZAAKTYPE, json={"omschrijving": "old"})
+        client = self._get_client(ZTC_URL)
+        client.retrieve("zaaktype", url=ZAAKTYPE)
+
+        m.get(ZAAKTYPE, json={"omschrijving": "new"})
+        zaaktype = client.retrieve("zaaktype", url=ZAAKTYPE, bypass_cache=True)
+
+        self.assertEqual(zaaktype, {"omschrijving": "new"})
+        self.assertEqual(client.retrieve("zaaktype", url=ZAAKTYPE), zaaktype)
+        self.assertEqual(m.call_count, 2)
+
+    def test_invalidated_on_write(self, m):
+        m.get(ZAAKTYPE, json={"omschrijving": "old"})
+        m.patch(ZAAKTYPE, json={"omschrijving": "new"})
+        client = self._get_client(ZTC_URL)
+        client.retrieve("zaaktype", url=ZAAKTYPE)
+
+        client.partial_update("zaaktype", url=ZAAKTYPE, omschrijving="new")
+        m.get(ZAAKTYPE, json={"omschrijving": "new"})
+
+        self.assertEqual(
+            client.retrieve("zaaktype", url=ZAAKTYPE), {"omschrijving": "new"}
+        )
+
+    def test_write_invalidates_all_variants(self, m):
+        m.get(ZAAKTYPE, json={"omschrijving": "old"})
+        m.patch(ZAAKTYPE, json={"omschrijving": "new"})
+        other_app = self._get_client(ZTC_URL, "app2")
+        other_app.retrieve("zaaktype", url=ZAAKTYPE)
+        other_app.get(ZAAKTYPE, params={"expand": "statustypen"})
+
+        self._get_client(ZTC_URL).partial_update(
+            "zaaktype", url=ZAAKTYPE, omschrijving="new"
+        )
+        m.get(ZAAKTYPE, json={"omschrijving": "new"})
+
+        self.assertEqual(
+            other_app.retrieve("zaaktype", url=ZAAKTYPE), {"omschrijving": "new"}
+        )
+        response = other_app.get(ZAAKTYPE, params={"expand": "statustypen"})
+        self.assertEqual(response.json(), {"omschrijving": "new"})
+
+    def test_errors_not_cached(self, m):
+        m.get(ZAAKTYPE, status_code=403, json={"detail": "forbidden"})
+        client = self._get_client(ZTC_URL)
+
+        for _ in range(2):
+            response = client.get(ZAAKTYPE)
+            self.assertEqual(response.status_code, 403)
+
+        self.assertEqual(m.call_count, 2)
+
+    @override_settings(ZGW_HTTP_CACHE=False)
+    def test_disabled(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE}, headers={"ETag": '"abc"'})
+        client = self._get_client(ZTC_URL)
+
+        client.retrieve("zaaktype", url=ZAAKTYPE)
+        client.retrieve("zaaktype", url=ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+        self.assertNotIn("If-None-Match", m.last_request.headers)
+
+    def test_only_resources_cached(self, m):
+        self.assertEqual(get_ttl(ZAAKTYPE), 300)
+        self.assertEqual(get_ttl(ZAAK), 0)
+        self.assertIsNone(get_ttl(f"{ZTC_URL}zaaktypen"))
+        self.assertIsNone(get_ttl(f"{ZTC_URL}zaaktypen?catalogus=foo"))
+
+    def test_identity_of_jwt(self, m):
+        token = jwt.encode({"client_id": "", "iat": 1}, "secret", algorithm="HS256")
+        later = jwt.encode({"client_id": "", "iat": 2}, "secret", algorithm="HS256")
+        other = jwt.encode({"client_id": "other"}, "secret", algorithm="HS256")
+
+        identity = get_identity({"Authorization": f"Bearer {token}"})
+
+        self.assertEqual(identity, get_identity({"Authorization": f"Bearer {later}"}))
+        self.assertNotEqual(
+            identity, get_identity({"Authorization": f"Bearer {other}"})
+        )
@@ -1,6 +1,7 @@
 import json
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
 import requests_mock
 from django_camunda.utils import serialize_variable
@@ -10,6 +11,7 @@ from bptl.camunda.tests.factories import ExternalTaskFactory
 from bptl.tasks.tests.factories import DefaultServiceFactory, TaskMappingFactory
 from bptl.work_units.zgw.tests.compat import mock_service_oas_get
 
+from ...capture import decode_body
 from ..tasks.base import ZGWWorkUnit
 
 ZRC_URL = "https://some.zrc.nl/api/v1/"
@@ -112,3 +114,110 @@ class ZGWClientLogTests(TestCase):
                 },
             },
         )
+
+
+@requests_mock.Mocker()
+class CapturePolicyTests(TestCase):
+    def _get_client(self, **options):
+        mapping = TaskMappingFactory.create(
+            topic_name="some-topic", **options.pop("mapping", {})
+        )
+        DefaultServiceFactory.create(
+            task_mapping=mapping,
+            service__api_type=APITypes.zrc,
+            service__api_root=ZRC_URL,
+            alias="ZRC",
+            **options,
+        )
+        task = ExternalTaskFactory.create(
+            topic_name="some-topic",
+            variables={"bptlAppId": serialize_variable("some-app-id")},
+        )
+        return task, ZGWWorkUnit(task).get_client(APITypes.zrc)
+
+    def test_headers_only(self, m):
+        mock_service_oas_get(m, ZRC_URL, "zrc")
+        m.post(f"{ZRC_URL}zaken", json={"url": ZAAK}, status_code=201)
+        task, client = self._get_client(mapping={"log_payloads": "headers"})
+
+        client.create("zaak", {"someVar": "some value"})
+
+        log = task.logs.get()
+        self.assertIsNone(log.extra_data["request"]["data"])
+        self.assertIsNone(log.extra_data["response"]["data"])
+        self.assertIn("Authorization", log.extra_data["request"]["headers"])
+        self.assertEqual(log.extra_data["response"]["status"], 201)
+
+    def test_errors_only_per_service(self, m):
+        mock_service_oas_get(m, ZRC_URL, "zrc")
+        m.get(ZAAK, json={"url": ZAAK})
+        m.post(f"{ZRC_URL}zaken", json={"detail": "invalid"}, status_code=400)
+        task, client = self._get_client(
+            mapping={"log_payloads": "headers"}, log_payloads="errors"
+        )
+
+        client.retrieve("zaak", url=ZAAK)
+        with self.assertRaises(Exception):
+            client.create("zaak", {"someVar": "some value"})
+
+        success, error = task.logs.order_by("pk")
+        self.assertEqual(success.extra_data["request"]["url"], ZAAK)
+        self.assertEqual(success.extra_data["request"]["headers"], {})
+        self.assertIsNone(success.extra_data["response"]["data"])
+        self.assertEqual(error.extra_data["request"]["data"], {"someVar": "some value"})
+        self.assertEqual(error.extra_data["response"]["data"], {"detail": "invalid"})
+
+    def test_not_sampled(self, m):
+        mock_service_oas_get(m, ZRC_URL, "zrc")
+        m.get(ZAAK, json={"url": ZAAK})
+        task, client = self._get_client(log_sample_rate=0)
+
+        client.retrieve("zaak", url=ZAAK)
+
+        log = task.logs.get()
+        self.assertEqual(log.extra_data["request"]["headers"], {})
+        self.assertIsNone(log.extra_data["response"]["data"])
+
+    @override_settings(REQUEST_LOG_MAX_BODY_SIZE=10)
+    def test_truncated(self, m):
+        mock_service_oas_get(m, ZRC_URL, "zrc")
+        m.get(ZAAK, json={"url": ZAAK})
+        task, client = self._get_client(mapping={"log_payloads": "truncated"})
+
+        client.retrieve("zaak", url=ZAAK)
+
+        response = task.logs.get().extra_data["response"]
+        self.assertEqual(response["data"], '{"url": "h')
+        self.assertTrue(response["truncated"])
+        self.assertEqual(response["size"], len(json.dumps({"url": ZAAK})))
+
+    @override_settings(REQUEST_LOG_COMPRESS_THRESHOLD=10)
+    def test_compressed(self, m):
+        mock_service_oas_get(m, ZRC_URL, "zrc")
+        m.get(ZAAK, json={"url": ZAAK})
+        task, client = self._get_client()
+
+        client.retrieve("zaak", url=ZAAK)
+
+        response = task.logs.get().extra_data["response"]
+        self.assertEqual(response["encoding"], "zlib+base64")
+        self.assertEqual(decode_body(response), {"url": ZAAK})
+
+    @override_settings(ZGW_HTTP_CACHE=True, ZGW_HTTP_CACHE_TTLS={"zaken": 300})
+    def test_cache_hit(self, m):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        mock_service_oas_get(m, ZRC_URL, "zrc")
+        m.get(ZAAK, json={"url": ZAAK})
+        task, client = self._get_client()
+
+        client.retrieve("zaak", url=ZAAK)
+        client.retrieve("zaak", url=ZAAK)
+
+        first, second = task.logs.order_by("pk")
+        self.assertNotIn("cached", first.extra_data["response"])
+        self.assertTrue(second.extra_data["response"]["cached"])
+        self.assertEqual(second.extra_data["request"]["url"], ZAAK)
+        self.assertEqual(
+            len([request for request in m.request_history if request.url == ZAAK]), 1
+        )
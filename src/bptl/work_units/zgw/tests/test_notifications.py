@@ -0,0 +1,179 @@
+from django.core.cache import cache
+from django.core.checks import Warning
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+import requests_mock
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from ..catalogi import Catalogi
+from ..checks import check_invalidation_cache
+from ..client import ZGWClient
+from ..models import NotificationsConfig
+
+ZRC_URL = "https://some.zrc.nl/api/v1/"
+ZTC_URL = "https://some.ztc.nl/api/v1/"
+ZAAK = f"{ZRC_URL}zaken/4f8b4811-5d7e-4e9b-8201-b35f5101f891"
+STATUS = f"{ZRC_URL}statussen/b7218c76-7478-41e9-a088-54d2f914a713"
+CATALOGUS = f"{ZTC_URL}catalogussen/7022a89e-0dd1-4074-9c3a-1a990e6c18ab"
+ZAAKTYPE = f"{ZTC_URL}zaaktypen/c9bd2abb-c6b0-4c47-a6b6-3b5bb1bf4d02"
+
+
+def get_notification(**kwargs) -> dict:
+    return {
+        "kanaal": "zaken",
+        "hoofdObject": ZAAK,
+        "resource": "status",
+        "resourceUrl": STATUS,
+        "actie": "create",
+        "aanmaakdatum": "2020-01-16T12:00:00Z",
+        "kenmerken": {},
+        **kwargs,
+    }
+
+
+@override_settings(
+    ZGW_HTTP_CACHE=True, ZGW_HTTP_CACHE_TTLS={"zaaktypen": 300}, ZTC_CACHE_TIMEOUT=300
+)
+@requests_mock.Mocker()
+class NotificationCallbackTests(APITestCase):
+    url = reverse("zgw:notification-callback")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        config = NotificationsConfig.get_solo()
+        config.auth_key = "some-key"
+        config.save()
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client.credentials(HTTP_AUTHORIZATION="Basic some-key")
+
+    def _get_client(self, base_url: str) -> ZGWClient:
+        client = ZGWClient(base_url)
+        client.set_auth_value({"Authorization": "Token bptl"})
+        return client
+
+    def test_authentication_required(self, m):
+        self.client.credentials(HTTP_AUTHORIZATION="Basic other-key")
+
+        response = self.client.post(self.url, get_notification())
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_invalid_notification(self, m):
+        response = self.client.post(self.url, {"kanaal": "zaken"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_zaak_invalidated(self, m):
+        m.get(ZAAK, json={"status": None}, headers={"ETag": '"abc"'})
+        client = self._get_client(ZRC_URL)
+        client.retrieve("zaak", url=ZAAK)
+
+        response = self.client.post(self.url, get_notification())
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        m.get(ZAAK, json={"status": STATUS}, headers={"ETag": '"def"'})
+        self.assertEqual(client.retrieve("zaak", url=ZAAK), {"status": STATUS})
+        # the cached zaak was not revalidated, but retrieved again
+        self.assertNotIn("If-None-Match", m.last_request.headers)
+
+    def test_zaaktype_invalidated(self, m):
+        m.get(ZAAKTYPE, json={"omschrijving": "old"})
+        m.get(
+            f"{ZTC_URL}statustypen?zaaktype={ZAAKTYPE}",
+            json={
+                "count": 1,
+                "next": None,
+                "previous": None,
+                "results": [{"url": f"{ZTC_URL}statustypen/1", "volgnummer": 1}],
+            },
+        )
+        client = self._get_client(ZTC_URL)
+        catalogi = Catalogi(client)
+        client.retrieve("zaaktype", url=ZAAKTYPE)
+        catalogi.get_statustype(ZAAKTYPE, volgnummer=1)
+        self.assertEqual(m.call_count, 2)
+
+        response = self.client.post(
+            self.url,
+            get_notification(
+                kanaal="zaaktypen",
+                hoofdObject=ZAAKTYPE,
+                resource="statustype",
+                resourceUrl=f"{ZTC_URL}statustypen/1",
+                actie="update",
+                kenmerken={"catalogus": CATALOGUS},
+            ),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        client.retrieve("zaaktype", url=ZAAKTYPE)
+        catalogi.get_statustype(ZAAKTYPE, volgnummer=1)
+        self.assertEqual(m.call_count, 4)
+
+        # the refreshed entries are cached again
+        client.retrieve("zaaktype", url=ZAAKTYPE)
+        catalogi.get_statustype(ZAAKTYPE, volgnummer=1)
+        self.assertEqual(m.call_count, 4)
+
+    def test_other_kanaal_ignored(self, m):
+        m.get(ZAAK, json={"status": None}, headers={"ETag": '"abc"'})
+        client = self._get_client(ZRC_URL)
+        client.retrieve("zaak", url=ZAAK)
+
+        response = self.client.post(self.url, get_notification(kanaal="documenten"))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        m.get(ZAAK, status_code=304)
+        client.retrieve("zaak", url=ZAAK)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+
+
+LOCMEM = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+REDIS = {"BACKEND": "django_redis.cache.RedisCache"}
+
+
+class InvalidationCacheCheckTests(SimpleTestCase):
+    @override_settings(
+        ZGW_HTTP_CACHE=True,
+        ZGW_HTTP_CACHE_ALIAS="zgw",
+        ZTC_CACHE_TIMEOUT=300,
+        CACHES={"default": REDIS, "zgw": LOCMEM},
+    )
+    def test_process_local_cache(self):
+        errors = check_invalidation_cache(None)
+
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], Warning)
+        self.assertEqual(errors[0].id, "zgw.W001")
+        self.assertIn("'zgw'", errors[0].msg)
+
+    @override_settings(
+        ZGW_HTTP_CACHE=True, ZTC_CACHE_TIMEOUT=300, CACHES={"default": REDIS}
+    )
+    @override_settings(
+        ZGW_HTTP_CACHE=False,
+        ZTC_CACHE_TIMEOUT=300,
+        ZTC_CACHE_ALIAS="ztc",
+        CACHES={"default": REDIS, "ztc": LOCMEM},
+    )
+    def test_process_local_catalogi_cache(self):
+        errors = check_invalidation_cache(None)
+
+        self.assertEqual([error.id for error in errors], ["zgw.W001"])
+        self.assertIn("'ztc'", errors[0].msg)
+
+    def test_shared_cache(self):
+        self.assertEqual(check_invalidation_cache(None), [])
+
+    @override_settings(
+        ZGW_HTTP_CACHE=False, ZTC_CACHE_TIMEOUT=0, CACHES={"default": LOCMEM}
+    )
+    def test_caches_disabled(self):
+        self.assertEqual(check_invalidation_cache(None), [])
@@ -0,0 +1,95 @@
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+import yaml
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+from zgw_consumers_oas import read_schema
+
+from bptl.work_units.oas import (
+    Operation,
+    SchemaIndexRegistry,
+    compile_schema,
+    schema_indexes,
+)
+
+from ..client import ZGWClient
+
+ZRC_URL = "https://some.zrc.nl/api/v1/"
+
+
+class SchemaIndexTests(SimpleTestCase):
+    def test_compile_schema(self):
+        index = compile_schema(read_schema("zrc"))
+
+        self.assertEqual(
+            index.get_operation("zaak_create"),
+            Operation(
+                path="/zaken",
+                method="POST",
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept-Crs": "EPSG:4326",
+                    "Content-Crs": "EPSG:4326",
+                },
+            ),
+        )
+        self.assertIsNone(index.get_operation("unknown"))
+
+    def test_persisted_index(self):
+        content = read_schema("ztc")
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with override_settings(OAS_INDEX_CACHE_DIR=cache_dir):
+                index = compile_schema(content)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+                with patch("bptl.work_units.oas.yaml.safe_load") as m_safe_load:
+                    persisted = compile_schema(content)
+
+        m_safe_load.assert_not_called()
+        self.assertEqual(persisted.operations, index.operations)
+        self.assertEqual(persisted.schema, index.schema)
+
+    def test_registry_loads_once(self):
+        registry = SchemaIndexRegistry()
+        load = MagicMock(return_value=None)
+
+        self.assertIsNone(registry.get("zrc", load))
+        self.assertIsNone(registry.get("zrc", load))
+
+        load.assert_called_once_with()
+
+
+class ZGWClientOperationTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        schema_indexes.clear()
+        self.addCleanup(schema_indexes.clear)
+
+    def test_schema_shared_by_clients(self):
+        service = Service(api_type=APITypes.zrc, api_root=ZRC_URL)
+
+        with patch(
+            "bptl.work_units.oas.yaml.safe_load", wraps=yaml.safe_load
+        ) as m_safe_load:
+            client1 = service.build_client()
+            client2 = service.build_client()
+
+            self.assertEqual(
+                client1._get_operation_url("zaak_read", uuid="1234"),
+                ("zaken/1234", "GET"),
+            )
+            self.assertIs(client2.schema, client1.schema)
+
+        m_safe_load.assert_called_once()
+
+    def test_inferred_operation_without_schema(self):
+        client = ZGWClient(ZRC_URL)
+
+        self.assertEqual(
+            client._get_operation_url("zaak_list"),
+            ("zaken", "GET"),
+        )
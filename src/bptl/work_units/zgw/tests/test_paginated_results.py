@@ -0,0 +1,100 @@
+import threading
+from unittest.mock import MagicMock
+
+from django.test import SimpleTestCase
+
+import requests
+
+from ..utils import get_paginated_results, iter_paginated_results
+
+ZRC_URL = "https://some.zrc.nl/api/v1/"
+
+
+def get_client(
+    num_pages: int, page_size: int = 2, count=True, available_pages=None
+) -> MagicMock:
+    lock = threading.Lock()
+    requested = []
+
+    def list_page(resource, query_params=None, **kwargs):
+        page = query_params.get("page", [1])[0] if query_params else 1
+        with lock:
+            requested.append(page)
+        if available_pages is not None and page > available_pages:
+            response = requests.Response()
+            response.status_code = 404
+            raise requests.HTTPError(response=response)
+        return {
+            "count": num_pages * page_size if count else None,
+            "next": (
+                f"{ZRC_URL}{resource}?page={page + 1}" if page < num_pages else None
+            ),
+            "previous": None,
+            "results": [{"page": page, "index": index} for index in range(page_size)],
+        }
+
+    client = MagicMock()
+    client.list.side_effect = list_page
+    client.requested = requested
+    return client
+
+
+class PaginatedResultsTests(SimpleTestCase):
+    def test_single_page(self):
+        client = get_client(num_pages=1)
+
+        results = get_paginated_results(client, "rol")
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(client.requested, [1])
+
+    def test_concurrent_pages(self):
+        client = get_client(num_pages=10)
+
+        results = get_paginated_results(
+            client, "rol", query_params={"zaak": "https://zaak"}
+        )
+
+        self.assertEqual(
+            [(result["page"], result["index"]) for result in results],
+            [(page, index) for page in range(1, 11) for index in range(2)],
+        )
+        self.assertEqual(sorted(client.requested), list(range(1, 11)))
+        for call in client.list.call_args_list:
+            self.assertEqual(call.kwargs["query_params"]["zaak"], "https://zaak")
+
+    def test_result_set_shrank(self):
+        client = get_client(num_pages=10, available_pages=4)
+
+        results = get_paginated_results(client, "rol")
+
+        self.assertEqual(
+            [result["page"] for result in results], [1, 1, 2, 2, 3, 3, 4, 4]
+        )
+
+    def test_sequential_without_count(self):
+        client = get_client(num_pages=3, count=False)
+
+        results = get_paginated_results(client, "rol")
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(client.requested, [1, 2, 3])
+
+    def test_stop_early(self):
+        client = get_client(num_pages=20)
+
+        pages = iter_paginated_results(client, "rol", max_workers=2)
+        first_results = [next(pages) for _ in range(3)]
+        pages.close()
+
+        self.assertEqual([result["page"] for result in first_results], [1, 1, 2])
+        # the first page and at most one page ahead of the consumed pages
+        self.assertLessEqual(len(client.requested), 4)
+
+    def test_minimum(self):
+        client = get_client(num_pages=5)
+
+        results = get_paginated_results(client, "rol", minimum=3)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(client.requested, [1, 2])
@@ -1,5 +1,6 @@
 import json
 
+from django.core.cache import cache
 from django.test import TestCase
 
 import requests_mock
@@ -109,6 +110,12 @@ class CloseZaakTaskTests(TestCase):
             },
         )
 
+    def setUp(self):
+        super().setUp()
+        # the catalogi metadata is cached across tasks
+        cache.clear()
+        self.addCleanup(cache.clear)
+
     def test_close_zaak_without_resultaattype(self, m):
         self._mock_zgw(m)
         fetched_task = ExternalTask.objects.create(
@@ -1,5 +1,6 @@
 import json
 
+from django.core.cache import cache
 from django.test import TestCase
 
 import requests_mock
@@ -44,6 +45,10 @@ class CreateResultaatTaskTests(TestCase):
         )
 
     def setUp(self):
+        super().setUp()
+        # the catalogi metadata is cached across tasks
+        cache.clear()
+        self.addCleanup(cache.clear)
         self.fetched_task = ExternalTask.objects.create(
             topic_name="some-topic",
             worker_id="test-worker-id",
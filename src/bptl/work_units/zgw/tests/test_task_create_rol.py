@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 
 import requests_mock
@@ -65,6 +66,12 @@ class CreateRolTaskTests(TestCase):
             },
         )
 
+    def setUp(self):
+        super().setUp()
+        # the catalogi metadata is cached across tasks
+        cache.clear()
+        self.addCleanup(cache.clear)
+
     def test_create_rol(self, m):
         mock_service_oas_get(m, ZRC_URL, "zrc")
         mock_service_oas_get(m, ZTC_URL, "ztc")
@@ -1,11 +1,20 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
 import requests_mock
 from django_camunda.utils import serialize_variable
 from freezegun import freeze_time
 
 from bptl.camunda.models import ExternalTask
+from bptl.camunda.tasks import dispatch, task_execute_and_complete_many
+from bptl.tasks.models import TaskMapping
+from bptl.tasks.registry import register
 from bptl.tasks.tests.factories import DefaultServiceFactory, TaskMappingFactory
+from bptl.utils.constants import Statuses
 from bptl.work_units.zgw.tests.compat import mock_service_oas_get
 
 from ..tasks import CreateStatusTask
@@ -49,6 +58,12 @@ class CreateStatusTaskTests(TestCase):
             },
         )
 
+    def setUp(self):
+        super().setUp()
+        # the catalogi metadata is cached across tasks
+        cache.clear()
+        self.addCleanup(cache.clear)
+
     @freeze_time("2020-01-16")
     def test_create_status(self, m):
         mock_service_oas_get(m, ZRC_URL, "zrc")
@@ -147,3 +162,56 @@ class CreateStatusTaskTests(TestCase):
                 "statustoelichting": "some description",
             },
         )
+
+    @override_settings(ZTC_CACHE_TIMEOUT=0)
+    @patch("bptl.camunda.tasks.fail_task")
+    @patch("bptl.camunda.tasks.complete")
+    def test_batch_shares_statustypen(self, m, m_complete, m_fail_task):
+        mock_service_oas_get(m, ZRC_URL, "zrc")
+        mock_service_oas_get(m, ZTC_URL, "ztc")
+        TaskMapping.objects.filter(topic_name="some-topic").update(
+            callback=register.get_for(CreateStatusTask)
+        )
+        tasks = [
+            ExternalTask.objects.create(
+                topic_name="some-topic",
+                worker_id="test-worker-id",
+                task_id=f"test-task-id-{volgnummer}",
+                lock_expires_at=timezone.now() + timedelta(minutes=5),
+                variables={
+                    "zaakUrl": serialize_variable(ZAAK),
+                    "statusVolgnummer": serialize_variable(volgnummer),
+                    "bptlAppId": serialize_variable("some-app-id"),
+                },
+            )
+            for volgnummer in (2, 3)
+        ]
+        m.get(ZAAK, json={"url": ZAAK, "zaaktype": ZAAKTYPE})
+        m.get(
+            f"{ZTC_URL}statustypen?zaaktype={ZAAKTYPE}",
+            json={
+                "count": 1,
+                "previous": None,
+                "next": None,
+                "results": [{"url": STATUSTYPE, "zaaktype": ZAAKTYPE, "volgnummer": 2}],
+            },
+        )
+        m.post(f"{ZRC_URL}statussen", status_code=201, json={"url": STATUS})
+
+        with patch(
+            "bptl.camunda.tasks.task_execute_and_complete_many.apply_async"
+        ) as m_apply_async:
+            dispatch(tasks)
+        m_apply_async.assert_called_once_with(([task.id for task in tasks],))
+        task_execute_and_complete_many(*m_apply_async.call_args.args[0])
+
+        for task in tasks:
+            task.refresh_from_db()
+        self.assertEqual(tasks[0].result_variables, {"statusUrl": STATUS})
+        self.assertEqual(tasks[1].status, Statuses.failed)
+        statustypen_requests = [
+            request
+            for request in m.request_history
+            if request.url.startswith(f"{ZTC_URL}statustypen")
+        ]
+        self.assertEqual(len(statustypen_requests), 1)
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 
 import requests_mock
@@ -82,9 +83,9 @@ def mock_status_post(m):
 
 def mock_roltype_get(m):
     m.get(
-        f"{ROLTYPE_URL}?zaaktype={ZAAKTYPE}&omschrijvingGeneriek=initiator",
+        f"{ROLTYPE_URL}?zaaktype={ZAAKTYPE}",
         json={
-            "count": 1,
+            "count": 2,
             "next": None,
             "previous": None,
             "results": [
@@ -94,16 +95,6 @@ def mock_roltype_get(m):
                     "zaaktype": ZAAKTYPE,
                     "omschrijvingGeneriek": "initiator",
                 },
-            ],
-        },
-    )
-    m.get(
-        f"{ROLTYPE_URL}?zaaktype={ZAAKTYPE}&omschrijvingGeneriek=behandelaar",
-        json={
-            "count": 1,
-            "next": None,
-            "previous": None,
-            "results": [
                 {
                     "url": ROLTYPE,
                     "omschrijving": "Hoofdbehandelaar",
@@ -159,6 +150,10 @@ class CreateZaakTaskTests(TestCase):
         )
 
     def setUp(self):
+        super().setUp()
+        # the catalogi metadata is cached across tasks
+        cache.clear()
+        self.addCleanup(cache.clear)
         self.fetched_task = ExternalTask.objects.create(
             topic_name="some-topic",
             worker_id="test-worker-id",
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from .views import NotificationCallbackView
+
+app_name = "zgw"
+
+urlpatterns = [
+    path(
+        "notifications/",
+        NotificationCallbackView.as_view(),
+        name="notification-callback",
+    ),
+]
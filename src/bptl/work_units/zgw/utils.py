@@ -1,31 +1,125 @@
+import math
+from collections import deque
+from itertools import islice
+from typing import Iterator
 from urllib.parse import parse_qs, urlparse
 
-from zds_client import Client
+from requests import HTTPError
+from zds_client import Client, ClientError
 
+from bptl.utils.concurrent import parallel
 
-def get_paginated_results(
-    client: Client, resource: str, minimum=None, *args, **kwargs
-) -> list:
-    query_params = kwargs.get("query_params", {})
+# number of pages fetched at the same time
+MAX_PAGE_WORKERS = 4
 
-    results = []
+
+def _get_page_number(url: str) -> int:
+    query = parse_qs(urlparse(url).query)
+    return int(query["page"][0])
+
+
+def _is_not_found(exc: Exception) -> bool:
+    # zds_client raises a ClientError from the HTTPError for 4xx responses
+    if isinstance(exc, ClientError):
+        exc = exc.__cause__
+    return (
+        isinstance(exc, HTTPError)
+        and exc.response is not None
+        and exc.response.status_code == 404
+    )
+
+
+def _list_page(client: Client, resource: str, page: int, *args, **kwargs) -> dict:
+    query_params = {**kwargs.get("query_params", {}), "page": [page]}
+    return client.list(resource, *args, **{**kwargs, "query_params": query_params})
+
+
+def iter_paginated_results(
+    client: Client, resource: str, *args, max_workers=MAX_PAGE_WORKERS, **kwargs
+) -> Iterator[dict]:
+    """
+    Yield the results of all pages of a list operation, in order.
+
+    When the first page reveals the total ``count``, the remaining pages are fetched
+    concurrently by at most ``max_workers`` threads. Only the pages being fetched are
+    held in memory, and no more pages are requested once the caller stops iterating.
+    A page that no longer exists (the result set shrank since the count was
+    determined) ends the results.
+    """
     response = client.list(resource, *args, **kwargs)
+    yield from response["results"]
 
-    results += response["results"]
+    if not response["next"]:
+        return
 
-    if minimum and len(results) >= minimum:
-        return results
+    next_page = _get_page_number(response["next"])
+    page_size = len(response["results"])
+    count = response.get("count")
+    last_page = (
+        next_page - 1 + math.ceil((count - page_size) / page_size)
+        if count and page_size
+        else next_page
+    )
 
-    while response["next"]:
-        next_url = urlparse(response["next"])
-        query = parse_qs(next_url.query)
-        new_page = int(query["page"][0])
-        query_params["page"] = [new_page]
-        kwargs["query_params"] = query_params
-        response = client.list(resource, *args, **kwargs)
-        results += response["results"]
+    # a single remaining page is fetched right away
+    if max_workers > 1 and last_page > next_page:
+        pages = iter(range(next_page, last_page + 1))
+        with parallel(max_workers=max_workers) as executor:
+            pending = deque(
+                executor.submit(_list_page, client, resource, page, *args, **kwargs)
+                for page in islice(pages, max_workers)
+            )
+            try:
+                while pending:
+                    try:
+                        response = pending.popleft().result()
+                    except (HTTPError, ClientError) as exc:
+                        if _is_not_found(exc):
+                            return
+                        raise
+                    page = next(pages, None)
+                    if page is not None:
+                        pending.append(
+                            executor.submit(
+                                _list_page, client, resource, page, *args, **kwargs
+                            )
+                        )
+                    yield from response["results"]
+            finally:
+                for future in pending:
+                    future.cancel()
 
-        if minimum and len(results) >= minimum:
-            return results
+        # the result set may have grown since the count was determined
+        if not response["next"]:
+            return
+        next_page = _get_page_number(response["next"])
+
+    while True:
+        response = _list_page(client, resource, next_page, *args, **kwargs)
+        yield from response["results"]
+        if not response["next"]:
+            return
+        next_page = _get_page_number(response["next"])
 
+
+def get_paginated_results(
+    client: Client, resource: str, minimum=None, *args, **kwargs
+) -> list:
+    """
+    Return the results of all pages of a list operation.
+
+    If ``minimum`` is given, the pages are only fetched until at least ``minimum``
+    results are collected.
+    """
+    if minimum:
+        # don't fetch pages ahead that may not be needed
+        kwargs.setdefault("max_workers", 1)
+
+    results = []
+    pages = iter_paginated_results(client, resource, *args, **kwargs)
+    for result in pages:
+        results.append(result)
+        if minimum and len(results) >= minimum:
+            break
+    pages.close()
     return results
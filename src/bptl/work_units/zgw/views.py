@@ -0,0 +1,41 @@
+import logging
+
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..authentication import WebhookAuthentication
+from .invalidation import handle_notification
+from .models import NotificationsConfig
+from .serializers import NotificationSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationsAuthentication(WebhookAuthentication):
+    config_class = NotificationsConfig
+    application_name = "notificaties"
+
+
+class NotificationCallbackView(APIView):
+    """
+    Receive the notifications of the Notificaties API to invalidate cached resources.
+    """
+
+    swagger_schema = None
+
+    authentication_classes = (NotificationsAuthentication,)
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request, format=None):
+        serializer = NotificationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        urls = handle_notification(serializer.validated_data)
+        logger.info(
+            "Invalidated %d cached resource(s) for a notification of kanaal '%s'",
+            len(urls),
+            serializer.validated_data["kanaal"],
+        )
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -9,12 +9,12 @@ from celery_once import QueueOnce
 from requests.exceptions import HTTPError
 from rest_framework import exceptions
 from zds_client import ClientError
-from zgw_consumers.concurrent import parallel
 from zgw_consumers.constants import APITypes
 
 from bptl.celery import app
 from bptl.tasks.base import MissingVariable, WorkUnit, check_variable
 from bptl.tasks.registry import register
+from bptl.utils.concurrent import parallel
 from bptl.work_units.mail.mail import build_email_messages, create_email
 from bptl.work_units.zgw.tasks.base import ZGWWorkUnit, require_zrc
 from bptl.work_units.zgw.zac.utils import (